@@ -44,6 +44,8 @@ class EventHandler:
             match event.type:
                 case pg.QUIT:
                     self.close_game()
+                case pg.VIDEORESIZE:
+                    self.game.main_menu.surface_cache.request_resize(event.size)
 
             # main_menu events
             match self.game.main_menu.menu_player.status:
@@ -120,14 +122,13 @@ class Game:
                     self.main_menu.run_menu()
                 case State.GAME:
                     self.game_process.level.run(dt)
-                    self.screen.blit(self.game_process.level.game_canvas, (
-                        self.game_process.level.player.keyboard_input.camera_x,
-                        self.game_process.level.player.keyboard_input.camera_y
-                    ))  # todo ref
 
             self.__event_handler.event_loop()
             # debug(self.level.player.status, 1000, 20)
-            pg.display.update()
+            if self.state == State.MAIN_MENU and self.main_menu.menu_player.dirty_rects is not None:
+                pg.display.update(self.main_menu.menu_player.dirty_rects)
+            else:
+                pg.display.update()
             self.clock.tick(self.main_menu.fps or self.game_process.fps)
 
 
@@ -0,0 +1,150 @@
+from typing import Optional
+
+import numpy as np
+from pygame import Rect, Surface
+
+from crygeen.game_process.spritesheet import SpriteSheet
+
+
+class Animator:
+    """
+    Shared animation system of all animated entities of a sprite sheet.
+
+    The animation state of every entity lives in parallel NumPy arrays: animation id,
+    frame index, speed, flip flag and world position. One update advances all of them in
+    a single array operation, and the draw list of everything visible comes out of one
+    pass as (surface, rect) pairs for Surface.blits, so the cost per frame barely grows
+    with the number of entities. Entities only keep their slot.
+
+    The frames of all animations are kept in one flat table, the mirrored frames of the
+    sprite sheet after the originals, so the frame of an entity sits at the first frame of
+    its animation + frame index + flip * number of frames.
+    """
+
+    def __init__(self, sprite_sheet: SpriteSheet, capacity: int = 64) -> None:
+        self.sprite_sheet: SpriteSheet = sprite_sheet
+
+        # frame table
+        frames: list[Surface] = [frame for animation in sprite_sheet.frames for frame in animation]
+        self.__frame_count: int = len(frames)
+        self._frames: list[Surface] = frames + [
+            frame for animation in sprite_sheet.mirrored_frames for frame in animation
+        ]
+        self._sizes: list[tuple[int, int]] = [frame.get_size() for frame in self._frames]
+        self._width: np.ndarray = np.array([width for width, _ in self._sizes], np.int64)
+        self._height: np.ndarray = np.array([height for _, height in self._sizes], np.int64)
+        self._lens: np.ndarray = np.array(sprite_sheet.animation_lens, np.int64)
+        self._first: np.ndarray = np.cumsum(self._lens) - self._lens
+
+        # entity data
+        self._animation: np.ndarray = np.zeros(capacity, np.int64)
+        self._frame: np.ndarray = np.zeros(capacity, np.float32)
+        self._speed: np.ndarray = np.zeros(capacity, np.float32)
+        self._flip: np.ndarray = np.zeros(capacity, bool)
+        self._alive: np.ndarray = np.zeros(capacity, bool)
+        self._x: np.ndarray = np.zeros(capacity, np.int64)
+        self._y: np.ndarray = np.zeros(capacity, np.int64)
+        self._count: int = 0
+        self.__free: list[int] = []
+
+    def __grow(self) -> None:
+        for name in ('_animation', '_frame', '_speed', '_flip', '_alive', '_x', '_y'):
+            array: np.ndarray = getattr(self, name)
+            setattr(self, name, np.concatenate((array, np.zeros_like(array))))
+
+    def add(
+            self,
+            animation_id: int,
+            speed: float,
+            center: tuple[int, int] = (0, 0),
+            flip: bool = False
+    ) -> int:
+        """
+        :param animation_id: Animation of the sprite sheet to start with
+        :param speed: Frames per second
+        :param center: World position of the center of the entity
+        :param flip: Mirror the frames horizontally
+        :return: Slot of the entity
+        """
+        if self.__free:
+            slot: int = self.__free.pop()
+        else:
+            if self._count == len(self._alive):
+                self.__grow()
+            slot: int = self._count
+            self._count += 1
+
+        self._animation[slot] = animation_id
+        self._frame[slot] = 0
+        self._speed[slot] = speed
+        self._flip[slot] = flip
+        self._alive[slot] = True
+        self._x[slot], self._y[slot] = center
+        return slot
+
+    def remove(self, slot: int) -> None:
+        self._alive[slot] = False
+        self._speed[slot] = 0
+        self.__free.append(slot)
+
+    def __len__(self) -> int:
+        return self._count - len(self.__free)
+
+    def set_animation(self, slot: int, animation_id: int) -> None:
+        self._animation[slot] = animation_id
+        if self._frame[slot] >= self._lens[animation_id]:
+            self._frame[slot] = 0
+
+    def set_position(self, slot: int, center: tuple[int, int]) -> None:
+        self._x[slot], self._y[slot] = center
+
+    def set_flip(self, slot: int, flip: bool) -> None:
+        self._flip[slot] = flip
+
+    def update(self, dt: float) -> None:
+        """
+        Advance every animation, an animation past its last frame starts over.
+        :param dt: Time between current and last frame
+        :return: None
+        """
+        frame: np.ndarray = self._frame[:self._count]
+        frame += self._speed[:self._count] * dt
+        frame[frame >= self._lens[self._animation[:self._count]]] = 0
+
+    def __frame_indices(self, slots: np.ndarray) -> np.ndarray:
+        return self._first[self._animation[slots]] + self._frame[slots].astype(np.int64) + \
+            self._flip[slots] * self.__frame_count
+
+    def get_frame(self, slot: int) -> Surface:
+        return self._frames[
+            int(self._first[self._animation[slot]]) + int(self._frame[slot]) + int(self._flip[slot]) * self.__frame_count
+        ]
+
+    def get_draw_list(self, view_rect: Optional[Rect] = None) -> list[tuple[Surface, Rect]]:
+        """
+        Frames and screen rects of all entities inside the view, back to front (by bottom).
+        :param view_rect: Visible part of the world, everything at world positions if None
+        :return: (surface, rect) pairs for Surface.blits
+        """
+        slots: np.ndarray = np.flatnonzero(self._alive[:self._count])
+        index: np.ndarray = self.__frame_indices(slots)
+        left: np.ndarray = self._x[slots] - self._width[index] // 2
+        top: np.ndarray = self._y[slots] - self._height[index] // 2
+        right: np.ndarray = left + self._width[index]
+        bottom: np.ndarray = top + self._height[index]
+
+        offset: tuple[int, int] = (0, 0)
+        if view_rect is not None:
+            visible: np.ndarray = \
+                (right > view_rect.left) & (left < view_rect.right) & (bottom > view_rect.top) & (top < view_rect.bottom)
+            index, left, top, bottom = index[visible], left[visible], top[visible], bottom[visible]
+            offset: tuple[int, int] = view_rect.topleft
+
+        order: np.ndarray = np.argsort(bottom, kind='stable')
+        return [
+            (self._frames[i], Rect((x - offset[0], y - offset[1]), self._sizes[i]))
+            for i, x, y in zip(index[order].tolist(), left[order].tolist(), top[order].tolist())
+        ]
+
+    def render(self, surf: Surface, camera) -> None:  # type: (Surface, 'Camera') -> None
+        surf.blits(self.get_draw_list(camera.view_rect), doreturn=False)
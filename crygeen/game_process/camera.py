@@ -0,0 +1,39 @@
+import pygame as pg
+from pygame import Rect, Surface, Vector2
+
+
+class Camera:
+    """
+    Visible part of the game world.
+
+    Everything in the level lives in world coordinates. The camera keeps the offset of the
+    screen in the world, so each renderer can skip whatever lies outside view_rect and draw
+    the rest straight to the screen at world position minus offset. The frame cost then
+    depends on the screen size, not on the size of the world.
+    """
+
+    def __init__(self, surface: Surface) -> None:
+        self.surface: Surface = surface
+        self.offset: Vector2 = pg.math.Vector2()
+
+    @property
+    def view_rect(self) -> Rect:
+        return Rect((int(self.offset.x), int(self.offset.y)), self.surface.get_size())
+
+    def follow(self, target: Rect) -> None:
+        """
+        Center the view on the target.
+        :param target: World rect of the followed object.
+        :return: None
+        """
+        self.offset.x = target.centerx - self.surface.get_width() // 2
+        self.offset.y = target.centery - self.surface.get_height() // 2
+
+    def is_visible(self, rect: Rect) -> bool:
+        return self.view_rect.colliderect(rect)
+
+    def to_screen(self, position: tuple[float, float] | Vector2) -> tuple[float, float]:
+        return position[0] - int(self.offset.x), position[1] - int(self.offset.y)
+
+    def apply(self, rect: Rect) -> Rect:
+        return rect.move(-int(self.offset.x), -int(self.offset.y))
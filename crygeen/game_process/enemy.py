@@ -1,5 +1,5 @@
 import pygame as pg
-from pygame import Vector2
+from pygame import Surface, Vector2
 
 
 class Enemy(pg.sprite.Sprite):
@@ -12,7 +12,8 @@ class Enemy(pg.sprite.Sprite):
         self.player = player
         self.particle_player = particle_player
 
-    def render(self, surf) -> None:
+    def render(self, surf, camera):  # type: (Surface, 'Camera') -> None
         if self.player.rect.colliderect(self.rect):
             self.particle_player.update(self.position)
-        pg.draw.rect(surf, (255, 255, 255), self.rect)
+        if camera.is_visible(self.rect):
+            pg.draw.rect(surf, (255, 255, 255), camera.apply(self.rect))
@@ -9,9 +9,8 @@ from pygame import QUIT, KEYDOWN, KEYUP, Surface, MOUSEBUTTONDOWN, MOUSEWHEEL
 
 class GameProcessSetup:
     def __init__(self):
-        self.game_canvas: Surface = pg.Surface(
-            (gSettings.GAME_CANVAS_WIDTH, gSettings.GAME_CANVAS_HEIGHT)
-        )
+        # the level renders straight to the screen, the camera decides what is visible
+        self.game_canvas: Surface = pg.display.get_surface()
         self.fps: int = gSettings.GAME_FPS
 
         self.sprite_sheet: SpriteSheet = SpriteSheet(
@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from typing import Optional
 
 from pydantic import BaseSettings
 
@@ -7,10 +8,9 @@ from crygeen.settings import settings
 
 
 class GameSettings(BaseSettings):
-    GAME_CANVAS_WIDTH: int = 1280
-    GAME_CANVAS_HEIGHT: int = 760
     GAME_FPS: int = 60
     PNG_BG: tuple = (0, 0, 0)
+    GROUND_COLOR: tuple[int, int, int] = (27, 66, 52)
 
     PLAYER_SPRITE_SHEET_PATH: Path = settings.BASE_PATH.joinpath('assets', 'graphics', 'player', 'ork.png')
     PLAYER_SPRITE_METADATA_PATH: Path = settings.BASE_PATH.joinpath('assets', 'graphics', 'player', 'ork.json')
@@ -21,6 +21,8 @@ class GameSettings(BaseSettings):
     PLAYER_SPURT_DURATION: int = 300
     PLAYER_ATTACK_CD: int = 700
 
+    COLLISION_CELL_SIZE: int = 64  # cell side of the obstacle spatial hashes in pixels
+
     GRASS_PATH: Path = settings.BASE_PATH.joinpath('assets', 'graphics', 'grass')
     # GRASS_PATH: str = '/Users/harlok/PycharmProjects/Crygeen/crygeen/assets/graphics/grass'  # TODO: ref hardcode
     GRASS_TILE_SIZE: int = 10
@@ -30,6 +32,40 @@ class GameSettings(BaseSettings):
     GRASS_PLACE_RANGE: list[int, int] = [0, 1]
     GRASS_PADDING: int = 13
     GRASS_ROTATION_SPEED: float = 100
+    GRASS_WIND_AMPLITUDE: float = 15
+    GRASS_WIND_WAVELENGTH: float = 100
+    GRASS_WIND_PERIOD: float = 60
+    GRASS_WIND_GUST_STRENGTH: float = 0  # 0 - no gusts
+    GRASS_WIND_GUST_WAVELENGTH: float = 700
+    GRASS_WIND_GUST_PERIOD: float = 230
+    GRASS_WIND_NOISE_STRENGTH: float = 0  # 0 - no noise
+    GRASS_WIND_NOISE_SCALE: float = 40
+    # field generation, a CSV of blade counts per tile or a random field of GRASS_FIELD_SIZE tiles
+    GRASS_SEED: int = 0
+    GRASS_FIELD_PATH: Optional[Path] = None
+    GRASS_FIELD_ORIGIN: tuple[int, int] = (5, 5)
+    GRASS_FIELD_SIZE: tuple[int, int] = (100, 25)
+    GRASS_MAX_DENSITY: int = 12
+    GRASS_OPTIONS: list[int] = [0, 1, 2, 3, 4]
+    GRASS_DISK_CACHE: bool = True  # keep rendered tile images between launches
+    GRASS_CACHE_PATH: Path = settings.CACHE_PATH.joinpath('grass')
+    GRASS_PREWARM: bool = True  # render all tile and chunk images of the wind range on level load
+    GRASS_PLAYER_FORCE: tuple[float, float] = (15, 25)  # radius, drop off
+    GRASS_ENEMY_FORCE: tuple[float, float] = (25, 20)
+    GRASS_PHYSICS: str = 'numpy'  # 'numpy' | 'python'
+    GRASS_BLADE_ANGLE_STEP: float = 1  # degrees between the pre-rotated blade images
+    GRASS_CHUNK_SIZE: int = 16  # tiles per chunk side, 0 - render every tile on its own
+    GRASS_CHUNK_ROTATION_STEP: int = 2
+    # level of detail of chunks: distances from the view center, then per level (from the second one)
+    # every n-th blade and the multiplier of the rotation step, time budget of the grass in ms (0 - off)
+    GRASS_LOD_DISTANCES: list[int] = [500, 900]
+    GRASS_LOD_BLADE_STRIDES: list[int] = [1, 2, 3]
+    GRASS_LOD_ROTATION_STEPS: list[int] = [1, 2, 4]
+    GRASS_LOD_TIME_BUDGET: float = 6
+    # memory budgets of the grass image caches in bytes, least recently used images are dropped first
+    GRASS_CACHE_BUDGET: int = 32 * 1024 ** 2
+    GRASS_SHADOW_CACHE_BUDGET: int = 8 * 1024 ** 2
+    GRASS_CHUNK_CACHE_BUDGET: int = 96 * 1024 ** 2
     # shadows
     GRASS_SHADOW_STRENGTH: int = 40
     GRASS_SHADOW_RADIUS: int = 2
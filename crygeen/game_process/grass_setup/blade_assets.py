@@ -1,8 +1,12 @@
 import os
 from pathlib import Path
+from typing import Iterable
 
 import pygame as pg
-from pygame import Surface
+from pygame import Rect, Surface
+
+from crygeen.game_process.game_settings import gSettings
+from crygeen.utils.texture_atlas import TextureAtlas
 
 
 class BladeAssets:
@@ -24,18 +28,55 @@ class BladeAssets:
             img.set_colorkey((0, 0, 0))
             self.blades.append(img)
 
-    def render_blade(self, surf: Surface, blade_id: int, location: tuple[float, float], rotation: int) -> None:
-        # rotate the blade
-        rot_img: Surface = pg.transform.rotate(self.blades[blade_id], rotation)
+        # pre-rotated and pre-shaded images of every blade, packed into a texture atlas:
+        # [blade_id][angle index] -> (atlas page, area on the page, half size)
+        self.angle_step: float = gSettings.GRASS_BLADE_ANGLE_STEP
+        self.__angle_count: int = round(180 / self.angle_step) + 1
+        angles: list[list[tuple[Surface, tuple[int, int]]]] = [self.__render_angles(img) for img in self.blades]
+        self.texture_atlas: TextureAtlas = TextureAtlas.pack(
+            {f'{blade_id}_{index}': img for blade_id, images in enumerate(angles) for index, (img, _) in enumerate(images)},
+            colorkey=(0, 0, 0)
+        )
+        self.atlas: list[list[tuple[Surface, Rect, tuple[int, int]]]] = [
+            [(*self.texture_atlas.area(f'{blade_id}_{index}'), half_size) for index, (_, half_size) in enumerate(images)]
+            for blade_id, images in enumerate(angles)
+        ]
 
-        # shade the blade of grass based on its rotation
-        shade: Surface = pg.Surface(rot_img.get_size())
-        shade_amount: float = self.grass_manager.shade_amount * (abs(rotation) / 90)
-        shade.set_alpha(shade_amount)  # noqa
-        rot_img.blit(shade, (0, 0))
+    def __render_angles(self, img: Surface) -> list[tuple[Surface, tuple[int, int]]]:
+        angles: list[tuple[Surface, tuple[int, int]]] = []
+        for index in range(self.__angle_count):
+            rotation: float = min(90.0, index * self.angle_step - 90)
 
-        # render the blade
-        half_width, half_height = rot_img.get_width() // 2, rot_img.get_height() // 2
-        surf.blit(rot_img, (location[0] - half_width, location[1] - half_height))
+            # rotate the blade
+            rot_img: Surface = pg.transform.rotate(img, rotation)
+
+            # shade the blade of grass based on its rotation
+            shade: Surface = pg.Surface(rot_img.get_size())
+            shade_amount: float = self.grass_manager.shade_amount * (abs(rotation) / 90)
+            shade.set_alpha(shade_amount)  # noqa
+            rot_img.blit(shade, (0, 0))
 
+            angles.append((rot_img, (rot_img.get_width() // 2, rot_img.get_height() // 2)))
+        return angles
+
+    def render_blade(self, surf: Surface, blade_id: int, location: tuple[float, float], rotation: int) -> None:
+        # look up the image closest to the rotation
+        index: int = round((max(-90, min(90, rotation)) + 90) / self.angle_step)
+        page, area, (half_width, half_height) = self.atlas[blade_id][index]
+
+        # render the blade
+        surf.blit(page, (location[0] - half_width, location[1] - half_height), area)
 
+    def render_blades(self, surf: Surface, blades: Iterable[tuple[int, tuple[float, float], float]]) -> None:
+        """
+        Batched render_blade, all blades go to the surface in one Surface.blits call.
+        :param surf: Surface to render on
+        :param blades: Blade id, location and rotation of every blade
+        :return: None
+        """
+        blit_sequence: list[tuple[Surface, tuple[float, float], Rect]] = []
+        for blade_id, location, rotation in blades:
+            page, area, (half_width, half_height) = \
+                self.atlas[blade_id][round((max(-90, min(90, rotation)) + 90) / self.angle_step)]
+            blit_sequence.append((page, (location[0] - half_width, location[1] - half_height), area))
+        surf.blits(blit_sequence, doreturn=False)
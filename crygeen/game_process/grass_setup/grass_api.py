@@ -1,35 +1,80 @@
 import random
-import math
-from typing import Callable
+from typing import Optional
 
 from pygame import Surface
 
 from crygeen.game_process.game_settings import gSettings
-from crygeen.game_process.grass_setup.grass_manager import GrassManager
+from crygeen.game_process.grass_setup.grass_disk_cache import GrassDiskCache
+from crygeen.game_process.grass_setup.grass_manager import GrassForce, GrassManager
+from crygeen.game_process.grass_setup.wind import Wind
+from crygeen.utils.support import import_csv_layout
 
 
 class Grass:
     def __init__(self) -> None:
         self.__grass_manager: GrassManager = GrassManager(gSettings.GRASS_PATH)
         self.__grass_manager.enable_ground_shadows()
-        self.__rotation_speed: float = gSettings.GRASS_ROTATION_SPEED
+        self.__wind: Wind = Wind(gSettings.GRASS_SEED)
 
-        self._t: float = 0
+        self.place_grass()
+        self.__prepare_cache()
 
-    def place_grass(self) -> None:
-        for y in range(25):
-            y += 5
-            for x in range(100):
-                x += 5
-                v = random.random()
-                if v > 0.1:
-                    self.__grass_manager.place_tile((x, y), int(v * 12), [0, 1, 2, 3, 4])
+    def __prepare_cache(self) -> None:
+        """
+        Load the tile images rendered on an earlier launch, prewarm whatever is missing
+        and store the result if nothing could be loaded. After a load the chunks are not
+        prewarmed, they are composited from the loaded tiles on their first render.
+        :return: None
+        """
+        disk_cache: Optional[GrassDiskCache] = None
+        loaded: bool = False
+        if gSettings.GRASS_DISK_CACHE:
+            disk_cache = GrassDiskCache(gSettings.GRASS_CACHE_PATH, self.__grass_manager)
+            loaded = disk_cache.load()
 
-    def render(self, dt: float, screen: Surface, player) -> None:
-        self.__grass_manager.apply_force(player.rect.center, 15, 25)
+        if gSettings.GRASS_PREWARM:
+            for _ in self.__grass_manager.prewarm(self.__wind, chunks=not loaded):
+                pass
 
-        rot_function: Callable = lambda x, y: int(math.sin(self._t / 60 + x / 100) * 15)  # TODO: reloc to settings
+        if disk_cache and not loaded:
+            disk_cache.save()
 
-        self.__grass_manager.update_render(screen, dt, rot_function=rot_function)
-        self._t += dt * self.__rotation_speed
-        self.place_grass()
+    @staticmethod
+    def random_density_map(size: tuple[int, int], max_density: int, seed: int) -> list[list[int]]:
+        """
+        Procedural field: every tile gets a random amount of blades, about every tenth stays empty.
+        :param size: Field size in tiles
+        :param max_density: Maximum blade count of a tile
+        :param seed: Seed of the field
+        :return: Blade count of every tile
+        """
+        rng: random.Random = random.Random(seed)
+        density_map: list[list[int]] = []
+        for _ in range(size[1]):
+            row: list[int] = []
+            for _ in range(size[0]):
+                v: float = rng.random()
+                row.append(int(v * max_density) if v > 0.1 else 0)
+            density_map.append(row)
+        return density_map
+
+    def place_grass(self) -> None:
+        """
+        Generate the grass field once, from GRASS_FIELD_PATH if set, procedurally otherwise.
+        :return: None
+        """
+        if gSettings.GRASS_FIELD_PATH:
+            density_map: list[list] = import_csv_layout(gSettings.GRASS_FIELD_PATH)
+        else:
+            density_map: list[list] = self.random_density_map(
+                gSettings.GRASS_FIELD_SIZE, gSettings.GRASS_MAX_DENSITY, gSettings.GRASS_SEED
+            )
+        self.__grass_manager.place_field(
+            density_map, gSettings.GRASS_OPTIONS, gSettings.GRASS_SEED, gSettings.GRASS_FIELD_ORIGIN
+        )
+
+    def render(self, dt, screen, camera, forces):  # type: (float, Surface, 'Camera', list[GrassForce]) -> None
+        self.__grass_manager.apply_forces(forces)
+
+        self.__grass_manager.update_render(screen, dt, offset=camera.view_rect.topleft, wind=self.__wind)
+        self.__wind.update(dt)
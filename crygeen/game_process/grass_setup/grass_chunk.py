@@ -0,0 +1,152 @@
+from typing import Iterable, Optional
+
+import numpy as np
+import pygame as pg
+from pygame import Surface
+
+from crygeen.game_process.grass_setup.grass_tile import GrassTile
+
+
+class GrassChunk:
+    """
+    A square group of grass tiles rendered as one surface.
+
+    The whole chunk shares one wind rotation, and the composited image of every rotation
+    that occurred is kept in a cache, so a calm chunk costs a single blit. The ground
+    shadows of a chunk never move and are baked into its ground once. As soon as
+    one of the tiles is disturbed by a force, the chunk falls back to per-tile rendering
+    until all of its blades are back in their base position.
+    """
+
+    def __init__(
+            self,
+            location: tuple[int, int],
+            chunk_size: int,
+            grass_manager  # type: 'GrassManager'
+    ) -> None:
+        """
+
+        :param location: Pixel coordinates of the top left corner of the chunk
+        :param chunk_size: Size of the chunk in pixels
+        :param grass_manager: Grass manipulation class
+        """
+        self._grass_manager = grass_manager  # type: 'GrassManager'
+
+        self.loc: tuple[int, int] = location
+        self.center: tuple[int, int] = (location[0] + chunk_size // 2, location[1] + chunk_size // 2)
+        self._padding: int = self._grass_manager.padding
+        self._chunk_size: int = chunk_size
+        self._size: tuple[int, int] = (chunk_size + self._padding * 2, chunk_size + self._padding * 2)
+        self._rotation: int = 0
+        self._version: int = 0  # part of the cache key, bumped when the tiles change
+
+        # tile data, kept in render order (back to front)
+        self._tiles: list[GrassTile] = []
+        self._physics_slots: Optional[np.ndarray] = None
+
+        # caching, the composited images live in GrassManager.chunk_cache
+        self._ground: Optional[Surface] = None
+
+    def add_tile(self, tile: GrassTile) -> None:
+        self._tiles.append(tile)
+        self._tiles.sort(key=lambda t: (t.loc[1], t.loc[0]))
+        self._physics_slots = None
+        self._version += 1
+        self.reset_ground()
+
+    @property
+    def tiles(self) -> list[GrassTile]:
+        return self._tiles
+
+    @property
+    def disturbed(self) -> bool:
+        if self._grass_manager.physics:
+            if self._physics_slots is None:
+                self._physics_slots = np.array([tile.physics_slot for tile in self._tiles], np.int64)
+            return self._grass_manager.physics.any_disturbed(self._physics_slots)
+        return any(tile.disturbed for tile in self._tiles)
+
+    @property
+    def rotation(self) -> int:
+        return self._rotation
+
+    def set_rotation(self, rotation: int) -> None:
+        if rotation != self._rotation:
+            self._rotation: int = rotation
+            for tile in self._tiles:
+                tile.set_rotation(rotation)
+
+    def __new_surface(self) -> Surface:
+        surf: Surface = pg.Surface(self._size)
+        surf.set_colorkey((0, 0, 0))
+        return surf
+
+    def __render_chunk(self, lod: int) -> Surface:
+        surf: Surface = self.__new_surface()
+        surf.blits(
+            [
+                (tile.get_cached_image(lod, cache_shadow=False), (tile.loc[0] - self.loc[0], tile.loc[1] - self.loc[1]))
+                for tile in self._tiles
+            ],
+            doreturn=False
+        )
+        return surf
+
+    def bake_ground(self, tiles: Iterable[GrassTile]) -> None:
+        """
+        Bake the ground under the chunk: the ground color with the shadows of all blades on
+        it. Shadows never move, so this happens once and the ground costs a single opaque
+        blit per frame instead of a shadow pass.
+        :param tiles: Tiles of the chunk and its neighbours, their shadows may reach into it.
+        :return: None
+        """
+        radius, color, strength, shift = self._grass_manager.ground_shadow
+        shadow: Surface = pg.Surface((self._chunk_size, self._chunk_size))
+        shadow.set_colorkey((0, 0, 0))
+        for tile in tiles:
+            for blade in tile.blades:
+                pg.draw.circle(
+                    shadow,
+                    color,
+                    (tile.loc[0] + blade[0][0] + shift[0] - self.loc[0], tile.loc[1] + blade[0][1] + shift[1] - self.loc[1]),
+                    radius
+                )
+        shadow.set_alpha(strength)
+
+        self._ground = pg.Surface((self._chunk_size, self._chunk_size))
+        self._ground.fill(self._grass_manager.ground_color)
+        self._ground.blit(shadow, (0, 0))
+
+    @property
+    def ground_baked(self) -> bool:
+        return self._ground is not None
+
+    def reset_ground(self) -> None:
+        self._ground = None
+
+    def render_ground(self, surf: Surface, offset: tuple[int, int] = (0, 0)) -> None:
+        surf.blit(self._ground, (self.loc[0] - offset[0], self.loc[1] - offset[1]))
+
+    def get_cached_image(self, lod: int = 0) -> Surface:
+        cache_key: tuple[tuple[int, int], int, int, int] = (self.loc, self._version, self._rotation, lod)
+        chunk_img: Optional[Surface] = self._grass_manager.chunk_cache.get(cache_key)
+        if chunk_img is None:
+            chunk_img: Surface = self.__render_chunk(lod)
+            self._grass_manager.chunk_cache[cache_key] = chunk_img
+        return chunk_img
+
+    def render(self, surf: Surface, dt: float, offset: tuple[int, int], lod: int = 0) -> None:
+        """
+        :param surf: Surface on which to draw the chunk
+        :param dt: Time between current and last frame
+        :param offset: Camera's offset
+        :param lod: Level of detail, only the full detail level shows blades bent by forces
+        :return: None
+        """
+        if not lod and self.disturbed:
+            for tile in self._tiles:
+                tile.render(surf, dt, offset=offset, cache_shadow=False)
+            return
+
+        chunk_img: Surface = self.get_cached_image(lod)
+        surf.blit(chunk_img, (self.loc[0] - offset[0] - self._padding, self.loc[1] - offset[1] - self._padding))
@@ -0,0 +1,115 @@
+import hashlib
+import json
+import math
+from pathlib import Path
+from typing import Hashable
+
+import pygame as pg
+from pygame import Surface
+
+from crygeen.game_process.grass_setup.grass_tile import GrassTile
+
+
+class GrassDiskCache:
+    """
+    Rendered grass tile images and shadows stored on disk between launches.
+
+    The images only depend on the blade PNGs, the render settings of the GrassManager and
+    the blade layouts of the unique tiles, so a hash of exactly these inputs names the
+    cache files. Any change of the inputs yields another name, which is how the cache is
+    invalidated: a missing file is a miss, and saving removes the files of older hashes.
+
+    One cache is an atlas PNG with all images in a grid plus a JSON index of where each
+    cache entry sits in it.
+
+    Chunk images are not stored: a chunk is composited from the cached tile images faster
+    than its PNG decodes, and all chunk variants together would make the atlas several
+    times larger than the tiles. After a load, prewarm(chunks=False) skips them.
+    """
+
+    def __init__(
+            self,
+            path: Path,
+            grass_manager  # type: 'GrassManager'
+    ) -> None:
+        """
+
+        :param path: Folder of the cache files
+        :param grass_manager: Grass manipulation class
+        """
+        self._grass_manager = grass_manager  # type: 'GrassManager'
+        self.path: Path = path
+
+        self.key: str = self.__hash_inputs()
+        self.atlas_path: Path = self.path.joinpath(f'grass_{self.key}.png')
+        self.index_path: Path = self.path.joinpath(f'grass_{self.key}.json')
+
+    def __hash_inputs(self) -> str:
+        digest = hashlib.sha1()
+        for blade_path in sorted(self._grass_manager.grass_path.iterdir()):
+            digest.update(blade_path.name.encode())
+            digest.update(blade_path.read_bytes())
+
+        digest.update(repr(self._grass_manager.render_config).encode())
+        unique_tiles: dict[int, GrassTile] = self._grass_manager.unique_tiles
+        for base_id in sorted(unique_tiles):
+            digest.update(repr((base_id, unique_tiles[base_id].blades)).encode())
+        return digest.hexdigest()[:16]
+
+    def load(self) -> bool:
+        """
+        Fill the grass and shadow caches of the manager from disk.
+        :return: False if there is no cache for the current inputs.
+        """
+        if not self.atlas_path.exists() or not self.index_path.exists():
+            return False
+
+        try:
+            index: dict = json.loads(self.index_path.read_text())
+            atlas: Surface = pg.image.load(self.atlas_path).convert()
+        except (OSError, ValueError, pg.error):
+            return False
+
+        shadow_alpha: int = self._grass_manager.ground_shadow[2]
+        for kind, key, rect in index['entries']:
+            image: Surface = atlas.subsurface(rect).copy()
+            image.set_colorkey((0, 0, 0))
+            if kind == 'grass':
+                self._grass_manager.grass_cache[tuple(key)] = image
+            else:
+                image.set_alpha(shadow_alpha)
+                self._grass_manager.shadow_cache[key] = image
+        return True
+
+    def save(self) -> int:
+        """
+        Write the current grass and shadow caches of the manager into a new atlas and
+        remove the caches of other inputs.
+        :return: Number of saved images.
+        """
+        images: list[tuple[str, Hashable, Surface]] = \
+            [('grass', key, image) for key, image in self._grass_manager.grass_cache.items()] + \
+            [('shadow', key, image) for key, image in self._grass_manager.shadow_cache.items()]
+        if not images:
+            return 0
+
+        cell_width: int = max(image.get_width() for _, _, image in images)
+        cell_height: int = max(image.get_height() for _, _, image in images)
+        columns: int = math.ceil(math.sqrt(len(images)))
+        atlas: Surface = pg.Surface((columns * cell_width, math.ceil(len(images) / columns) * cell_height))
+
+        entries: list[tuple[str, Hashable, tuple[int, int, int, int]]] = []
+        for number, (kind, key, image) in enumerate(images):
+            position: tuple[int, int] = (number % columns * cell_width, number // columns * cell_height)
+            alpha = image.get_alpha()
+            image.set_alpha(None)  # store the pixels, not the blend
+            atlas.blit(image, position)
+            image.set_alpha(alpha)
+            entries.append((kind, key, (*position, *image.get_size())))
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        for old_path in self.path.glob('grass_*'):
+            old_path.unlink()
+        pg.image.save(atlas, self.atlas_path)
+        self.index_path.write_text(json.dumps({'key': self.key, 'entries': entries}))
+        return len(images)
@@ -1,14 +1,27 @@
+import bisect
 import math
 import random
-from copy import deepcopy
+import time
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional, Sequence
 
+import numpy as np
+import pygame as pg
 from pygame import Surface
 
 from crygeen.game_process.game_settings import gSettings
 from crygeen.game_process.grass_setup.blade_assets import BladeAssets
+from crygeen.game_process.grass_setup.grass_chunk import GrassChunk
+from crygeen.game_process.grass_setup.grass_physics import GrassPhysics
 from crygeen.game_process.grass_setup.grass_tile import GrassTile
+from crygeen.game_process.grass_setup.wind import Wind
+from crygeen.utils.surface_cache import CacheStats, LRUSurfaceCache
+
+
+class GrassForce(NamedTuple):
+    location: tuple[int, int]  # where the force is applied
+    radius: float  # the range at which the grass is fully bent over
+    drop_off: float  # the distance past the radius over which the force eases into nothing
 
 
 class GrassManager:
@@ -40,7 +53,8 @@ class GrassManager:
     (a configuration is the combination of the amount of blades of grass and the possible set of blade
     images that can be used for a tile). If the number is too high, the application will use a
     large amount of RAM to store all the cached tile images. If the number is too low, the same
-    patterns will start to appear.
+    patterns will start to appear. The memory itself is capped by the cache budgets, see cache_stats
+    for how well the cached images are reused.
 
     <place_range>
     This determines the vertical range that the base of the blades can be placed at. The range
@@ -50,19 +64,45 @@ class GrassManager:
     <padding>
     This is the amount of spacial padding the tile images have to fit the blades spilling
     outside the bounds of the tile. Should be installed at the height of the tallest blade.
+
+    <physics>
+    'numpy' keeps all blades in contiguous arrays and applies forces and spring-back to all
+    affected tiles in batched array operations (see GrassPhysics). 'python' runs the
+    physics per tile and per blade.
+
+    <chunk_size>
+    Tiles are grouped into square chunks of this many tiles per side. A chunk is rendered
+    as one pre-composited surface per wind rotation, so a calm field costs one blit per
+    chunk. The wind rotation is sampled at the chunk center and quantized to
+    <chunk_rotation_step>. The ground shadows of a chunk are baked once into an opaque
+    ground surface filled with <ground_color>, which replaces the shadow pass.
+    0 renders every tile on its own.
+
+    <lod>
+    Levels of detail of chunks. A chunk further than the n-th of <lod_distances> from the
+    focus (the view center by default) uses level n + 1: every <lod_blade_strides>[n]-th
+    blade, a rotation step <lod_rotation_steps>[n] times coarser and no bent blades. When
+    rendering the grass takes longer than <lod_time_budget> ms on average, all chunks move
+    one level down until there is time left again. Only used with chunks.
     """
 
     def __init__(self, grass_path: Path) -> None:
-        self._blade_assets: BladeAssets = BladeAssets(grass_path, self)
+        self.grass_path: Path = grass_path
 
         # caching
         self.grass_id: int = 0
-        self.grass_cache: dict[tuple[int, int], Surface] = {}
-        self.shadow_cache: dict[int, Surface] = {}
+        self.grass_cache: LRUSurfaceCache = LRUSurfaceCache(gSettings.GRASS_CACHE_BUDGET)
+        self.shadow_cache: LRUSurfaceCache = LRUSurfaceCache(gSettings.GRASS_SHADOW_CACHE_BUDGET)
+        self.chunk_cache: LRUSurfaceCache = LRUSurfaceCache(gSettings.GRASS_CHUNK_CACHE_BUDGET)
         self._formats: dict = {}  # too complex to paint
 
+        # source of all randomness of the grass, seed it to get the same field every time
+        self.random: random.Random = random.Random()
+
         # tile data
         self._grass_tiles: dict[tuple[int, int], GrassTile] = {}
+        self._chunks: dict[tuple[int, int], GrassChunk] = {}
+        self._disturbed_tiles: set[GrassTile] = set()  # active set of the python physics
 
         # config
         self._tile_size: int = gSettings.GRASS_TILE_SIZE
@@ -71,7 +111,23 @@ class GrassManager:
         self._max_unique: int = gSettings.GRASS_MAX_UNIQUE
         self.vertical_place_range: list[float, float] = gSettings.GRASS_PLACE_RANGE
         self.ground_shadow: list[int, tuple[int, int, int], int, tuple[int, int]] = [0, (0, 0, 0), 100, (0, 0)]
+        self.ground_color: tuple[int, int, int] = gSettings.GROUND_COLOR
         self.padding: int = gSettings.GRASS_PADDING
+        self.physics: Optional[GrassPhysics] = GrassPhysics(self) if gSettings.GRASS_PHYSICS == 'numpy' else None
+        self._chunk_size: int = gSettings.GRASS_CHUNK_SIZE
+        self._chunk_rotation_step: int = max(1, gSettings.GRASS_CHUNK_ROTATION_STEP)
+
+        # level of detail
+        self._lod_distances: list[int] = gSettings.GRASS_LOD_DISTANCES
+        self.lod_blade_strides: list[int] = gSettings.GRASS_LOD_BLADE_STRIDES
+        self._lod_rotation_steps: list[int] = gSettings.GRASS_LOD_ROTATION_STEPS
+        self._lod_time_budget: float = gSettings.GRASS_LOD_TIME_BUDGET
+        self.lod_bias: int = 0
+        self.__render_time: float = 0  # smoothed time of update_render in ms
+        self.__lod_frames: int = 0
+
+        # blade images are pre-rendered with the config above
+        self._blade_assets: BladeAssets = BladeAssets(grass_path, self)
 
     def enable_ground_shadows(
             self,
@@ -97,26 +153,140 @@ class GrassManager:
         self.ground_shadow: list[int, int, tuple[int, int, int], tuple[int, int]] = [
             shadow_radius, shadow_color, shadow_strength, shadow_shift
         ]
+        if self._chunks:
+            self.__bake_ground()
 
     def get_format(
+            self, format_id: tuple[int, tuple[int, ...]]
+    ) -> Optional[tuple[int, tuple[tuple[tuple[float, float], int, float], ...]]]:
+        """
+        Shared blade layout for a new tile once the format has _max_unique variants.
+        The layout is immutable, so it is handed out without copying.
+        :param format_id: Density and blade IDs of the tile
+        :return: ID and blade layout of an existing tile or None if the tile should generate its own
+        """
+        if format_id in self._formats and self._formats[format_id]['count'] >= self._max_unique:
+            return self.random.choice(self._formats[format_id]['data'])
+
+    def add_format(
             self,
             format_id: tuple[int, tuple[int, ...]],
-            data: list[list[tuple[float, float], int, float]],
+            data: tuple[tuple[tuple[float, float], int, float], ...],
             tile_id: int
-    ) -> Optional[tuple[int, list[list[float, int, float]]]]:
-
+    ) -> None:
         if format_id not in self._formats:
-            self._formats[format_id]: dict[str, int | list[tuple[int, list[list[tuple[float, float], int, float]]]]] = {
-                'count': 1,
-                'data': [(tile_id, data)]
+            self._formats[format_id]: dict[str, int | list[tuple[int, tuple]]] = {
+                'count': 0,
+                'data': []
             }
+        self._formats[format_id]['count'] += 1
+        self._formats[format_id]['data'].append((tile_id, data))
 
-        elif self._formats[format_id]['count'] >= self._max_unique:
-            return deepcopy(random.choice(self._formats[format_id]['data']))
+    @property
+    def disturbed_count(self) -> int:
+        return self.physics.disturbed_count if self.physics else len(self._disturbed_tiles)
 
-        else:
-            self._formats[format_id]['count'] += 1
-            self._formats[format_id]['data'].append((tile_id, data))
+    @property
+    def lod_levels(self) -> int:
+        return len(self._lod_distances) + 1 if self._chunk_size else 1
+
+    def __quantize_rotation(self, rotation: float, lod: int) -> int:
+        step: int = self._chunk_rotation_step * self._lod_rotation_steps[min(lod, len(self._lod_rotation_steps) - 1)]
+        return round(rotation / step) * step
+
+    def __get_lod(self, chunk: GrassChunk, focus: tuple[float, float]) -> int:
+        lod: int = bisect.bisect(self._lod_distances, math.dist(chunk.center, focus))
+        return min(lod + self.lod_bias, self.lod_levels - 1)
+
+    def __update_lod_bias(self, render_time: float) -> None:
+        """
+        Move all chunks a level down while the grass takes more than its time budget and
+        back up once there is plenty of time left. Checked every 30 frames to not flicker.
+        :param render_time: Time of the last update_render in ms
+        :return: None
+        """
+        if not self._lod_time_budget:
+            return
+        self.__render_time += (render_time - self.__render_time) * 0.1
+        self.__lod_frames += 1
+        if self.__lod_frames < 30:
+            return
+
+        self.__lod_frames = 0
+        if self.__render_time > self._lod_time_budget:
+            self.lod_bias = min(self.lod_bias + 1, self.lod_levels - 1)
+        elif self.__render_time < self._lod_time_budget / 2:
+            self.lod_bias = max(self.lod_bias - 1, 0)
+
+    @property
+    def unique_tiles(self) -> dict[int, GrassTile]:
+        """One tile of every base_id, tiles sharing a base_id share their images."""
+        unique_tiles: dict[int, GrassTile] = {}
+        for tile in self._grass_tiles.values():
+            unique_tiles.setdefault(tile.base_id, tile)
+        return unique_tiles
+
+    @property
+    def render_config(self) -> tuple:
+        """Everything besides the blade images and layouts that changes how tile images look."""
+        return (
+            self._tile_size, self.shade_amount, self.padding, self.ground_shadow,
+            self._blade_assets.angle_step, tuple(self.lod_blade_strides), pg.display.get_surface().get_bitsize()
+        )
+
+    def cache_stats(self) -> dict[str, CacheStats]:
+        """
+        Hits, misses, evictions and resident bytes of the grass, shadow and chunk caches.
+        A low grass cache hit rate with many evictions means the budget is too small for
+        the amount of unique tiles (GRASS_MAX_UNIQUE) and rotations in use.
+        :return: Stats by cache name.
+        """
+        return {
+            'grass': self.grass_cache.stats,
+            'shadow': self.shadow_cache.stats,
+            'chunk': self.chunk_cache.stats
+        }
+
+    def prewarm(self, wind: Wind, chunks: bool = True) -> Iterator[float]:
+        """
+        Renders every image the wind can ask for ahead of time: each unique tile (base_id)
+        at each rotation in the wind range together with its shadow and, with chunks, each
+        chunk at each quantized rotation (chunks bake the shadows into their ground). It is
+        a generator, so a loading step can spread the work over several frames; exhaust it
+        to prewarm in one go. A layer stops early once its cache starts evicting, since the
+        rest would only push out prewarmed images.
+
+        :param wind: Wind field the grass is rendered with
+        :param chunks: Also composite the chunk images, a chunk is cheap to composite from
+                       cached tile images, so it can be left to the first render
+        :return: Progress from 0 to 1 after every rendered image
+        """
+        rotations: list[int] = list(range(-wind.max_rotation, wind.max_rotation + 1))
+        variants: list[tuple[int, int]] = [(0, rotation) for rotation in rotations]
+        if self._chunk_size:
+            variants: list[tuple[int, int]] = sorted({
+                (lod, self.__quantize_rotation(rotation, lod)) for lod in range(self.lod_levels) for rotation in rotations
+            })
+
+        layers: list[tuple[LRUSurfaceCache, list[GrassTile | GrassChunk], dict]] = [
+            (self.grass_cache, list(self.unique_tiles.values()), {'cache_shadow': not self._chunk_size}),
+            (self.chunk_cache, list(self._chunks.values()) if self._chunk_size and chunks else [], {})
+        ]
+        total: int = sum(len(items) for _, items, _ in layers) * len(variants) or 1
+        done: int = 0
+        for cache, items, kwargs in layers:
+            evictions: int = cache.stats.evictions
+            for item in items:
+                previous_rotation: int = item.rotation
+                for lod, rotation in variants:
+                    item.set_rotation(rotation)
+                    item.get_cached_image(lod, **kwargs)
+                    done += 1
+                    yield done / total
+                item.set_rotation(previous_rotation)
+                if cache.stats.evictions != evictions:
+                    break
+        yield 1.0
 
     def place_tile(self, location: tuple[int, int] | list[int, int], density: int, grass_options: list[int]) -> None:
         """
@@ -142,6 +312,71 @@ class GrassManager:
                 self._blade_assets,
                 self
             )
+            if self.physics:
+                self.physics.add_tile(self._grass_tiles[new_grass_loc])
+
+            if self._chunk_size:
+                chunk_loc: tuple[int, int] = (new_grass_loc[0] // self._chunk_size, new_grass_loc[1] // self._chunk_size)
+                if chunk_loc not in self._chunks:
+                    chunk_px: int = self._chunk_size * self._tile_size
+                    self._chunks[chunk_loc] = GrassChunk((chunk_loc[0] * chunk_px, chunk_loc[1] * chunk_px), chunk_px, self)
+                self._chunks[chunk_loc].add_tile(self._grass_tiles[new_grass_loc])
+
+                # shadows of the new tile may reach into the neighbouring chunks
+                for y in range(chunk_loc[1] - 1, chunk_loc[1] + 2):
+                    for x in range(chunk_loc[0] - 1, chunk_loc[0] + 2):
+                        if (x, y) in self._chunks:
+                            self._chunks[(x, y)].reset_ground()
+
+    def place_field(
+            self,
+            density_map: Sequence[Sequence[int | str]],
+            grass_options: list[int],
+            seed: Optional[int] = None,
+            origin: tuple[int, int] = (0, 0)
+    ) -> int:
+        """
+        Places a whole field of grass in one call, meant to run once when the level loads.
+        density_map is a grid of blade counts per tile, rows top to bottom (as returned by
+        import_csv_layout, so the values may be strings). Cells of 0 or less stay empty.
+        The same seed always produces the same field.
+
+        :param density_map: Blade count of every tile
+        :param grass_options: A list of blade image IDs
+        :param seed: Seed of the grass randomness, None keeps the current state
+        :param origin: Tile position of the top left cell of the map
+        :return: Number of placed tiles
+        """
+        if seed is not None:
+            self.random.seed(seed)
+
+        placed: int = 0
+        for y, row in enumerate(density_map):
+            for x, cell in enumerate(row):
+                density: int = int(cell)
+                if density > 0:
+                    self.place_tile((origin[0] + x, origin[1] + y), density, grass_options)
+                    placed += 1
+
+        self.__bake_ground()
+        return placed
+
+    def __bake_ground(self, chunk_locs: Optional[list[tuple[int, int]]] = None) -> None:
+        """
+        Bake the ground shadows of chunks, see GrassChunk.bake_ground.
+        :param chunk_locs: Chunks to bake, all if None
+        :return: None
+        """
+        if not self.ground_shadow[0]:
+            return
+
+        for chunk_loc in self._chunks if chunk_locs is None else chunk_locs:
+            tiles: list[GrassTile] = []
+            for y in range(chunk_loc[1] - 1, chunk_loc[1] + 2):
+                for x in range(chunk_loc[0] - 1, chunk_loc[0] + 2):
+                    if (x, y) in self._chunks:
+                        tiles.extend(self._chunks[(x, y)].tiles)
+            self._chunks[chunk_loc].bake_ground(tiles)
 
     def apply_force(self, location: tuple[int, int] | list[int, int], radius: float, force_drop_off: float) -> None:
         """
@@ -155,25 +390,53 @@ class GrassManager:
                                the force to be eased into nothing
         :return: None
         """
-        location: tuple[int, int] = tuple(map(int, location))  # type: ignore
-        get_grid: Callable = lambda position: int(position) // self._tile_size
-        grid_pos: tuple[int, int] = tuple(map(get_grid, location))  # type: ignore
-        force_range: int = math.ceil((radius + force_drop_off) / self._tile_size)
+        self.apply_forces([GrassForce(location, radius, force_drop_off)])
 
-        for y in range((diameter := force_range * 2) + 1):
-            y -= force_range
-            for x in range(diameter + 1):
-                x -= force_range
-                pos: tuple[int, int] = (grid_pos[0] + x, grid_pos[1] + y)
-                if pos in self._grass_tiles:
-                    self._grass_tiles[pos].apply_force(location, radius, force_drop_off)
+    def apply_forces(self, forces: Iterable[GrassForce]) -> None:
+        """
+        Applies all force sources of a frame (player, enemies, projectiles, spells) in one
+        batch. Grid cells are looked up once however many sources cover them, and with the
+        vectorized physics every blade is updated once.
+
+        :param forces: Force sources, see apply_force for the meaning of their fields
+        :return: None
+        """
+        forces: list[GrassForce] = [
+            GrassForce(tuple(map(int, location)), radius, force_drop_off)  # type: ignore
+            for location, radius, force_drop_off in forces
+        ]
+
+        # grid cells in reach of every source, each cell is looked up once
+        cells: list[list[tuple[int, int]]] = []
+        for location, radius, force_drop_off in forces:
+            grid_pos: tuple[int, int] = (location[0] // self._tile_size, location[1] // self._tile_size)
+            force_range: int = math.ceil((radius + force_drop_off) / self._tile_size)
+            cells.append([
+                (grid_pos[0] + x, grid_pos[1] + y)
+                for y in range(-force_range, force_range + 1)
+                for x in range(-force_range, force_range + 1)
+            ])
+        found: dict[tuple[int, int], GrassTile] = {
+            pos: self._grass_tiles[pos] for pos in set().union(*cells) if pos in self._grass_tiles
+        }
+        tile_groups: list[list[GrassTile]] = [[found[pos] for pos in group if pos in found] for group in cells]
+
+        if self.physics:
+            self.physics.apply_forces(tile_groups, forces)
+        else:
+            for tiles, (location, radius, force_drop_off) in zip(tile_groups, forces):
+                for tile in tiles:
+                    tile.apply_force(location, radius, force_drop_off)
+            self._disturbed_tiles.update(found.values())
 
     def update_render(
             self,
             surf: Surface,
             dt: float,
             offset: tuple[int, int] = (0, 0),
-            rot_function: Callable = None
+            rot_function: Callable = None,
+            wind: Optional[Wind] = None,
+            focus: Optional[tuple[float, float]] = None
     ) -> None:
         """
         Renders the grass onto a surface and applies updates. Surf is the surface rendered
@@ -187,8 +450,25 @@ class GrassManager:
         :param offset: Camera's offset
         :param rot_function: Pass a function that will be responsible for the animation of the grass
                             (rotation of the blades)
+        :param wind: Wind field, sampled once per visible column instead of calling rot_function
+                     for every tile. Takes precedence over rot_function.
+        :param focus: World position the level of detail is measured from, the view center by default
         :return: None
         """
+        # spring-back of every disturbed tile, visible or not
+        if self.physics:
+            self.physics.update(dt)
+        else:
+            self._disturbed_tiles = {tile for tile in self._disturbed_tiles if tile.spring_back(dt)}
+
+        if self._chunk_size:
+            start_time: float = time.perf_counter()
+            if focus is None:
+                focus: tuple[float, float] = (offset[0] + surf.get_width() / 2, offset[1] + surf.get_height() / 2)
+            self.__render_chunks(surf, dt, offset, rot_function, wind, focus)
+            self.__update_lod_bias((time.perf_counter() - start_time) * 1000)
+            return
+
         visible_tile_range: tuple[int, int] = (int(surf.get_width() // self._tile_size) + 1,
                                                int(surf.get_height() // self._tile_size) + 1)
         base_pos: tuple[int, int] = (int(offset[0] // self._tile_size),
@@ -207,10 +487,71 @@ class GrassManager:
                 self._grass_tiles[pos].render_shadow(
                     surf, offset=(offset[0] - self.ground_shadow[3][0], offset[1] - self.ground_shadow[3][1])  # noqa
                 )
+        # rotation of every visible column in one step
+        rotations: Optional[np.ndarray] = None
+        if wind:
+            rotations = wind.sample((base_pos[0] + np.arange(visible_tile_range[0])) * self._tile_size)
+
         # render the grass tiles
         for pos in render_list:
             tile: GrassTile = self._grass_tiles[pos]
             tile.render(surf, dt, offset=offset)
 
-            if rot_function:
+            if rotations is not None:
+                tile.set_rotation(int(rotations[pos[0] - base_pos[0]]))
+            elif rot_function:
                 tile.set_rotation(rot_function(tile.loc[0], tile.loc[1]))
+
+    def __render_chunks(
+            self,
+            surf: Surface,
+            dt: float,
+            offset: tuple[int, int],
+            rot_function: Optional[Callable],
+            wind: Optional[Wind],
+            focus: tuple[float, float]
+    ) -> None:
+        """
+        Chunked version of update_render, see GrassChunk.
+        :param surf: Surface on which to draw grass
+        :param dt: Time between current and last frame
+        :param offset: Camera's offset
+        :param rot_function: Function responsible for the rotation of the blades
+        :param wind: Wind field
+        :param focus: World position the level of detail is measured from
+        :return: None
+        """
+        chunk_px: int = self._chunk_size * self._tile_size
+        first_chunk: tuple[int, int] = (int(offset[0] // chunk_px), int(offset[1] // chunk_px))
+        last_chunk: tuple[int, int] = (int((offset[0] + surf.get_width()) // chunk_px),
+                                       int((offset[1] + surf.get_height()) // chunk_px))
+
+        render_list: list[GrassChunk] = []
+        for y in range(first_chunk[1], last_chunk[1] + 1):
+            for x in range(first_chunk[0], last_chunk[0] + 1):
+                if (x, y) in self._chunks:
+                    render_list.append(self._chunks[(x, y)])
+
+        # render the ground with the baked shadows if applicable (tiles placed one by one are baked late)
+        if self.ground_shadow[0]:
+            unbaked: list[tuple[int, int]] = [
+                (chunk.loc[0] // chunk_px, chunk.loc[1] // chunk_px) for chunk in render_list if not chunk.ground_baked
+            ]
+            if unbaked:
+                self.__bake_ground(unbaked)
+            for chunk in render_list:
+                chunk.render_ground(surf, offset=offset)
+        # rotation of every visible chunk column in one step
+        rotations: Optional[np.ndarray] = None
+        if wind:
+            columns: np.ndarray = np.arange(first_chunk[0], last_chunk[0] + 1) * chunk_px + chunk_px // 2
+            rotations = wind.sample(columns)
+
+        # render the grass chunks, rotations are quantized per level of detail for the chunk cache
+        for chunk in render_list:
+            lod: int = self.__get_lod(chunk, focus)
+            if rotations is not None:
+                chunk.set_rotation(self.__quantize_rotation(rotations[chunk.loc[0] // chunk_px - first_chunk[0]], lod))
+            elif rot_function:
+                chunk.set_rotation(self.__quantize_rotation(rot_function(chunk.center[0], chunk.center[1]), lod))
+            chunk.render(surf, dt, offset=offset, lod=lod)
@@ -0,0 +1,188 @@
+from typing import Optional
+
+import numpy as np
+
+from crygeen.game_process.grass_setup.grass_tile import GrassTile
+
+
+class GrassPhysics:
+    """
+    Vectorized grass physics.
+
+    Every blade of every registered tile lives in contiguous NumPy arrays: world position,
+    base angle and current angle. Tiles only know the slice of their blades. Forces and
+    spring-back run as batched array operations over all affected tiles at once instead
+    of Python loops over single blades, so the cost per frame depends on the number of
+    blades touched, not on the tile size, density or size of the field.
+    """
+
+    def __init__(
+            self,
+            grass_manager  # type: 'GrassManager'
+    ) -> None:
+        self._grass_manager = grass_manager  # type: 'GrassManager'
+
+        # blade data
+        self._x: np.ndarray = np.empty(0, np.float32)
+        self._y: np.ndarray = np.empty(0, np.float32)
+        self._base: np.ndarray = np.empty(0, np.float32)
+        self._angle: np.ndarray = np.empty(0, np.float32)
+
+        # tile data
+        self._start: np.ndarray = np.empty(0, np.int64)
+        self._count: np.ndarray = np.empty(0, np.int64)
+        self._disturbed: np.ndarray = np.empty(0, bool)
+        self._active: np.ndarray = np.empty(0, np.int64)  # slots of the disturbed tiles, sorted
+        self._tiles: list[GrassTile] = []
+
+        # tiles placed since the last consolidation, appending to numpy arrays one by one is quadratic
+        self.__pending: list[GrassTile] = []
+
+    def add_tile(self, tile: GrassTile) -> None:
+        tile.physics_slot = len(self._tiles) + len(self.__pending)
+        self.__pending.append(tile)
+
+    def __consolidate(self) -> None:
+        if not self.__pending:
+            return
+
+        new_x: list[float] = []
+        new_y: list[float] = []
+        new_base: list[float] = []
+        counts: list[int] = []
+        for tile in self.__pending:
+            for (x, y), _, angle in tile.blades:
+                new_x.append(tile.loc[0] + x)
+                new_y.append(tile.loc[1] + y)
+                new_base.append(angle)
+            counts.append(len(tile.blades))
+
+        counts_array: np.ndarray = np.array(counts, np.int64)
+        starts: np.ndarray = len(self._x) + np.cumsum(counts_array) - counts_array
+
+        self._x = np.concatenate((self._x, np.array(new_x, np.float32)))
+        self._y = np.concatenate((self._y, np.array(new_y, np.float32)))
+        self._base = np.concatenate((self._base, np.array(new_base, np.float32)))
+        self._angle = np.concatenate((self._angle, np.array(new_base, np.float32)))
+        self._start = np.concatenate((self._start, starts))
+        self._count = np.concatenate((self._count, counts_array))
+        self._disturbed = np.concatenate((self._disturbed, np.zeros(len(counts), bool)))
+        self._tiles.extend(self.__pending)
+        self.__pending.clear()
+
+    def __blade_indices(self, tile_slots: np.ndarray) -> np.ndarray:
+        """
+        Gather the blade indices of several tiles into one flat index array.
+        :param tile_slots: Physics slots of the tiles.
+        :return: Indices into the blade arrays.
+        """
+        counts: np.ndarray = self._count[tile_slots]
+        offsets: np.ndarray = np.repeat(self._start[tile_slots] - (np.cumsum(counts) - counts), counts)
+        return np.arange(counts.sum()) + offsets
+
+    def apply_forces(self, tile_groups: list[list[GrassTile]], forces: list['GrassForce']) -> None:
+        """
+        Batched version of GrassTile.apply_force for several force sources at once.
+        Every blade is updated once: of all sources reaching it, the strongest one wins
+        (the later one on a tie), which gives the same result as applying them one by one.
+        :param tile_groups: Tiles in reach of each force.
+        :param forces: Force sources.
+        :return: None
+        """
+        self.__consolidate()
+
+        blade_parts: list[np.ndarray] = []
+        force_parts: list[np.ndarray] = []
+        direction_parts: list[np.ndarray] = []
+        for tiles, (location, radius, force_drop_off) in zip(tile_groups, forces):
+            if not tiles:
+                continue
+            tile_slots: np.ndarray = np.fromiter((tile.physics_slot for tile in tiles), np.int64, len(tiles))
+            blades: np.ndarray = self.__blade_indices(tile_slots)
+
+            dx: np.ndarray = self._x[blades] - location[0]
+            distance: np.ndarray = np.hypot(dx, self._y[blades] - location[1])
+            blade_parts.append(blades)
+            force_parts.append(np.where(
+                distance < radius, 2, 1 - np.minimum(np.maximum(distance - radius, 0) / force_drop_off, 1)
+            ))
+            direction_parts.append(np.where(dx < 0, 1, -1))
+
+            disturbed: np.ndarray = tile_slots[self._count[tile_slots] > 0]
+            self._disturbed[disturbed] = True
+            self._active = np.union1d(self._active, disturbed)
+
+        if not blade_parts:
+            return
+
+        blades: np.ndarray = np.concatenate(blade_parts)
+        force: np.ndarray = np.concatenate(force_parts)
+        direction: np.ndarray = np.concatenate(direction_parts)
+        if len(blade_parts) > 1:
+            # lexsort is stable, so the last entry of each blade is its strongest and latest source
+            order: np.ndarray = np.lexsort((force, blades))
+            blades, force, direction = blades[order], force[order], direction[order]
+            last: np.ndarray = np.append(blades[1:] != blades[:-1], True)
+            blades, force, direction = blades[last], force[last], direction[last]
+
+        base: np.ndarray = self._base[blades]
+        stronger: np.ndarray = np.abs(self._angle[blades] - base) <= force * 90
+        self._angle[blades[stronger]] = (base + direction * force * 90)[stronger]
+
+    def update(self, dt: float) -> None:
+        """
+        Move the blades of every disturbed tile back towards their base angle and mark
+        the tiles whose blades all arrived as settled, so they use the cache again.
+        Only the active set is touched, visible or not.
+        :param dt: Time between current and last frame.
+        :return: None
+        """
+        tile_slots: np.ndarray = self._active
+        if not len(tile_slots):
+            return
+
+        blades: np.ndarray = self.__blade_indices(tile_slots)
+        base: np.ndarray = self._base[blades]
+        offset: np.ndarray = self._angle[blades] - base
+        step: float = self._grass_manager.stiffness * dt
+
+        offset = np.where(np.abs(offset) <= step, 0, offset - np.sign(offset) * step)
+        self._angle[blades] = base + offset
+
+        # reduceat needs the start of every tile within the gathered blades
+        counts: np.ndarray = self._count[tile_slots]
+        moving: np.ndarray = np.maximum.reduceat(np.abs(offset), np.cumsum(counts) - counts) > 0
+        self._disturbed[tile_slots] = moving
+        self._active = tile_slots[moving]
+
+    @property
+    def disturbed_count(self) -> int:
+        return len(self._active)
+
+    def is_disturbed(self, tile: GrassTile) -> bool:
+        self.__consolidate()
+        return bool(self._disturbed[tile.physics_slot])
+
+    def any_disturbed(self, tile_slots: np.ndarray) -> bool:
+        """
+        Check a whole group of tiles (a chunk) at once.
+        :param tile_slots: Physics slots of the tiles.
+        :return: True if at least one of the tiles is disturbed.
+        """
+        self.__consolidate()
+        return bool(self._disturbed[tile_slots].any())
+
+    def get_custom_blades(self, tile: GrassTile) -> Optional[list[list]]:
+        """
+        Blade data with the current angles of a disturbed tile, in the same layout as
+        GrassTile blade data.
+        :param tile: Grass tile.
+        :return: Blade data or None if the tile is settled and can use the cache.
+        """
+        self.__consolidate()
+        if not self._disturbed[tile.physics_slot]:
+            return None
+
+        start: int = self._start[tile.physics_slot]
+        angles: np.ndarray = self._angle[start:start + self._count[tile.physics_slot]]
+        return [[blade[0], blade[1], float(angle)] for blade, angle in zip(tile.blades, angles)]
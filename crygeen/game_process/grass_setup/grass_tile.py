@@ -1,5 +1,4 @@
 import math
-import random
 from typing import Optional
 
 import pygame as pg
@@ -37,16 +36,15 @@ class GrassTile:
         self._density: int = density
         self._config: list[int] = config
 
-        self._blades: list[list[tuple[float, float], int, float]] = []
-        self.__generate_blade_data()
-
-        # layer back to front
-        self._blades.sort(key=lambda x: x[1])
-
         # get next ID
         self._base_id: int = self._grass_manager.grass_id
         self._grass_manager.grass_id += 1
 
+        """
+        Blade layouts are immutable and shared between tiles of the same format once the
+        format has enough unique variants, only custom_blade_data below is per tile.
+        """
+        self._blades: tuple[tuple[tuple[float, float], int, float], ...] = ()
         self.__check_overwrite()
 
         """
@@ -54,34 +52,68 @@ class GrassTile:
         All grass tiles will try to return to a cached state.
         """
         self._custom_blade_data: Optional[list[Optional]] = None  # this is not correct typing
+        self.physics_slot: Optional[int] = None  # index of the tile in GrassPhysics if it is used
 
         self._render_data: Optional[tuple[int, int]] = None
         self._true_rotation: Optional[float] = None
         self.__update_render_data()
 
-    def __generate_blade_data(self) -> None:
+    def __generate_blade_data(self) -> tuple[tuple[tuple[float, float], int, float], ...]:
+        blades: list[tuple[tuple[float, float], int, float]] = []
         y_range: float = self._grass_manager.vertical_place_range[1] - self._grass_manager.vertical_place_range[0]
         for i in range(self._density):
-            new_blade: int = random.choice(self._config)
+            new_blade: int = self._grass_manager.random.choice(self._config)
             y_pos: float = self._grass_manager.vertical_place_range[0]
 
             if y_range:
-                y_pos: float = random.random() * y_range + self._grass_manager.vertical_place_range[0]
+                y_pos: float = self._grass_manager.random.random() * y_range + self._grass_manager.vertical_place_range[0]
 
-            self._blades.append([
-                (random.random() * self._tile_size, y_pos * self._tile_size),
+            blades.append((
+                (self._grass_manager.random.random() * self._tile_size, y_pos * self._tile_size),
                 new_blade,
-                random.random() * 30 - 15  # todo settings
-            ])
+                self._grass_manager.random.random() * 30 - 15  # todo settings
+            ))
+
+        # layer back to front
+        blades.sort(key=lambda x: x[1])
+        return tuple(blades)
+
+    @property
+    def blades(self) -> tuple[tuple[tuple[float, float], int, float], ...]:
+        return self._blades
+
+    @property
+    def base_id(self) -> int:
+        return self._base_id
+
+    @property
+    def rotation(self) -> int:
+        return self._master_rotation
+
+    @property
+    def disturbed(self) -> bool:
+        if self._grass_manager.physics:
+            return self._grass_manager.physics.is_disturbed(self)
+        return self._custom_blade_data is not None
+
+    def __get_custom_blade_data(self) -> Optional[list]:
+        """
+        Blade data of the current (uncached) state or None if the tile can use the cache.
+        The vectorized physics keeps this state in its arrays, the python physics on the tile.
+        """
+        if self._grass_manager.physics:
+            return self._grass_manager.physics.get_custom_blades(self)
+        return self._custom_blade_data
 
     def __check_overwrite(self) -> None:
         format_id: tuple[int, tuple[int, ...]] = (self._density, tuple(self._config))
-        overwrite: Optional[tuple[int, list[list[tuple[float, float], int, float]]]] = self._grass_manager.get_format(
-            format_id, self._blades, self._base_id
-        )
+        overwrite: Optional[tuple[int, tuple[tuple[tuple[float, float], int, float], ...]]] = \
+            self._grass_manager.get_format(format_id)
         if overwrite:
-            self._blades: list[list[tuple[float, float], int, float]] = overwrite[1]
-            self._base_id: int = overwrite[0]
+            self._base_id, self._blades = overwrite
+        else:
+            self._blades = self.__generate_blade_data()
+            self._grass_manager.add_format(format_id, self._blades, self._base_id)
 
     def apply_force(self, force_point: tuple[int, int], force_radius: float, force_drop_off: float) -> None:
         """
@@ -131,16 +163,19 @@ class GrassTile:
         self._master_rotation: int = rotation
         self.__update_render_data()
 
-    def __render_tile(self, render_shadow: bool = False) -> Surface | tuple[Surface, Surface]:
+    def __render_tile(
+            self, render_shadow: bool = False, custom_blade_data: Optional[list] = None, lod: int = 0
+    ) -> Surface | tuple[Surface, Surface]:
         # make a new padded surface (to fit blades spilling out of the tile)
         surf: Surface = pg.Surface((self._tile_size + self._padding * 2, self._tile_size + self._padding * 2))
         surf.set_colorkey((0, 0, 0))
 
         # use custom_blade_data if its active (uncached), otherwise use the base data (cached).
-        if self._custom_blade_data:
-            blades: list = self._custom_blade_data
+        if custom_blade_data:
+            blades: list = custom_blade_data
         else:
-            blades: list[list[tuple[float, float], int, float]] = self._blades
+            blades: tuple[tuple[tuple[float, float], int, float], ...] = \
+                self._blades[::self._grass_manager.lod_blade_strides[lod]] if lod else self._blades
 
         # render the shadows of each blade if applicable
         if render_shadow:
@@ -155,14 +190,14 @@ class GrassTile:
                 )
             shadow_surf.set_alpha(self._grass_manager.ground_shadow[2])
 
-        # render each blade using the asset manager
-        for blade in blades:
-            self._blade_assets.render_blade(
-                surf,
-                blade[1],  # noqa
-                (blade[0][0] + self._padding, blade[0][1] + self._padding),
-                max(-90, min(90, blade[2] + self._true_rotation))  # noqa
-            )
+        # render all blades in one batch using the asset manager
+        self._blade_assets.render_blades(
+            surf,
+            [
+                (blade[1], (blade[0][0] + self._padding, blade[0][1] + self._padding), blade[2] + self._true_rotation)
+                for blade in blades
+            ]
+        )
 
         # return surf and shadow_surf if applicable
         if render_shadow:
@@ -187,40 +222,61 @@ class GrassTile:
             value = target
         return value
 
-    def render(self, surf: Surface, dt: float, offset: tuple[int, int]) -> None:
+    def get_cached_image(self, lod: int = 0, cache_shadow: bool = True) -> Surface:
+        """
+        :param lod: Level of detail, higher levels render every n-th blade only (GrassManager.lod_blade_strides)
+        :param cache_shadow: Also cache the shadow of the tile, chunks bake their shadows into the ground instead
+        :return: Cached image of the tile at its current rotation
+        """
+        # check if a new cached image needs to be generated and use the cached data if not (also cache shadow if necessary)
+        cache_key: tuple[int, ...] = (*self._render_data, lod) if lod else self._render_data
+        grass_img: Optional[Surface] = self._grass_manager.grass_cache.get(cache_key)
+        missing_shadow: bool = cache_shadow and self._grass_manager.ground_shadow[0] and \
+            self._base_id not in self._grass_manager.shadow_cache
+        if grass_img is None and missing_shadow:
+            grass_img, shadow_img = self.__render_tile(render_shadow=True, lod=lod)
+            self._grass_manager.grass_cache[cache_key] = grass_img
+            self._grass_manager.shadow_cache[self._base_id] = shadow_img
+        elif grass_img is None:
+            grass_img: Surface = self.__render_tile(lod=lod)
+            self._grass_manager.grass_cache[cache_key] = grass_img
+        elif missing_shadow:  # the shadow was evicted from its cache on its own
+            self._grass_manager.shadow_cache[self._base_id] = self.__render_tile(render_shadow=True)[1]
+        return grass_img
+
+    def render(self, surf: Surface, dt: float, offset: tuple[int, int], cache_shadow: bool = True) -> None:
         # render a new grass tile image if using custom uncached data otherwise use cached data if possible
-        if self._custom_blade_data:
+        custom_blade_data: Optional[list] = self.__get_custom_blade_data()
+        if custom_blade_data:
             surf.blit(
-                self.__render_tile(), (self.loc[0] - offset[0] - self._padding, self.loc[1] - offset[1] - self._padding)
+                self.__render_tile(custom_blade_data=custom_blade_data),
+                (self.loc[0] - offset[0] - self._padding, self.loc[1] - offset[1] - self._padding)
             )
-        # check if a new cached image needs to be generated and use the cached data if not (also cache shadow if necessary)
+        # render image from the cache
         else:
-            # check needs to cache shadow also
-            if (self._render_data not in self._grass_manager.grass_cache) and (
-                    self._grass_manager.ground_shadow[0] and self._base_id not in self._grass_manager.shadow_cache):
-                grass_img, shadow_img = self.__render_tile(render_shadow=True)
-                self._grass_manager.grass_cache[self._render_data] = grass_img
-                self._grass_manager.shadow_cache[self._base_id] = shadow_img
-            elif self._render_data not in self._grass_manager.grass_cache:
-                self._grass_manager.grass_cache[self._render_data] = self.__render_tile()
-
-            # render image from the cache
-            surf.blit(self._grass_manager.grass_cache[self._render_data],
+            surf.blit(self.get_cached_image(cache_shadow=cache_shadow),
                       (self.loc[0] - offset[0] - self._padding, self.loc[1] - offset[1] - self._padding))
 
-        # attempt to move blades back to their base position
-        if self._custom_blade_data:
-            matching: bool = True
-            for index, blade in enumerate(self._custom_blade_data):
-
-                blade[2]: float = self.__normalize(
-                    blade[2],
-                    self._grass_manager.stiffness * dt,
-                    self._blades[index][2]  # noqa
-                )
-                if blade[2] != self._blades[index][2]:
-                    matching: bool = False
+    def spring_back(self, dt: float) -> bool:
+        """
+        Attempt to move blades back to their base position.
+        :param dt: Time between current and last frame.
+        :return: True while the tile is still disturbed.
+        """
+        if not self._custom_blade_data:
+            return False
+
+        matching: bool = True
+        for index, blade in enumerate(self._custom_blade_data):
+            blade[2]: float = self.__normalize(
+                blade[2],
+                self._grass_manager.stiffness * dt,
+                self._blades[index][2]  # noqa
+            )
+            if blade[2] != self._blades[index][2]:
+                matching: bool = False
 
-                # mark the data as non-custom once in base position so the cache ca be used
-                if matching:
-                    self._custom_blade_data = None
+        # mark the data as non-custom once in base position so the cache ca be used
+        if matching:
+            self._custom_blade_data = None
+        return not matching
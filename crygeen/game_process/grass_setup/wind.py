@@ -0,0 +1,66 @@
+import numpy as np
+
+from crygeen.game_process.game_settings import gSettings
+
+
+class Wind:
+    """
+    Wind field of the grass.
+
+    The rotation of a tile only depends on its x position, so the wind is sampled once per
+    visible column in a single array operation and the tiles read their rotation from that
+    table. On top of the base wave there are two optional layers: a slow, wide gust wave
+    and value noise scrolling with the wind, which breaks up the regular pattern.
+    """
+
+    def __init__(self, seed: int = 0) -> None:
+        # base wave
+        self.speed: float = gSettings.GRASS_ROTATION_SPEED
+        self.amplitude: float = gSettings.GRASS_WIND_AMPLITUDE
+        self.wavelength: float = gSettings.GRASS_WIND_WAVELENGTH
+        self.period: float = gSettings.GRASS_WIND_PERIOD
+
+        # gust layer
+        self.gust_strength: float = gSettings.GRASS_WIND_GUST_STRENGTH
+        self.gust_wavelength: float = gSettings.GRASS_WIND_GUST_WAVELENGTH
+        self.gust_period: float = gSettings.GRASS_WIND_GUST_PERIOD
+
+        # noise layer
+        self.noise_strength: float = gSettings.GRASS_WIND_NOISE_STRENGTH
+        self.noise_scale: float = gSettings.GRASS_WIND_NOISE_SCALE
+        self.__noise: np.ndarray = np.random.default_rng(seed).uniform(-1, 1, 256)
+
+        self.t: float = 0
+
+    @property
+    def max_rotation(self) -> int:
+        """Largest rotation sample can return in either direction."""
+        return int(abs(self.amplitude) + abs(self.gust_strength) + abs(self.noise_strength))
+
+    def update(self, dt: float) -> None:
+        self.t += dt * self.speed
+
+    def __sample_noise(self, position: np.ndarray) -> np.ndarray:
+        """
+        Smoothly interpolated value noise, wrapping around the noise table.
+        :param position: Positions in noise cells.
+        :return: Noise values from -1 to 1.
+        """
+        cell: np.ndarray = np.floor(position)
+        fraction: np.ndarray = position - cell
+        fraction = fraction * fraction * (3 - 2 * fraction)
+        index: np.ndarray = cell.astype(np.int64) % len(self.__noise)
+        return self.__noise[index] * (1 - fraction) + self.__noise[(index + 1) % len(self.__noise)] * fraction
+
+    def sample(self, columns: np.ndarray) -> np.ndarray:
+        """
+        Rotation of the grass at the given x positions.
+        :param columns: World x positions in pixels.
+        :return: Rotations as integers, the same values GrassTile.set_rotation takes.
+        """
+        rotation: np.ndarray = np.sin(self.t / self.period + columns / self.wavelength) * self.amplitude
+        if self.gust_strength:
+            rotation += np.sin(self.t / self.gust_period + columns / self.gust_wavelength) * self.gust_strength
+        if self.noise_strength:
+            rotation += self.__sample_noise((columns - self.t) / self.noise_scale) * self.noise_strength
+        return np.trunc(rotation).astype(np.int64)
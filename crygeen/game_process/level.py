@@ -1,10 +1,15 @@
 import pygame as pg
 from pygame import Surface
 
+from crygeen.game_process.animator import Animator
+from crygeen.game_process.camera import Camera
 from crygeen.game_process.enemy import Enemy
+from crygeen.game_process.game_settings import gSettings
 from crygeen.game_process.grass_setup.grass_api import Grass
+from crygeen.game_process.grass_setup.grass_manager import GrassForce
 from crygeen.game_process.magic_setup.lightning_setup import Lightning
 from crygeen.game_process.player_setup.player import Player
+from crygeen.game_process.spatial_hash import ObstacleGroup
 from crygeen.game_process.spritesheet import SpriteSheet
 from crygeen.game_process.particles import ParticlePlayer
 
@@ -14,36 +19,48 @@ class Level:
         # general setup _____________________________________________________________________________
         self.game_canvas: Surface = game.game_canvas
         self.game_paused: bool = False
+        self.camera: Camera = Camera(self.game_canvas)
 
         self.sprite_sheet: SpriteSheet = sprite_sheet
+        self.animator: Animator = Animator(self.sprite_sheet)
 
         # sprite group setup ________________________________________________________________________
         self.visible_sprites = YSortCameraGroup()
-        self.obstacle_sprites = pg.sprite.Group()
+        self.obstacle_sprites: ObstacleGroup = ObstacleGroup()
 
         self.grass: Grass = Grass()
 
         # player setup ______________________________________________________________________________
-        self.player: Player = Player([self.visible_sprites], self.obstacle_sprites, self.sprite_sheet)
+        self.player: Player = Player([self.visible_sprites], self.obstacle_sprites, self.sprite_sheet, self.animator)
 
         # magic
         self.lightning: Lightning = Lightning(self.game_canvas)
 
-        self.particle_player: ParticlePlayer = ParticlePlayer(self.game_canvas)
+        self.particle_player: ParticlePlayer = ParticlePlayer(self.game_canvas, self.camera)
 
         self.enemy: Enemy = Enemy([self.visible_sprites], self.obstacle_sprites, self.player, self.particle_player)
 
+    def __get_grass_forces(self) -> list[GrassForce]:
+        """Everything that bends the grass this frame."""
+        return [
+            GrassForce(self.player.rect.center, *gSettings.GRASS_PLAYER_FORCE),
+            GrassForce(self.enemy.rect.center, *gSettings.GRASS_ENEMY_FORCE)
+        ]
+
     def run(self, dt: float) -> None:
-        self.game_canvas.fill((27, 66, 52))
+        self.game_canvas.fill(gSettings.GROUND_COLOR)
+        self.animator.update(dt)  # every animated entity at once
         self.player.update(dt)
-        self.grass.render(dt, self.game_canvas, self.player)
-        self.game_canvas.blit(self.player.image, self.player.rect)
+        self.camera.follow(self.player.rect)
+
+        self.grass.render(dt, self.game_canvas, self.camera, self.__get_grass_forces())
+        self.animator.render(self.game_canvas, self.camera)
         self.particle_player.update(pg.math.Vector2(600, 400))
 
         if self.player.keyboard_input.lightning:
-            self.lightning.update(self.player.rect.center)
+            self.lightning.update(self.camera.to_screen(self.player.rect.center))
 
-        self.enemy.render(self.game_canvas)
+        self.enemy.render(self.game_canvas, self.camera)
 
 
 
@@ -1,7 +1,7 @@
 import random
 
 import pygame as pg
-from pygame import Surface, Vector2
+from pygame import Rect, Surface, Vector2
 
 
 class Particle:
@@ -26,9 +26,10 @@ class Particle:
 
 class ParticlePlayer:
 
-    def __init__(self, surface: Surface) -> None:
+    def __init__(self, surface, camera):  # type: (Surface, 'Camera') -> None
         self._particles_list: list[Particle] = []
         self._surface: Surface = surface
+        self._camera = camera  # type: 'Camera'
         self.object_pos: Vector2 = pg.math.Vector2()
         self.__create_particles_list(100, Vector2(300, 400), 4, (255, 255, 255))
 
@@ -69,7 +70,12 @@ class ParticlePlayer:
             particle.position.y += particle.y_offset
 
             # particle.radius -= 0.3
-            pg.draw.circle(self._surface, particle.color, particle.position, particle.radius)
+            particle_rect: Rect = Rect(particle.position.x - particle.radius, particle.position.y - particle.radius,
+                                       particle.radius * 2, particle.radius * 2)
+            if self._camera.is_visible(particle_rect):
+                pg.draw.circle(
+                    self._surface, particle.color, self._camera.to_screen(particle.position), particle.radius
+                )
             if particle.radius <= 0:
                 self._particles_list.remove(particle)
 
@@ -10,7 +10,7 @@ from crygeen.settings import settings
 
 class Player(pg.sprite.Sprite):
 
-    def __init__(self, groups, obstacle_sprites, sprite_sheet: SpriteSheet) -> None:
+    def __init__(self, groups, obstacle_sprites, sprite_sheet: SpriteSheet, animator) -> None:
         super().__init__(groups)  # type: ignore
         # general setup _____________________________________________________________________________
         self.sprite_sheet: SpriteSheet = sprite_sheet
@@ -22,9 +22,9 @@ class Player(pg.sprite.Sprite):
         self.obstacle_sprites = obstacle_sprites
 
         self.keyboard_input: PlayerKeyboardInput = PlayerKeyboardInput(self)
-        self.animation: PlayerAnimation = PlayerAnimation(self)
+        self.animation: PlayerAnimation = PlayerAnimation(self, animator)
         self.stats: PlayerStats = PlayerStats()
 
     def update(self, dt: float) -> None:
         self.keyboard_input.update(dt)
-        self.animation.render(dt, self.keyboard_input.status)
+        self.animation.render(self.keyboard_input.state)
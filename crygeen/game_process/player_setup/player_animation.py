@@ -1,27 +1,28 @@
-import pygame as pg
-from pygame import Surface
-
 from crygeen.game_process.game_settings import gSettings
+from crygeen.game_process.player_setup.player_state import PlayerState
 
 
 class PlayerAnimation:
-    def __init__(self, player):  # type: ('Player') -> None
+    def __init__(self, player, animator):  # type: ('Player', 'Animator') -> None
         self.player = player
-        self._frame_index: int = 0
-        self._animation_speed: float = gSettings.PLAYER_ANIMATION_SPEED
-
-    def play_animation(self, dt: float, status: str) -> None:
-        self._frame_index += self._animation_speed * dt
-
-        if self._frame_index >= self.player.sprite_sheet.data['frames'][f'{status}0.png']['animation_len']:
-            self._frame_index: int = 0
-        sprite: Surface = self.player.sprite_sheet.parse_sprite(f'{status}{int(self._frame_index)}.png')
-
-        if self.player.sprite_sheet.data['frames'][f'{status}0.png'].get('reverse', False):
-            sprite: Surface = pg.transform.flip(sprite, True, False)
-
-        self.player.image = sprite
+        self.animator = animator  # type: 'Animator'
+        # state -> animation id of the sprite sheet, the only place the status names are looked up
+        self._animation_ids: list[int] = [self.player.sprite_sheet.animations[name] for name in PlayerState.NAMES]
+        self.slot: int = self.animator.add(
+            self._animation_ids[self.player.keyboard_input.state], gSettings.PLAYER_ANIMATION_SPEED, self.player.hitbox.center
+        )
+
+    def play_animation(self, state: int) -> None:
+        """
+        Switch to the animation of the state, the frames are advanced by the Animator.
+        :param state: Animation state, see PlayerState
+        :return: None
+        """
+        self.animator.set_animation(self.slot, self._animation_ids[state])
+        self.animator.set_position(self.slot, self.player.hitbox.center)
+
+        self.player.image = self.animator.get_frame(self.slot)
         self.player.rect = self.player.image.get_rect(center=self.player.hitbox.center)
 
-    def render(self, dt: float, status: str) -> None:
-        self.play_animation(dt, status)
+    def render(self, state: int) -> None:
+        self.play_animation(state)
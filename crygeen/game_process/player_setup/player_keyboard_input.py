@@ -8,6 +8,7 @@ from pygame.key import ScancodeWrapper
 from crygeen.game_process.game_settings import gSettings
 from crygeen.game_process.player_setup.player_direction import Direction
 from crygeen.game_process.player_setup.player_keyboard_logic import KeyboardLogic
+from crygeen.game_process.player_setup.player_state import Action, Facing, MoveKey, PlayerState
 from crygeen.main_menu.saver import SaveLoadManager
 from crygeen.settings import settings
 
@@ -17,12 +18,15 @@ class PlayerKeyboardInput:
         self.player = player  # type: 'Player'
         self.direction: Vector2 = pg.math.Vector2()
         self.control: dict[str, int] = self.__get_current_control()
-        self.dir: Direction = Direction()
+        self.move_keys: tuple[tuple[int, MoveKey], ...] = (
+            (self.control['Up'], MoveKey.UP), (self.control['Down'], MoveKey.DOWN),
+            (self.control['Left'], MoveKey.LEFT), (self.control['Right'], MoveKey.RIGHT)
+        )
         self.keyboard_logic: KeyboardLogic = KeyboardLogic(self)
 
-        self.status: str = 'down'
-        self.prev: str = 'down'
-        self.current_direction: str = 'down_idle'
+        # animation state, see PlayerState
+        self.state: int = PlayerState.STATES[Facing.DOWN][Action.MOVE]
+        self.facing: Facing = Facing.DOWN
         self.speed: int = gSettings.PLAYER_SPEED
 
         self.spurt_available: bool = True
@@ -39,8 +43,9 @@ class PlayerKeyboardInput:
 
         self.lightning: bool = False
 
-        self.camera_x: int = 0
-        self.camera_y: int = 0
+    @property
+    def attacking(self) -> bool:
+        return PlayerState.ACTIONS[self.state] == Action.ATTACK
 
     def keyboard_input(self, event: Event) -> None:
         keys: ScancodeWrapper = pg.key.get_pressed()
@@ -52,21 +57,12 @@ class PlayerKeyboardInput:
 
         if True in keys:
             self.idle = False
-            if 'attack' not in self.status:
-
-                if keys[self.control['Up']]:
-                    self.keyboard_logic.move_up()
-                elif keys[self.control['Down']]:
-                    self.keyboard_logic.move_down()
-                else:
-                    self.direction.y = 0
-
-                if keys[self.control['Left']]:
-                    self.keyboard_logic.move_left()
-                elif keys[self.control['Right']]:
-                    self.keyboard_logic.move_right()
-                else:
-                    self.direction.x = 0
+            if not self.attacking:
+                key_mask: int = 0
+                for key, move_key in self.move_keys:
+                    if keys[key]:
+                        key_mask |= move_key
+                self.direction.xy = PlayerState.KEY_VECTORS[key_mask]
 
             if keys[self.control['Spurt']]:
                 self.keyboard_logic.spurt()
@@ -77,20 +73,14 @@ class PlayerKeyboardInput:
             self.keyboard_logic.idle()
             self.lightning = False
 
-    def __get_current_direction(self) -> None:
-        if any(self.direction.xy):
-            self.current_direction: str = self.dir.get_direction_status(self.direction)
-
     def __get_status(self) -> None:
-        status: str = self.dir.get_direction_status(self.direction)
-        if self.direction.xy != (0, 0):
-            self.status: str = status.split('_')[0] if status else self.__get_prev_dir()
-
-    def __get_prev_dir(self) -> None:
-        self.prev: str = self.current_direction
+        facing: Optional[Facing] = PlayerState.get_facing(self.direction)
+        if facing is not None:
+            self.facing: Facing = facing
+            self.state: int = PlayerState.STATES[facing][Action.MOVE]
 
     def __move(self, dt: float) -> None:
-        if 'attack' not in self.status:
+        if not self.attacking:
             if self.direction.magnitude() != 0:
                 self.direction = self.direction.normalize()
 
@@ -100,14 +90,12 @@ class PlayerKeyboardInput:
             self.player.hitbox.y += self.direction.y * self.speed * dt
             self.__collision(Direction.VERTICAL)
 
-            self.camera_x -= self.direction.x * self.speed * dt  # todo ref
-            self.camera_y -= self.direction.y * self.speed * dt
-
         self.player.rect.center = self.player.hitbox.center
 
     def __collision(self, direction: int) -> None:
+        # only the obstacles near the hitbox, the hitbox moves while resolving so check again
         if direction == Direction.HORIZONTAL:
-            for sprite in self.player.obstacle_sprites:
+            for sprite in self.player.obstacle_sprites.query(self.player.hitbox):
                 if sprite.hitbox.colliderect(self.player.hitbox):
                     if self.direction.x > 0:  # moving right
                         self.player.hitbox.right = sprite.rect.left
@@ -115,7 +103,7 @@ class PlayerKeyboardInput:
                         self.player.hitbox.left = sprite.hitbox.right
 
         if direction == Direction.VERTICAL:
-            for sprite in self.player.obstacle_sprites:
+            for sprite in self.player.obstacle_sprites.query(self.player.hitbox):
                 if sprite.hitbox.colliderect(self.player.hitbox):
                     if self.direction.y > 0:  # moving down
                         self.player.hitbox.bottom = sprite.hitbox.top
@@ -136,13 +124,12 @@ class PlayerKeyboardInput:
         if not self.attack_available:
             if current_time - self.attack_start_time >= self.attack_cd:
                 self.attack_available: bool = True
-                self.status: str = self.current_direction.split('_')[0]
 
                 if not self.idle:
-                    self.direction.xy = self.dir.get_direction_vector(self.status)
+                    self.state: int = PlayerState.STATES[self.facing][Action.MOVE]
+                    self.direction.xy = PlayerState.VECTORS[self.facing]
                 else:
-                    self.idle = True
-                    self.status: str = self.current_direction
+                    self.state: int = PlayerState.STATES[self.facing][Action.IDLE]
                     self.direction.xy = (0, 0)
 
     @staticmethod
@@ -154,9 +141,7 @@ class PlayerKeyboardInput:
 
     def update(self, dt: float) -> None:
         current_time = pg.time.get_ticks()
-        self.__get_prev_dir()  # must be first
-        self.__move(dt)  # must be second
-        self.__get_current_direction()
+        self.__move(dt)  # must be first
         self.__get_status()
 
         self.__cooldowns()
@@ -1,5 +1,7 @@
 import pygame as pg
 
+from crygeen.game_process.player_setup.player_state import Action, PlayerState
+
 
 class KeyboardLogic:
     def __init__(self, kbi):  # type: ('PlayerKeyboardInput') -> None
@@ -21,12 +23,12 @@ class KeyboardLogic:
         self.kbi.idle = True
         self.kbi.direction.xy = (0, 0)
         if self.kbi.attack_available:
-            self.kbi.status = self.kbi.current_direction
+            self.kbi.state = PlayerState.STATES[self.kbi.facing][Action.IDLE]
 
     def action(self):
         if self.kbi.attack_available:
-            if 'attack' not in self.kbi.status:
-                self.kbi.status = self.kbi.current_direction.split('_')[0] + '_attack'
+            if not self.kbi.attacking:
+                self.kbi.state = PlayerState.STATES[self.kbi.facing][Action.ATTACK]
             self.kbi.attack_start_time = pg.time.get_ticks()
             self.kbi.attack_available = False
             self.kbi.direction.xy = (0, 0)
@@ -0,0 +1,79 @@
+from enum import IntEnum, IntFlag
+
+from pygame import Vector2
+
+
+class Facing(IntEnum):
+    UP: int = 0
+    UPRIGHT: int = 1
+    UPLEFT: int = 2
+    RIGHT: int = 3
+    LEFT: int = 4
+    DOWN: int = 5
+    DOWNRIGHT: int = 6
+    DOWNLEFT: int = 7
+
+
+class Action(IntEnum):
+    MOVE: int = 0
+    IDLE: int = 1
+    ATTACK: int = 2
+
+
+class MoveKey(IntFlag):
+    UP: int = 1
+    DOWN: int = 2
+    LEFT: int = 4
+    RIGHT: int = 8
+
+
+class PlayerState:
+    """
+    Compiled animation state machine of a character.
+
+    A state is a single int, facing * len(Action) + action, and every transition is an
+    index into one of the tables below, built once at import. The status names of the
+    sprite sheet ('down', 'down_idle', 'down_attack', ...) are only generated here, for
+    the lookups in the sprite sheet metadata at load.
+    """
+    # state -> status name, status name -> state
+    NAMES: tuple[str, ...] = tuple(
+        facing.name.lower() + suffix for facing in Facing for suffix in ('', '_idle', '_attack')
+    )
+    IDS: dict[str, int] = {name: state for state, name in enumerate(NAMES)}
+
+    # facing, action -> state and back
+    STATES: tuple[tuple[int, ...], ...] = tuple(
+        tuple(facing * len(Action) + action for action in Action) for facing in Facing
+    )
+    FACINGS: tuple[Facing, ...] = tuple(facing for facing in Facing for _ in Action)
+    ACTIONS: tuple[Action, ...] = tuple(action for _ in Facing for action in Action)
+
+    # mask of the pressed MoveKeys -> direction, up wins over down and left over right
+    KEY_VECTORS: tuple[tuple[int, int], ...] = tuple(
+        (
+            -1 if mask & MoveKey.LEFT else 1 if mask & MoveKey.RIGHT else 0,
+            -1 if mask & MoveKey.UP else 1 if mask & MoveKey.DOWN else 0
+        )
+        for mask in range(16)
+    )
+
+    # (sign x + 1) * 3 + sign y + 1 -> facing, None for no movement
+    SIGN_FACINGS: tuple[Facing | None, ...] = (
+        Facing.UPLEFT, Facing.LEFT, Facing.DOWNLEFT,
+        Facing.UP, None, Facing.DOWN,
+        Facing.UPRIGHT, Facing.RIGHT, Facing.DOWNRIGHT
+    )
+
+    # facing -> direction of movement
+    VECTORS: tuple[tuple[float, float], ...] = (
+        (0.0, -1.0), (0.7, -0.7), (-0.7, -0.7), (1.0, 0.0), (-1.0, 0.0), (0.0, 1.0), (0.7, 0.7), (-0.7, 0.7)
+    )
+
+    @classmethod
+    def get_facing(cls, direction: Vector2) -> Facing | None:
+        """
+        :param direction: Direction of movement, any length.
+        :return: Facing of the direction or None if it is zero.
+        """
+        return cls.SIGN_FACINGS[((direction.x > 0) - (direction.x < 0) + 1) * 3 + (direction.y > 0) - (direction.y < 0) + 1]
@@ -0,0 +1,145 @@
+from typing import Optional
+
+import pygame as pg
+from pygame import Rect
+from pygame.sprite import Sprite
+
+from crygeen.game_process.game_settings import gSettings
+
+
+class SpatialHash:
+    """
+    Uniform grid broadphase.
+
+    Every sprite is filed under each grid cell its hitbox touches, so a rect query only
+    looks at the sprites of the few cells around the rect instead of every sprite of the
+    level. The cost of a query depends on how crowded the cells are, not on the size of
+    the map.
+    """
+
+    def __init__(self, cell_size: Optional[int] = None) -> None:
+        """
+
+        :param cell_size: Side of a grid cell, COLLISION_CELL_SIZE if None
+        """
+        self.cell_size: int = gSettings.COLLISION_CELL_SIZE if cell_size is None else cell_size
+        self._cells: dict[tuple[int, int], dict[Sprite, None]] = {}  # dicts as ordered sets
+        self._ranges: dict[Sprite, tuple[int, int, int, int]] = {}  # sprite -> cells it is filed under
+
+    def __cell_range(self, rect: Rect) -> tuple[int, int, int, int]:
+        return (
+            rect.left // self.cell_size, rect.top // self.cell_size,
+            (rect.right - 1) // self.cell_size if rect.w else rect.left // self.cell_size,
+            (rect.bottom - 1) // self.cell_size if rect.h else rect.top // self.cell_size
+        )
+
+    def __file(self, sprite: Sprite, cell_range: tuple[int, int, int, int]) -> None:
+        left, top, right, bottom = cell_range
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                self._cells.setdefault((x, y), {})[sprite] = None
+
+    def __unfile(self, sprite: Sprite, cell_range: tuple[int, int, int, int]) -> None:
+        left, top, right, bottom = cell_range
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                cell: dict[Sprite, None] = self._cells[(x, y)]
+                del cell[sprite]
+                if not cell:
+                    del self._cells[(x, y)]
+
+    def insert(self, sprite: Sprite) -> None:
+        """
+        :param sprite: Sprite with a hitbox rect
+        :return: None
+        """
+        cell_range: tuple[int, int, int, int] = self.__cell_range(sprite.hitbox)  # noqa
+        self._ranges[sprite] = cell_range
+        self.__file(sprite, cell_range)
+
+    def remove(self, sprite: Sprite) -> None:
+        self.__unfile(sprite, self._ranges.pop(sprite))
+
+    def move(self, sprite: Sprite) -> None:
+        """
+        Refile a sprite after its hitbox moved, only touches the grid if it entered other cells.
+        :param sprite: Sprite already in the hash
+        :return: None
+        """
+        cell_range: tuple[int, int, int, int] = self.__cell_range(sprite.hitbox)  # noqa
+        if cell_range != self._ranges[sprite]:
+            self.__unfile(sprite, self._ranges[sprite])
+            self._ranges[sprite] = cell_range
+            self.__file(sprite, cell_range)
+
+    def query(self, rect: Rect) -> list[Sprite]:
+        """
+        :param rect: World rect
+        :return: Sprites whose hitbox collides with the rect
+        """
+        found: dict[Sprite, None] = {}
+        left, top, right, bottom = self.__cell_range(rect)
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                cell: Optional[dict[Sprite, None]] = self._cells.get((x, y))
+                if cell:
+                    for sprite in cell:
+                        if sprite not in found and sprite.hitbox.colliderect(rect):  # noqa
+                            found[sprite] = None
+        return list(found)
+
+    def __contains__(self, sprite: Sprite) -> bool:
+        return sprite in self._ranges
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+
+class ObstacleGroup(pg.sprite.Group):
+    """
+    Sprite group of the obstacles, backed by two spatial hashes: one for static
+    obstacles, filed once, and one for dynamic obstacles (sprites with a true 'dynamic'
+    attribute), which are refiled with move after they moved. Sprites join and leave the
+    hashes together with the group. Sprites join the group before their constructor
+    sets the hitbox, so they are only filed on the next query.
+
+    The hashes never look at the sprites on their own: a sprite whose hitbox changes
+    without a call to move is found at its old place. All obstacles of the level are
+    static tiles for now, enemies are not obstacles and do not query the group, so
+    nothing calls move yet. A moving obstacle must be 'dynamic' and call move every time
+    its hitbox changes.
+    """
+
+    def __init__(self, cell_size: Optional[int] = None) -> None:
+        super().__init__()
+        self.static: SpatialHash = SpatialHash(cell_size)
+        self.dynamic: SpatialHash = SpatialHash(cell_size)
+        self.__pending: dict[Sprite, None] = {}
+
+    def __file_pending(self) -> None:
+        for sprite in self.__pending:
+            (self.dynamic if getattr(sprite, 'dynamic', False) else self.static).insert(sprite)
+        self.__pending.clear()
+
+    def add_internal(self, sprite: Sprite, layer=None) -> None:
+        super().add_internal(sprite, layer)
+        self.__pending[sprite] = None
+
+    def remove_internal(self, sprite: Sprite) -> None:
+        super().remove_internal(sprite)
+        if sprite in self.__pending:
+            del self.__pending[sprite]
+        else:
+            (self.dynamic if sprite in self.dynamic else self.static).remove(sprite)
+
+    def move(self, sprite: Sprite) -> None:
+        self.__file_pending()
+        self.dynamic.move(sprite)
+
+    def query(self, rect: Rect) -> list[Sprite]:
+        """
+        :param rect: World rect, usually a hitbox
+        :return: Static, then dynamic obstacles colliding with the rect
+        """
+        self.__file_pending()
+        return self.static.query(rect) + self.dynamic.query(rect)
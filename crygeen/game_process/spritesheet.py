@@ -5,9 +5,21 @@ import pygame as pg
 from pygame import Surface
 
 from crygeen.game_process.game_settings import gSettings
+from crygeen.utils.texture_atlas import TextureAtlas
 
 
 class SpriteSheet:
+    """
+    Sprite sheet with its animations sliced once at load.
+
+    Every frame of every animation is cut out of the sheet into its own surface when the
+    sheet is loaded, reversed animations are flipped right away, and all of them are
+    packed into a texture atlas, each frame a subsurface of an atlas page. The horizontally
+    mirrored frames are packed next to them for entities facing the other way. The frames
+    are indexed by animation id and frame number, so animating an entity is a lookup in a
+    table instead of slicing a new surface from the sheet each frame.
+    """
+
     def __init__(self, filename: Path, metadata: Path):
         self.filename: Path = filename
         self.sprite_sheet: Surface = pg.image.load(self.filename).convert_alpha()
@@ -17,6 +29,49 @@ class SpriteSheet:
             self.data: dict = json.load(file)
         file.close()
 
+        # frame table
+        self.animations: dict[str, int] = {}  # animation name -> animation id
+        self.frames: list[tuple[Surface, ...]] = []  # animation id -> frames
+        self.mirrored_frames: list[tuple[Surface, ...]] = []  # animation id -> horizontally flipped frames
+        self.animation_lens: list[int] = []  # animation id -> number of frames
+        self.texture_atlas: TextureAtlas = self.__slice_animations()
+
+    def __slice_animations(self) -> TextureAtlas:
+        images: dict[str, Surface] = {}
+        for sprite_name, sprite_data in self.data['frames'].items():
+            if 'animation_len' not in sprite_data:
+                continue
+
+            name: str = sprite_name.removesuffix('0.png')
+            for frame in range(sprite_data['animation_len']):
+                image: Surface = self.parse_sprite(f'{name}{frame}.png')
+                images[f'{name}{frame}'] = pg.transform.flip(image, True, False) \
+                    if sprite_data.get('reverse', False) \
+                    else image
+                images[f'{name}{frame}_mirrored'] = pg.transform.flip(images[f'{name}{frame}'], True, False)
+
+            self.animations[name] = len(self.animation_lens)
+            self.animation_lens.append(sprite_data['animation_len'])
+
+        texture_atlas: TextureAtlas = TextureAtlas.pack(images, colorkey=gSettings.PNG_BG)
+        for name, animation_id in self.animations.items():
+            self.frames.append(
+                tuple(texture_atlas.subsurface(f'{name}{frame}') for frame in range(self.animation_lens[animation_id]))
+            )
+            self.mirrored_frames.append(tuple(
+                texture_atlas.subsurface(f'{name}{frame}_mirrored') for frame in range(self.animation_lens[animation_id])
+            ))
+        return texture_atlas
+
+    def get_frame(self, animation_id: int, frame: int, mirrored: bool = False) -> Surface:
+        """
+        :param animation_id: Id of the animation, see animations
+        :param frame: Number of the frame within the animation
+        :param mirrored: Horizontally flipped frame
+        :return: Sliced frame, already flipped for reversed animations
+        """
+        return (self.mirrored_frames if mirrored else self.frames)[animation_id][frame]
+
     def get_sprite(self, x: int, y: int, w: int, h: int) -> Surface:
         sprite: Surface = pg.Surface((w, h))
         sprite.set_colorkey(gSettings.PNG_BG)
@@ -26,10 +81,4 @@ class SpriteSheet:
     def parse_sprite(self, sprite_name: str) -> Surface:
         sprite: dict[str, int] = self.data['frames'][sprite_name]['frame']
         x, y, w, h = sprite['x'], sprite['y'], sprite['w'], sprite['h']
-        image: Surface = self.get_sprite(x, y, w, h)
-        pg.transform.rotate(image, 90.0)
-        pg.transform.flip(image, True, False)
-        return image
-
-
-
+        return self.get_sprite(x, y, w, h)
@@ -0,0 +1,152 @@
+from typing import Iterable, NamedTuple, Optional
+
+import numpy as np
+import pygame as pg
+from pygame import Surface, Rect
+
+
+class DeltaFrame(NamedTuple):
+    keyframe: Optional[Surface]  # full frame, only set for keyframes
+    patches: list[tuple[Rect, Surface]]  # changed areas of the frame
+
+
+class DeltaAnimation:
+    """
+    Keyframe + delta encoded animation.
+
+    Every <keyframe_interval> frame is stored in full, every other frame only as the
+    rectangles that changed since the previous one. The screen is split into square
+    blocks of <block_size> pixels and a block counts as changed once any channel of any
+    pixel differs by more than <tolerance>, which keeps JPEG noise out of the patches.
+    Blocks are compared against the reconstructed picture rather than the source, so
+    the error never grows above the tolerance between two keyframes.
+
+    Playback applies the patches onto one canvas surface and keeps the touched
+    rectangles in dirty_rects, so the caller can blit and update only those areas.
+    """
+
+    def __init__(
+            self,
+            frames: Iterable[Surface],
+            size: tuple[int, int],
+            keyframe_interval: int,
+            block_size: int,
+            tolerance: int
+    ) -> None:
+        # general setup
+        self.size: tuple[int, int] = size
+        self.keyframe_interval: int = max(1, keyframe_interval)
+        self.block_size: int = block_size
+        self.tolerance: int = tolerance
+
+        # encoded data
+        self.delta_frames: list[DeltaFrame] = self.__encode(frames)
+        self.count_frames: int = len(self.delta_frames)
+
+        # playback setup
+        self.canvas: Surface = pg.Surface(self.size).convert()
+        self.frame_idx: Optional[int] = None
+        self.dirty_rects: list[Rect] = [self.canvas.get_rect()]
+
+    def __encode(self, frames: Iterable[Surface]) -> list[DeltaFrame]:
+        """
+        Encode frames one by one, only the previous reconstructed picture is kept in memory.
+        :param frames: Frame surfaces of the animation, all of self.size.
+        :return: Encoded frames.
+        """
+        delta_frames: list[DeltaFrame] = []
+        reconstruction: Optional[np.ndarray] = None
+
+        for index, frame in enumerate(frames):
+            pixels: np.ndarray = pg.surfarray.array3d(frame)
+
+            if reconstruction is None or index % self.keyframe_interval == 0:
+                delta_frames.append(DeltaFrame(frame.convert(), []))
+                reconstruction = pixels
+                continue
+
+            rects: list[Rect] = self.__changed_rects(pixels, reconstruction)
+            delta_frames.append(DeltaFrame(None, [(rect, frame.subsurface(rect).convert()) for rect in rects]))
+            for rect in rects:
+                reconstruction[rect.left:rect.right, rect.top:rect.bottom] = \
+                    pixels[rect.left:rect.right, rect.top:rect.bottom]
+
+        return delta_frames
+
+    def __changed_rects(self, pixels: np.ndarray, reconstruction: np.ndarray) -> list[Rect]:
+        """
+        Find the changed blocks and turn them into as few rectangles as possible: changed
+        blocks are joined into horizontal runs and runs with the same span in consecutive
+        block rows are joined vertically.
+        :param pixels: Array (width, height, 3) of the new frame.
+        :param reconstruction: Array (width, height, 3) of the picture the player will have.
+        :return: Changed rectangles, clipped to the frame.
+        """
+        block: int = self.block_size
+        width, height, _ = pixels.shape
+
+        # absolute difference without leaving uint8
+        difference: np.ndarray = np.maximum(pixels, reconstruction)
+        difference -= np.minimum(pixels, reconstruction)
+        difference = np.pad(difference, ((0, -width % block), (0, -height % block), (0, 0)))
+        changed: np.ndarray = difference.reshape(
+            difference.shape[0] // block, block, difference.shape[1] // block, block * 3
+        ).max(axis=(1, 3)) > self.tolerance
+
+        rects: list[Rect] = []
+        open_runs: dict[tuple[int, int], Rect] = {}
+        for row in range(changed.shape[1]):
+            runs: dict[tuple[int, int], Rect] = {}
+            column: int = 0
+            columns: np.ndarray = changed[:, row]
+            while column < len(columns):
+                if not columns[column]:
+                    column += 1
+                    continue
+                start: int = column
+                while column < len(columns) and columns[column]:
+                    column += 1
+
+                if (start, column) in open_runs:
+                    rect: Rect = open_runs.pop((start, column))
+                    rect.height += block
+                else:
+                    rect: Rect = Rect(start * block, row * block, (column - start) * block, block)
+                runs[(start, column)] = rect
+
+            rects.extend(open_runs.values())
+            open_runs = runs
+        rects.extend(open_runs.values())
+
+        frame_rect: Rect = Rect((0, 0), (width, height))
+        return [rect.clip(frame_rect) for rect in rects]
+
+    def __apply(self, frame_idx: int) -> list[Rect]:
+        delta_frame: DeltaFrame = self.delta_frames[frame_idx]
+        if delta_frame.keyframe:
+            self.canvas.blit(delta_frame.keyframe, (0, 0))
+            return [self.canvas.get_rect()]
+
+        self.canvas.blits([(patch, rect) for rect, patch in delta_frame.patches], doreturn=False)
+        return [rect for rect, _ in delta_frame.patches]
+
+    def get_frame(self, frame_idx: int) -> Surface:
+        """
+        Bring the canvas to the given frame. Moving to the next frame only applies its
+        patches, any other jump replays from the closest keyframe before it.
+        :param frame_idx: Index of the frame.
+        :return: Canvas surface with the frame on it.
+        """
+        if frame_idx == self.frame_idx:
+            self.dirty_rects = []
+            return self.canvas
+
+        if self.frame_idx is not None and frame_idx == (self.frame_idx + 1) % self.count_frames:
+            self.dirty_rects = self.__apply(frame_idx)
+        else:
+            for index in range(frame_idx - frame_idx % self.keyframe_interval, frame_idx + 1):
+                self.__apply(index)
+            self.dirty_rects = [self.canvas.get_rect()]
+
+        self.frame_idx = frame_idx
+        return self.canvas
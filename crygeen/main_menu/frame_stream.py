@@ -0,0 +1,134 @@
+import threading
+from pathlib import Path
+from typing import Optional
+
+import pygame as pg
+from pygame import Surface
+
+from crygeen.utils.support import import_img
+
+
+class FrameStream:
+    """
+    Streams the frames of a folder animation instead of keeping all of them in memory.
+
+    A background worker decodes and scales frames a few steps ahead of playback into
+    a fixed-size ring buffer, overwriting the oldest ones. Memory stays flat at
+    <buffer_size> frames no matter how many images the folder holds.
+
+    Frames are addressed by a monotonically growing sequence number, so the animation
+    wraps around smoothly even if the frame count is not a multiple of the buffer size.
+    A frame that fails to decode is replaced by the one before it.
+    """
+    FIRST_FRAME_TIMEOUT: float = 5  # seconds get_frame waits for the first frame
+
+    def __init__(self, frame_paths: list[Path], size: tuple[int, int], buffer_size: int) -> None:
+        # general setup
+        self.frame_paths: list[Path] = frame_paths
+        self.count_frames: int = len(frame_paths)
+        self.size: tuple[int, int] = size
+        self.buffer_size: int = max(1, min(buffer_size, self.count_frames))
+
+        # ring buffer setup
+        self.__ring: list[Optional[tuple[int, Surface]]] = [None] * self.buffer_size
+        self.__position: int = 0  # sequence number of the frame on screen
+        self.__decoded: int = 0  # sequence number the worker decodes next
+        self.__last_frame: Optional[Surface] = None
+        self.__last_decoded: Optional[Surface] = None  # stands in for frames that fail to decode
+
+        # worker setup
+        self.__condition: threading.Condition = threading.Condition()
+        self.__running: bool = True
+        self.__worker: threading.Thread = threading.Thread(target=self.__decode_ahead, daemon=True)
+        self.__worker.start()
+
+    def __decode_ahead(self) -> None:
+        """
+        Worker loop. Decodes the next frame whenever there is a free slot in front of the
+        playback position and sleeps otherwise. Decoding happens outside the lock, a frame
+        decoded for an outdated position (after a seek or resize) is thrown away. Only
+        returns once the stream is closed.
+        :return: None
+        """
+        while True:
+            with self.__condition:
+                self.__condition.wait_for(
+                    lambda: not self.__running or self.__decoded < self.__position + self.buffer_size
+                )
+                if not self.__running:
+                    return
+                sequence: int = self.__decoded
+                size: tuple[int, int] = self.size
+
+            try:
+                frame: Surface = import_img(self.frame_paths[sequence % self.count_frames], size)
+            except (pg.error, OSError, ValueError):  # broken image, or the display is gone at shutdown
+                frame: Surface = self.__last_decoded \
+                    if self.__last_decoded is not None and self.__last_decoded.get_size() == size \
+                    else pg.Surface(size)
+            self.__last_decoded = frame
+
+            with self.__condition:
+                if sequence == self.__decoded and size == self.size:
+                    self.__ring[sequence % self.buffer_size] = (sequence, frame)
+                    self.__decoded += 1
+                    self.__condition.notify_all()
+
+    def __seek(self, frame_idx: int) -> int:
+        """
+        Move the playback position forward to the given frame index and restart
+        the worker from there if the frame is not buffered yet.
+        :param frame_idx: Index of the frame in the folder.
+        :return: Sequence number of the frame.
+        """
+        sequence: int = self.__position + (frame_idx - self.__position) % self.count_frames
+        if sequence > self.__decoded:
+            self.__decoded = sequence
+        self.__position = sequence
+        self.__condition.notify_all()
+        return sequence
+
+    def get_frame(self, frame_idx: int) -> Surface:
+        """
+        Return the frame with the given index. If the worker has not caught up yet, the
+        previous frame is returned again instead of stalling the menu. Only the very
+        first frame is waited for, at most FIRST_FRAME_TIMEOUT seconds, then a blank
+        frame is shown.
+        :param frame_idx: Index of the frame in the folder.
+        :return: Frame surface.
+        """
+        with self.__condition:
+            sequence: int = self.__seek(frame_idx)
+            slot: int = sequence % self.buffer_size
+
+            if self.__last_frame is None:
+                self.__condition.wait_for(
+                    lambda: self.__ring[slot] is not None and self.__ring[slot][0] == sequence,
+                    self.FIRST_FRAME_TIMEOUT
+                )
+
+            if self.__ring[slot] is not None and self.__ring[slot][0] == sequence:
+                self.__last_frame = self.__ring[slot][1]
+            elif self.__last_frame is None:
+                self.__last_frame = pg.Surface(self.size)
+
+            return self.__last_frame
+
+    def resize(self, size: tuple[int, int]) -> None:
+        """
+        Decode upcoming frames at a new size. Frames already buffered are dropped, the
+        last shown frame stays on screen until the worker delivers the first new one.
+        :param size: New frame size.
+        :return: None
+        """
+        with self.__condition:
+            self.size = size
+            self.__ring = [None] * self.buffer_size
+            self.__decoded = self.__position
+            self.__condition.notify_all()
+
+    def close(self) -> None:
+        with self.__condition:
+            self.__running = False
+            self.__ring = [None] * self.buffer_size
+            self.__condition.notify_all()
@@ -3,7 +3,7 @@ from typing import Optional, Callable
 
 import pygame as pg
 from pygame.mixer import Sound
-from pygame import QUIT, KEYDOWN, KEYUP, Surface, MOUSEBUTTONDOWN, MOUSEWHEEL, Rect
+from pygame import QUIT, KEYDOWN, KEYUP, Surface, MOUSEBUTTONDOWN, MOUSEWHEEL, Rect, VIDEORESIZE
 
 from crygeen import audio
 from crygeen.main_menu.menu_animation.menu_player import MenuPlayer
@@ -13,6 +13,8 @@ from crygeen.main_menu.particles import ParticlePlayer
 from crygeen.main_menu.menu_categories.screensaver_menu import ScreensaverMenu
 from crygeen.main_menu.menu_categories.settings_menu import SettingsMenu
 from crygeen.main_menu.saver import SaveLoadManager
+from crygeen.settings import settings
+from crygeen.utils.surface_cache import SurfaceCache
 
 
 class MainMenuSetup:
@@ -22,25 +24,32 @@ class MainMenuSetup:
         self.__main_sound.set_volume(audio.MAIN_MENU_VOLUME)
         self.toggle_music_flag: bool = True
         self.save_load_manager: SaveLoadManager = SaveLoadManager()
+        self.surface_cache: SurfaceCache = SurfaceCache(pg.display.get_window_size(), settings.RESIZE_DEBOUNCE)
 
         # init categories
         self.menu: Menu = Menu()
-        self.exit_menu: ExitMenu = ExitMenu()
-        self.settings_menu: SettingsMenu = SettingsMenu(self.save_load_manager)
-        self.screensaver_menu: ScreensaverMenu = ScreensaverMenu()
+        self.exit_menu: ExitMenu = ExitMenu(self.surface_cache)
+        self.settings_menu: SettingsMenu = SettingsMenu(self.save_load_manager, self.surface_cache)
+        self.screensaver_menu: ScreensaverMenu = ScreensaverMenu(self.surface_cache)
         self.menu_player: MenuPlayer = MenuPlayer(
             self.menu, self.exit_menu, self.settings_menu, self.screensaver_menu
         )
 
         self.fps: Optional[int] = None
 
-        pg.event.set_allowed([QUIT, KEYDOWN, KEYUP, MOUSEBUTTONDOWN, MOUSEWHEEL])
+        pg.event.set_allowed([QUIT, KEYDOWN, KEYUP, MOUSEBUTTONDOWN, MOUSEWHEEL, VIDEORESIZE])
 
     def __simple_toggle_music(self) -> None:
         if self.toggle_music_flag:
             self.__main_sound.play(loops=audio.MAIN_MENU_LOOPS)
             self.toggle_music_flag: bool = False
 
+    def __resize(self) -> None:
+        if self.surface_cache.update():
+            self.screensaver_menu.resize()
+            self.menu_player.resize()
+
     def run_menu(self) -> None:
         self.__simple_toggle_music()
+        self.__resize()
         self.menu_player.update()
@@ -2,7 +2,7 @@ import math
 import operator
 from collections import namedtuple
 from functools import wraps
-from typing import Callable
+from typing import Callable, Optional
 
 import pygame as pg
 from pygame import Surface, Rect
@@ -42,11 +42,25 @@ class MenuPlayer:
         self.active_load_game_menu: bool = False
         self.active_new_game_menu: bool = False
 
+        # areas of the display changed this frame, None for the whole display
+        self.dirty_rects: Optional[list[Rect]] = None
+
         # init properties
         self.properties = AnimationProperty(
             self.menu, self.settings_menu, self.screensaver_menu, self.exit_menu
         ).properties
 
+    def resize(self) -> None:
+        """
+        Rebuild the animation properties after a committed window resize, they hold
+        the fade surfaces and text positions of the old size.
+        :return: None
+        """
+        self.display_surface: Surface = pg.display.get_surface()
+        self.properties = AnimationProperty(
+            self.menu, self.settings_menu, self.screensaver_menu, self.exit_menu
+        ).properties
+
     def start_screensaver(self) -> None:
         # get animation_start_time for screensaver
         if not self.screensaver_menu.flag:
@@ -55,12 +69,19 @@ class MenuPlayer:
 
         # render main bg
         self.screensaver_menu.frame_idx = (self.screensaver_menu.frame_idx + 1) % self.screensaver_menu.count_frames
-        self.display_surface.blit(self.screensaver_menu.bg_data[self.screensaver_menu.frame_idx], (0, 0))
+        frame: Surface = self.screensaver_menu.get_frame(self.screensaver_menu.frame_idx)
+        self.dirty_rects = self.__get_screensaver_dirty_rects()
 
-        # render effect
-        self.animation.alpha_vanish(
-            *self.properties['screensaver_start--alpha_vanish'], self.screensaver_menu.animation_start_time
-        )
+        if self.dirty_rects is None:
+            self.display_surface.blit(frame, (0, 0))
+
+            # render effect
+            self.animation.alpha_vanish(
+                *self.properties['screensaver_start--alpha_vanish'], self.screensaver_menu.animation_start_time
+            )
+        else:
+            # only restore what changed, the fade is over and has nothing to add
+            self.display_surface.blits([(frame, rect, rect) for rect in self.dirty_rects], doreturn=False)
 
         # show start text
         if self.status == Status.SCREENSAVER:
@@ -73,6 +94,24 @@ class MenuPlayer:
                 *draw_text_decorator(*self.properties['screensaver_start--text_decoration'])
             )
 
+    def __get_screensaver_dirty_rects(self) -> Optional[list[Rect]]:
+        """
+        Partial redraw is only possible on the bare screensaver: the background reports
+        the changed areas, no menu is drawn on top and the fade has reached its end.
+        The text area is always redrawn because the text keeps pulsing.
+        :return: Areas to redraw or None to redraw the whole display.
+        """
+        if self.status != Status.SCREENSAVER or self.screensaver_menu.dirty_rects is None:
+            return None
+
+        delta: int = pg.time.get_ticks() - self.screensaver_menu.animation_start_time
+        if delta < self.screensaver_menu.alpha_vanish_duration:
+            return None
+
+        # fix the fade at its end value, it may have stopped a step before
+        self.screensaver_menu.fade_surf.set_alpha(self.screensaver_menu.end_alpha_vanish_opacity)
+        return [*self.screensaver_menu.dirty_rects, self.screensaver_menu.text_rect]
+
     def start_menu(self) -> None:
         if self.status != Status.SCREENSAVER:
 
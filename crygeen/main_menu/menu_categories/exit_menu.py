@@ -7,18 +7,18 @@ from pygame.font import Font
 from crygeen.main_menu.buttons import Button
 from crygeen.main_menu.states import Status
 from crygeen.settings import settings
+from crygeen.utils.surface_cache import SurfaceCache
 
 
 class ExitMenu:
-    def __init__(self) -> None:
+    def __init__(self, surface_cache: SurfaceCache) -> None:
         # general setup
         self.buttons_list: list[Button] = []
         self.exit_list: dict[str, dict[str, Status | str]] = settings.EXIT_LIST
-        self.screen_size: tuple[int, int] = pg.display.get_window_size()
+        self.surface_cache: SurfaceCache = surface_cache
 
         # animation setup
         self.animation_start_time: int = 0
-        self.fade_surf: Surface = pg.Surface(self.screen_size)
         self.start_alpha_vanish_opacity: int = settings.EXIT_START_ALPHA_VANISH_OPACITY
         self.end_alpha_vanish_opacity: int = settings.EXIT_END_ALPHA_VANISH_OPACITY
         self.alpha_vanish_duration: int = settings.EXIT_ALPHA_VANISH_DURATION
@@ -49,6 +49,10 @@ class ExitMenu:
         self.__create_exit_buttons()
         self.exit_close_y: list[int] = settings.EXIT_CLOSE_Y * len(self.buttons_list)
 
+    @property
+    def fade_surf(self) -> Surface:
+        return self.surface_cache.get('exit_fade', pg.Surface)
+
     def __create_exit_buttons(self) -> None:
         y: int = self.button_start_y
         x_coords: tuple[int, int] = self.button_x
@@ -1,24 +1,29 @@
 import math
 from functools import wraps
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterable, Optional
 
 import pygame as pg
 from pygame import Surface, Rect
 from pygame.font import Font
 
+from crygeen.main_menu.delta_animation import DeltaAnimation
+from crygeen.main_menu.frame_stream import FrameStream
 from crygeen.settings import settings
-from crygeen.utils.support import import_folder_img
+from crygeen.utils.exceptions import FramePackError
+from crygeen.utils.frame_pack import FramePack
+from crygeen.utils.support import import_folder_img_parallel, import_folder_paths, import_img
+from crygeen.utils.surface_cache import SurfaceCache
 
 
 class ScreensaverMenu:
-    def __init__(self):
+    def __init__(self, surface_cache: SurfaceCache):
         # general setup
-        self.screen_size: tuple[int, int] = pg.display.get_window_size()
+        self.screen_size: tuple[int, int] = pg.display.get_window_size()  # size the frames are loaded at
+        self.surface_cache: SurfaceCache = surface_cache
 
         # bg opacity effect
         self.flag: bool = False
-        self.fade_surf: Surface = pg.Surface(self.screen_size)
         self.fade_surf.set_alpha(255)
         self.dropdown_start_time: int = 0
         self.alpha_vanish_duration: int = settings.SCREENSAVER_ALPHA_VANISH_DURATION
@@ -32,8 +37,15 @@ class ScreensaverMenu:
 
         # screensaver bg
         self.bg_path: Path = settings.SCREENSAVER_PATH
-        self.bg_data: list[Surface] = self.__load_screensaver_data()
-        self.count_frames: int = len(self.bg_data)
+        self.load_mode: str = settings.SCREENSAVER_LOAD_MODE
+        self.bg_pack_path: Path = settings.SCREENSAVER_PACK_PATH
+        self.bg_data: list[Surface] = []
+        self.bg_stream: Optional[FrameStream] = None
+        self.bg_pack: Optional[FramePack] = None
+        self.bg_delta: Optional[DeltaAnimation] = None
+        self.__load_background()
+        animation: Optional[DeltaAnimation | FrameStream] = self.bg_delta or self.bg_stream
+        self.count_frames: int = animation.count_frames if animation else len(self.bg_data)
         self.frame_idx: int = 0
 
         # screensaver text
@@ -42,16 +54,108 @@ class ScreensaverMenu:
         self.font: Font = pg.font.Font(settings.SCREENSAVER_FONT, self.font_size)
         self.text_x: int = self.screen_size[0] // 2 or settings.SCREENSAVER_TEXT_X
         self.text_y: int = settings.SCREENSAVER_TEXT_Y
+        self.text_rect: Rect = Rect((0, 0), self.font.size(self.text))
+        self.text_rect.center = (self.text_x, self.text_y)
+
+    @property
+    def fade_surf(self) -> Surface:
+        return self.surface_cache.get('screensaver_fade', pg.Surface)
+
+    def resize(self) -> None:
+        """
+        Follow a committed window resize: move the text and let the stream decode
+        upcoming frames at the new size. Preloaded frames are rescaled lazily in get_frame.
+        :return: None
+        """
+        width, height = self.surface_cache.size
+        self.text_x: int = width // 2
+        self.text_y: int = settings.SCREENSAVER_TEXT_Y * height // settings.SCREEN_HEIGHT
+        self.text_rect.center = (self.text_x, self.text_y)
+
+        if self.bg_stream:
+            self.bg_stream.resize(self.surface_cache.size)
+
+    def __load_background(self) -> None:
+        """
+        Set up the background frames according to the load mode.
+        'pack' maps a pre-baked frame pack (no decoding at all) and falls back to streaming
+        if the pack is missing, broken or was baked for another screen size.
+        'stream' decodes frames in the background a few steps ahead of playback.
+        'delta' keeps keyframes plus changed-rectangle patches, read from the pack when
+        there is a matching one and decoded from the folder otherwise.
+        'preload' decodes every frame up front.
+        :return: None
+        """
+        if self.load_mode in ('pack', 'delta'):
+            try:
+                self.bg_pack: FramePack = FramePack(self.bg_pack_path)
+            except (FileNotFoundError, FramePackError):
+                self.bg_pack = None
+
+            if self.bg_pack and self.bg_pack.size != self.screen_size:
+                self.bg_pack = None
+
+        if self.load_mode == 'delta':
+            frames: Iterable[Surface] = self.bg_pack.frames if self.bg_pack else (
+                import_img(path, self.screen_size) for path in import_folder_paths(self.bg_path)
+            )
+            self.bg_delta: DeltaAnimation = DeltaAnimation(
+                frames,
+                self.screen_size,
+                settings.SCREENSAVER_KEYFRAME_INTERVAL,
+                settings.SCREENSAVER_DELTA_BLOCK_SIZE,
+                settings.SCREENSAVER_DELTA_TOLERANCE
+            )
+            self.bg_pack = None  # everything is encoded, the mapping is not needed anymore
+        elif self.bg_pack:
+            self.bg_data: list[Surface] = self.bg_pack.frames
+        elif self.load_mode in ('stream', 'pack'):
+            self.bg_stream: FrameStream = FrameStream(
+                import_folder_paths(self.bg_path), self.screen_size, settings.SCREENSAVER_BUFFER_SIZE
+            )
+        else:
+            self.bg_data: list[Surface] = self.__load_screensaver_data()
 
     def __load_screensaver_data(self) -> list[Surface]:
         """
         Create list of screensaver surfaces and optimize size according to screen size.
+        Frames are decoded and scaled on all cores.
         :return: List of surfaces needed for animation.
         """
-        screensaver_data: list[Surface] = import_folder_img(self.bg_path)
+        return import_folder_img_parallel(
+            self.bg_path, self.screen_size, workers=settings.SCREENSAVER_DECODE_WORKERS or None
+        )
+
+    def get_frame(self, frame_idx: int) -> Surface:
+        """
+        Return the background frame with the given index, either from the preloaded
+        list (or mapped pack), the streaming ring buffer or the delta canvas.
+        :param frame_idx: Index of the frame.
+        :return: Frame surface scaled to the screen size.
+        """
+        if self.bg_delta:
+            frame: Surface = self.bg_delta.get_frame(frame_idx)
+        elif self.bg_stream:
+            frame: Surface = self.bg_stream.get_frame(frame_idx)
+        else:
+            frame: Surface = self.bg_data[frame_idx]
+
+        size: tuple[int, int] = self.surface_cache.size
+        if frame.get_size() == size:
+            return frame
 
-        screensaver_scale_data: list[Surface] = [
-            pg.transform.scale(item, self.screen_size) for item in screensaver_data
-        ]
+        # the window was resized: static frames are rescaled once per size, the delta canvas
+        # changes every frame and streamed frames catch up with the new size on their own
+        if self.bg_data:
+            return self.surface_cache.get(('screensaver_bg', frame_idx), lambda _: pg.transform.scale(frame, size))
+        return pg.transform.scale(frame, size)
 
-        return screensaver_scale_data
+    @property
+    def dirty_rects(self) -> Optional[list[Rect]]:
+        """
+        Areas of the background that changed with the last get_frame call.
+        None if the load mode does not track changes and the whole frame must be redrawn.
+        """
+        if self.bg_delta and self.bg_delta.size == self.surface_cache.size:
+            return self.bg_delta.dirty_rects
+        return None
@@ -7,13 +7,14 @@ from crygeen.main_menu.buttons import LinkedList, Button, ControlButton
 from crygeen.controls import Control, Key
 from crygeen.main_menu.saver import SaveLoadManager
 from crygeen.settings import settings
+from crygeen.utils.surface_cache import SurfaceCache
 
 
 class SettingsMenu:
-    def __init__(self, save_load_manager: SaveLoadManager) -> None:
+    def __init__(self, save_load_manager: SaveLoadManager, surface_cache: SurfaceCache) -> None:
         # general setup
-        self._screen_size: tuple[int, int] = pg.display.get_window_size()
         self._save_load_manager: SaveLoadManager = save_load_manager
+        self.surface_cache: SurfaceCache = surface_cache
 
         # font setup
         self.font_name: Path = settings.MAIN_MENU_FONT
@@ -23,7 +24,6 @@ class SettingsMenu:
         self.alpha: int = settings.MAIN_MENU_ALPHA
 
         # settings effects
-        self.fade_surf: Surface = pg.Surface(self._screen_size)
         self.fade_surf.set_alpha(0)
         self.animation_start_time: int = 0
         self.alpha_vanish_duration: int = settings.SETTINGS_ALPHA_VANISH_DURATION
@@ -53,6 +53,10 @@ class SettingsMenu:
         self.control_close_y: list[int] = settings.CONTROL_CLOSE_Y * len(self.buttons_list)
         self.control_buttons_list: list[ControlButton] = [button.control_button for button in self.buttons_list]
 
+    @property
+    def fade_surf(self) -> Surface:
+        return self.surface_cache.get('settings_fade', pg.Surface)
+
     def __create_settings_buttons(self) -> None:
         x: int = self.control_x
         y, y_offset = self.control_y, self.control_y_offset
@@ -23,9 +23,11 @@ class Settings(BaseSettings):
     # MENU_CURSOR: Path = BASE_PATH.joinpath('assets', 'graphics', 'cursor', 'cursor_white.png')
     MENU_FPS: int = 40
     GAME_FPS: int = 60
+    RESIZE_DEBOUNCE: int = 250  # ms the window size must stay unchanged before surfaces are rebuilt
 
     SAVE_LOAD_BASE_PATH: Path = BASE_PATH.joinpath('data')
     CONTROL_DATA_PATH: Path = SAVE_LOAD_BASE_PATH.joinpath('control', 'control_data.json')
+    CACHE_PATH: Path = SAVE_LOAD_BASE_PATH.joinpath('cache')
 
     # main main_menu setup _______________________________________________________________________________
     MAIN_MENU_LIST: dict[str, dict[str, Status | str]] = {
@@ -54,6 +56,13 @@ class Settings(BaseSettings):
 
     # screensaver setup _____________________________________________________________________________
     SCREENSAVER_PATH: Path = BASE_PATH.joinpath('assets', 'graphics', 'screensaver')
+    SCREENSAVER_LOAD_MODE: str = 'stream'  # 'preload' | 'stream' | 'pack' | 'delta'
+    SCREENSAVER_BUFFER_SIZE: int = 16  # frames decoded ahead in 'stream' mode
+    SCREENSAVER_DECODE_WORKERS: int = 0  # 'preload' mode, 0 = one per CPU
+    SCREENSAVER_PACK_PATH: Path = CACHE_PATH.joinpath('screensaver.pack')  # see crygeen/utils/frame_pack.py
+    SCREENSAVER_KEYFRAME_INTERVAL: int = 30  # 'delta' mode, a full frame every n frames
+    SCREENSAVER_DELTA_BLOCK_SIZE: int = 32  # 'delta' mode, side of the compared squares in pixels
+    SCREENSAVER_DELTA_TOLERANCE: int = 24  # 'delta' mode, channel difference ignored as noise
     SCREENSAVER_ALPHA_OFFSET: float = .5
     SCREENSAVER_FONT: Path = BASE_PATH.joinpath('assets', 'graphics', 'font', 'AlumniSansInlineOne-italic.ttf')
     SCREENSAVER_FONT_SIZE: int = 45
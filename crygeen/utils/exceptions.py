@@ -3,3 +3,10 @@ class WrongEventType(Exception):
         self.message = message
         self.event_type = event_type
         super().__init__(self.message)
+
+
+class FramePackError(Exception):
+    def __init__(self, path, message='invalid frame pack'):
+        self.message = f'{message}: {path}'
+        self.path = path
+        super().__init__(self.message)
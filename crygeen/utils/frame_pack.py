@@ -0,0 +1,145 @@
+"""
+Pre-baked frame pack.
+
+A frame pack is a single raw file with every frame of a folder animation already decoded
+and scaled to one resolution and pixel format:
+
+    header  <4sHHHBI>  magic, version, width, height, pixel format code, frame count
+    index   <Q> * n    byte offset of every frame
+    frames  raw pixels, each frame starts on a PACK_ALIGN boundary
+
+FramePack mmaps the file and wraps each frame into a Surface straight from the mapped
+bytes, so loading costs a page-in instead of decoding, and the OS page cache shares
+the data between runs.
+
+Build the screensaver pack with:
+
+    python -m crygeen.utils.frame_pack --size 1280x760
+
+The default BGRA has the byte order of a 32-bit display surface, so frames are blitted
+without a conversion. RGB packs are smaller but converted on every blit.
+"""
+import argparse
+import mmap
+import os
+import struct
+from pathlib import Path
+
+import pygame as pg
+from pygame import Surface
+
+from crygeen.settings import settings
+from crygeen.utils.exceptions import FramePackError
+from crygeen.utils.support import import_folder_paths
+
+PACK_MAGIC: bytes = b'CRFP'
+PACK_VERSION: int = 1
+PACK_HEADER: struct.Struct = struct.Struct('<4sHHHBI')
+PACK_INDEX: struct.Struct = struct.Struct('<Q')
+PACK_ALIGN: int = 64
+
+# pixel format name -> bytes per pixel, the position is the format code stored in the header
+PIXEL_FORMATS: dict[str, int] = {'RGB': 3, 'RGBX': 4, 'BGRA': 4}
+
+
+def build_frame_pack(
+        source: Path, pack_path: Path, size: tuple[int, int], pixel_format: str = 'BGRA'
+) -> int:
+    """
+    Decode every image of the source folder, scale it to the given size and write all
+    frames into one raw pack file. The pack is written next to the target and renamed
+    at the end, so a half written pack is never picked up.
+
+    :param source: Folder with the animation frames.
+    :param pack_path: Where to write the pack.
+    :param size: Resolution of the packed frames.
+    :param pixel_format: One of PIXEL_FORMATS.
+    :return: Number of packed frames.
+    """
+    if pixel_format not in PIXEL_FORMATS:
+        raise ValueError(f'pixel_format must be one of {list(PIXEL_FORMATS)}')
+
+    frame_paths: list[Path] = import_folder_paths(source)
+    frame_bytes: int = size[0] * size[1] * PIXEL_FORMATS[pixel_format]
+    frame_stride: int = -(-frame_bytes // PACK_ALIGN) * PACK_ALIGN
+    data_start: int = -(-(PACK_HEADER.size + PACK_INDEX.size * len(frame_paths)) // PACK_ALIGN) * PACK_ALIGN
+
+    pack_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path: Path = pack_path.with_suffix(pack_path.suffix + '.tmp')
+    with open(tmp_path, 'wb') as file:
+        file.write(PACK_HEADER.pack(
+            PACK_MAGIC, PACK_VERSION, *size, list(PIXEL_FORMATS).index(pixel_format), len(frame_paths)
+        ))
+        for index in range(len(frame_paths)):
+            file.write(PACK_INDEX.pack(data_start + index * frame_stride))
+
+        for index, frame_path in enumerate(frame_paths):
+            frame: Surface = pg.image.load(frame_path)
+            frame: Surface = pg.transform.smoothscale(frame, size) \
+                if frame.get_bitsize() >= 24 \
+                else pg.transform.scale(frame, size)
+            file.seek(data_start + index * frame_stride)
+            file.write(pg.image.tobytes(frame, pixel_format))
+        file.truncate(data_start + len(frame_paths) * frame_stride)
+
+    tmp_path.replace(pack_path)
+    return len(frame_paths)
+
+
+class FramePack:
+    def __init__(self, pack_path: Path) -> None:
+        """
+        Map a frame pack into memory. Nothing is decoded or copied here, pages are read
+        in lazily the first time a frame is blitted.
+
+        :param pack_path: Path to a pack made by build_frame_pack.
+        """
+        self.pack_path: Path = pack_path
+
+        with open(self.pack_path, 'rb') as file:
+            # an empty file can't be mapped at all
+            if os.fstat(file.fileno()).st_size < PACK_HEADER.size:
+                raise FramePackError(self.pack_path)
+            self.__mmap: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, width, height, format_code, count = PACK_HEADER.unpack_from(self.__mmap)
+        if magic != PACK_MAGIC or version != PACK_VERSION or format_code >= len(PIXEL_FORMATS):
+            raise FramePackError(self.pack_path)
+        if PACK_HEADER.size + count * PACK_INDEX.size > len(self.__mmap):
+            raise FramePackError(self.pack_path, 'truncated frame pack')
+
+        self.size: tuple[int, int] = (width, height)
+        self.pixel_format: str = list(PIXEL_FORMATS)[format_code]
+        self.count_frames: int = count
+
+        frame_bytes: int = width * height * PIXEL_FORMATS[self.pixel_format]
+        view: memoryview = memoryview(self.__mmap)
+        self.frames: list[Surface] = []
+        for index in range(count):
+            offset: int = PACK_INDEX.unpack_from(self.__mmap, PACK_HEADER.size + index * PACK_INDEX.size)[0]
+            if offset + frame_bytes > len(self.__mmap):
+                raise FramePackError(self.pack_path, 'truncated frame pack')
+            frame: Surface = pg.image.frombuffer(view[offset:offset + frame_bytes], self.size, self.pixel_format)
+            if self.pixel_format == 'BGRA':
+                frame.set_alpha(None)  # the frames are opaque, copy them instead of blending
+            self.frames.append(frame)
+
+    def get_frame(self, frame_idx: int) -> Surface:
+        return self.frames[frame_idx]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Bake the screensaver frames into a raw frame pack.')
+    parser.add_argument('--source', type=Path, default=settings.SCREENSAVER_PATH)
+    parser.add_argument('--output', type=Path, default=settings.SCREENSAVER_PACK_PATH)
+    parser.add_argument('--size', default=f'{settings.SCREEN_WIDTH}x{settings.SCREEN_HEIGHT}', help='WIDTHxHEIGHT')
+    parser.add_argument('--format', default='BGRA', choices=list(PIXEL_FORMATS))
+    args = parser.parse_args()
+
+    size: tuple[int, int] = tuple(map(int, args.size.lower().split('x')))  # type: ignore
+    count: int = build_frame_pack(args.source, args.output, size, args.format)
+    print(f'{count} frames packed into {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,19 @@
 import functools
 from _csv import reader
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from os import walk
 from pathlib import Path
+from typing import Optional
 
 import pygame as pg
+from PIL import Image
 from pydantic import FilePath, BaseModel, validator
 from pygame import Surface
 
+JPEG_SUFFIXES: tuple[str, ...] = ('.jpg', '.jpeg')
+IMAGE_SUFFIXES: tuple[str, ...] = (*JPEG_SUFFIXES, '.png', '.bmp', '.gif', '.tga', '.webp')
+
 
 class FolderPath(BaseModel):
     path: FilePath
@@ -28,15 +35,100 @@ def import_csv_layout(path: str):
         return terrain_map
 
 
-def import_folder_img(path: FolderPath | Path, *, scale: bool = False) -> list[Surface]:
-    surface_list: list = []
+def import_folder_paths(path: FolderPath | Path) -> list[Path]:
+    """
+    Collect the image files of a folder in alphabetical order, other files (.DS_Store,
+    Thumbs.db, ...) are skipped.
+    :param path: Folder with images.
+    :return: Sorted list of image paths.
+    """
     path: Path = Path(path) if isinstance(path, str) else path
-    for image in sorted(path.iterdir()):
-        if image.is_file():
-            image_surface: Surface = pg.image.load(image).convert_alpha() \
-                if image.suffix == '.png' \
-                else pg.image.load(image).convert()
-            surface_list.append(image_surface)
+    return [image for image in sorted(path.iterdir()) if image.is_file() and image.suffix.lower() in IMAGE_SUFFIXES]
+
+
+def import_img(path: Path, size: Optional[tuple[int, int]] = None) -> Surface:
+    """
+    Load a single image and convert it to the display pixel format.
+    Safe to call from a worker thread once the display mode is set.
+    A JPEG at least twice as large as the target size goes through decode_img, so it is
+    decoded at reduced resolution instead of being decoded in full and scaled down.
+    :param path: Image path.
+    :param size: Scale the image to this size if given.
+    :return: Converted surface.
+    """
+    if size and path.suffix.lower() in JPEG_SUFFIXES:
+        with Image.open(path) as image:  # reads the header only
+            reducible: bool = image.width >= size[0] * 2 and image.height >= size[1] * 2
+        if reducible:
+            pixels, image_size, mode = decode_img(path, size)
+            return pg.image.frombuffer(pixels, image_size, mode).convert()
+
+    image_surface: Surface = pg.image.load(path).convert_alpha() \
+        if path.suffix.lower() == '.png' \
+        else pg.image.load(path).convert()
+    if size and image_surface.get_size() != tuple(size):
+        image_surface: Surface = pg.transform.scale(image_surface, size)
+    return image_surface
+
+
+def import_folder_img(
+        path: FolderPath | Path, *, scale: bool = False, size: Optional[tuple[int, int]] = None
+) -> list[Surface]:
+    """
+    Import a folder of images.
+    :param path: Folder with images.
+    :param scale: Not used.
+    :param size: Scale every image to this size if given, JPEGs are decoded directly at a
+                 reduced resolution when the size is smaller than the image.
+    :return: List of converted surfaces in alphabetical order of the files.
+    """
+    return [import_img(image, size) for image in import_folder_paths(path)]
+
+
+def decode_img(path: Path, size: Optional[tuple[int, int]] = None) -> tuple[bytes, tuple[int, int], str]:
+    """
+    Decode an image into raw pixels with Pillow. Does not touch pygame, so it can run in a
+    worker thread (Pillow releases the GIL while decoding and resampling) or in a worker process.
+    A JPEG is decoded at the smallest reduced resolution that still covers the target size,
+    only a cheap final resample is left after that.
+    :param path: Image path.
+    :param size: Scale the image to this size if given.
+    :return: Raw pixels, their size and pixel format ('RGB' or 'RGBA').
+    """
+    with Image.open(path) as image:
+        if size:
+            # JPEG only: DCT scaling to the smallest 1/1..1/8 scale that is still >= size
+            image.draft('RGB', tuple(size))
+        image: Image.Image = image.convert('RGBA' if path.suffix.lower() == '.png' else 'RGB')
+        if size and image.size != tuple(size):
+            image: Image.Image = image.resize(size, Image.Resampling.NEAREST)  # same as pg.transform.scale
+        return image.tobytes(), image.size, image.mode
+
+
+def import_folder_img_parallel(
+        path: FolderPath | Path,
+        size: Optional[tuple[int, int]] = None,
+        *,
+        workers: Optional[int] = None,
+        processes: bool = False
+) -> list[Surface]:
+    """
+    Bulk version of import_folder_img. Decoding and scaling are fanned out to a pool,
+    the main thread only wraps the returned pixels into converted surfaces.
+    :param path: Folder with images.
+    :param size: Scale every image to this size if given.
+    :param workers: Pool size, the number of CPUs if None.
+    :param processes: Use a process pool instead of a thread pool.
+    :return: List of converted surfaces in alphabetical order of the files.
+    """
+    executor_class: type[Executor] = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    image_paths: list[Path] = import_folder_paths(path)
+
+    surface_list: list[Surface] = []
+    with executor_class(max_workers=workers) as executor:
+        for pixels, image_size, mode in executor.map(decode_img, image_paths, repeat(size)):
+            image_surface: Surface = pg.image.frombuffer(pixels, image_size, mode)
+            surface_list.append(image_surface.convert_alpha() if mode == 'RGBA' else image_surface.convert())
     return surface_list
 
 
@@ -0,0 +1,153 @@
+from collections import OrderedDict
+from typing import Callable, Hashable, NamedTuple, Optional
+
+import pygame as pg
+from pygame import Surface
+
+
+class SurfaceCache:
+    """
+    Cache for surfaces derived from the window size, such as fade surfaces and
+    backgrounds scaled to the screen.
+
+    Entries are keyed by the window size and are created lazily on first use. A resize is
+    only committed once the window size stopped changing for <debounce> ms, so dragging
+    the window border does not rebuild everything on every pixel. Committing evicts all
+    entries of the old size. A rebuilt surface keeps the alpha of the one it replaces,
+    so fades continue where they were. The alpha is only kept until the next commit, so
+    keys that are never requested again (e.g. frames of an animation) do not pile up.
+    """
+
+    def __init__(self, size: tuple[int, int], debounce: int) -> None:
+        self.size: tuple[int, int] = tuple(size)  # type: ignore
+        self.debounce: int = debounce
+
+        self.__surfaces: dict[tuple[tuple[int, int], Hashable], Surface] = {}
+        self.__evicted_alpha: dict[Hashable, int] = {}
+        self.__pending_size: Optional[tuple[int, int]] = None
+        self.__pending_time: int = 0
+
+    def get(self, key: Hashable, factory: Callable[[tuple[int, int]], Surface]) -> Surface:
+        """
+        Return the surface for the current window size, creating it if needed.
+        :param key: Name of the derived surface.
+        :param factory: Builds the surface from a window size.
+        :return: Cached surface.
+        """
+        entry: tuple[tuple[int, int], Hashable] = (self.size, key)
+        if entry not in self.__surfaces:
+            surface: Surface = factory(self.size)
+            if key in self.__evicted_alpha:
+                surface.set_alpha(self.__evicted_alpha.pop(key))
+            self.__surfaces[entry] = surface
+        return self.__surfaces[entry]
+
+    def request_resize(self, size: tuple[int, int]) -> None:
+        """
+        Remember a new window size, call it for every VIDEORESIZE event.
+        :param size: New window size.
+        :return: None
+        """
+        self.__pending_size = tuple(size)  # type: ignore
+        self.__pending_time = pg.time.get_ticks()
+
+    def update(self) -> bool:
+        """
+        Commit the pending window size once the debounce time has passed.
+        :return: True if the size changed and everything derived from it must be refreshed.
+        """
+        if self.__pending_size is None or pg.time.get_ticks() - self.__pending_time < self.debounce:
+            return False
+
+        size, self.__pending_size = self.__pending_size, None
+        if size == self.size:
+            return False
+
+        evicted_alpha: dict[Hashable, int] = {}
+        for entry in [entry for entry in self.__surfaces if entry[0] != size]:
+            alpha: Optional[int] = self.__surfaces.pop(entry).get_alpha()
+            if alpha is not None:
+                evicted_alpha[entry[1]] = alpha
+        self.__evicted_alpha = evicted_alpha
+        self.size = size
+        return True
+
+    def __len__(self) -> int:
+        return len(self.__surfaces)
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    resident_bytes: int
+    entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / (self.hits + self.misses) if self.hits + self.misses else 0.0
+
+
+class LRUSurfaceCache:
+    """
+    Surface cache bounded by the memory its surfaces take.
+
+    Once the resident pixel data exceeds <budget> bytes, the least recently used surfaces
+    are dropped until the cache fits again. The newest surface always stays, even if it
+    alone is larger than the budget. Only get() counts as a lookup in the stats, so the
+    hit rate reflects how often a wanted surface had to be rendered again.
+    """
+
+    def __init__(self, budget: int) -> None:
+        self.budget: int = budget
+
+        self.__surfaces: OrderedDict[Hashable, Surface] = OrderedDict()
+        self.__resident_bytes: int = 0
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__evictions: int = 0
+
+    @staticmethod
+    def surface_bytes(surface: Surface) -> int:
+        return surface.get_pitch() * surface.get_height()
+
+    def get(self, key: Hashable) -> Optional[Surface]:
+        surface: Optional[Surface] = self.__surfaces.get(key)
+        if surface is None:
+            self.__misses += 1
+            return None
+        self.__hits += 1
+        self.__surfaces.move_to_end(key)
+        return surface
+
+    def __getitem__(self, key: Hashable) -> Surface:
+        self.__surfaces.move_to_end(key)
+        return self.__surfaces[key]
+
+    def __setitem__(self, key: Hashable, surface: Surface) -> None:
+        if key in self.__surfaces:
+            self.__resident_bytes -= self.surface_bytes(self.__surfaces.pop(key))
+        self.__surfaces[key] = surface
+        self.__resident_bytes += self.surface_bytes(surface)
+
+        while self.__resident_bytes > self.budget and len(self.__surfaces) > 1:
+            _, evicted = self.__surfaces.popitem(last=False)
+            self.__resident_bytes -= self.surface_bytes(evicted)
+            self.__evictions += 1
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.__surfaces
+
+    def items(self) -> list[tuple[Hashable, Surface]]:
+        return list(self.__surfaces.items())
+
+    def __len__(self) -> int:
+        return len(self.__surfaces)
+
+    def clear(self) -> None:
+        self.__surfaces.clear()
+        self.__resident_bytes = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(self.__hits, self.__misses, self.__evictions, self.__resident_bytes, len(self.__surfaces))
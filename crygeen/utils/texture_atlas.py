@@ -0,0 +1,135 @@
+"""
+Texture atlas.
+
+Packs many small images into a few large converted page surfaces. Every image becomes a
+named region of a page, drawn either through a subsurface or by blitting the page with
+the region as area. Consecutive draws then read from one block of memory, and a whole
+batch of them can go to Surface.blits in one call.
+
+Atlases are packed at startup. Building the blade and player sprite sheet atlases takes
+about 20 ms each, only a little more than loading stored pages would, so atlases are
+not stored on disk.
+"""
+from typing import Optional
+
+import pygame as pg
+from pygame import Rect, Surface
+
+ATLAS_PAGE_SIZE: tuple[int, int] = (1024, 1024)
+
+
+def pack_rects(
+        sizes: list[tuple[int, int]], page_size: tuple[int, int] = ATLAS_PAGE_SIZE, padding: int = 1
+) -> list[tuple[int, int, int]]:
+    """
+    Shelf packing: the rects are sorted by height and placed left to right in rows, a row
+    as high as its first rect, and a new page is started when a page is full.
+    :param sizes: Sizes of the rects.
+    :param page_size: Size of a page.
+    :param padding: Free pixels between the rects.
+    :return: Page, x and y of every rect, in the order of sizes.
+    """
+    positions: list[Optional[tuple[int, int, int]]] = [None] * len(sizes)
+    page: int = 0
+    x: int = 0
+    y: int = 0
+    row_height: int = 0
+    for index in sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0])):
+        width, height = sizes[index]
+        if width > page_size[0] or height > page_size[1]:
+            raise ValueError(f'rect of size {sizes[index]} does not fit a page of size {page_size}')
+
+        if x + width > page_size[0]:
+            x, y, row_height = 0, y + row_height, 0
+        if y + height > page_size[1]:
+            page, x, y, row_height = page + 1, 0, 0, 0
+
+        positions[index] = (page, x, y)
+        x += width + padding
+        row_height = max(row_height, height + padding)
+    return positions  # noqa
+
+
+class TextureAtlas:
+    def __init__(
+            self, pages: list[Surface], regions: dict[str, tuple[int, Rect]], colorkey: Optional[tuple] = None
+    ) -> None:
+        """
+
+        :param pages: Page surfaces.
+        :param regions: Name -> page index and area of the image on the page.
+        :param colorkey: Colorkey of the pages, None for pages with per pixel alpha.
+        """
+        self.pages: list[Surface] = pages
+        self.regions: dict[str, tuple[int, Rect]] = regions
+        self.colorkey: Optional[tuple] = colorkey
+
+    @classmethod
+    def pack(
+            cls,
+            images: dict[str, Surface],
+            colorkey: Optional[tuple] = None,
+            page_size: tuple[int, int] = ATLAS_PAGE_SIZE,
+            padding: int = 1
+    ) -> 'TextureAtlas':
+        """
+        Pack images into new pages. Needs the display mode to be set.
+        :param images: Name -> image.
+        :param colorkey: Make opaque pages with this colorkey, for images that use it as
+                         background. Pages with per pixel alpha if None.
+        :param page_size: Largest size of a page, pages are cropped to their content.
+        :param padding: Free pixels between the images.
+        :return: Packed atlas.
+        """
+        names: list[str] = list(images)
+        positions: list[tuple[int, int, int]] = pack_rects(
+            [images[name].get_size() for name in names], page_size, padding
+        )
+
+        page_sizes: list[list[int]] = [[0, 0] for _ in range(max((page for page, _, _ in positions), default=-1) + 1)]
+        for name, (page, x, y) in zip(names, positions):
+            page_sizes[page][0] = max(page_sizes[page][0], x + images[name].get_width())
+            page_sizes[page][1] = max(page_sizes[page][1], y + images[name].get_height())
+        pages: list[Surface] = [cls.__new_page(tuple(size), colorkey) for size in page_sizes]
+
+        regions: dict[str, tuple[int, Rect]] = {}
+        for name, (page, x, y) in zip(names, positions):
+            if colorkey is None:
+                pages[page].blit(images[name], (x, y), special_flags=pg.BLEND_RGBA_MAX)  # copy, no blending
+            else:
+                pages[page].blit(images[name], (x, y))
+            regions[name] = (page, Rect((x, y), images[name].get_size()))
+        return cls(pages, regions, colorkey)
+
+    @staticmethod
+    def __new_page(size: tuple[int, int], colorkey: Optional[tuple]) -> Surface:
+        if colorkey is None:
+            page: Surface = pg.Surface(size, pg.SRCALPHA).convert_alpha()
+            page.fill((0, 0, 0, 0))
+        else:
+            page: Surface = pg.Surface(size).convert()
+            page.fill(colorkey)
+            page.set_colorkey(colorkey)
+        return page
+
+    def area(self, name: str) -> tuple[Surface, Rect]:
+        """
+        :param name: Name of the image.
+        :return: Page and area of the image, for Surface.blit(page, position, area).
+        """
+        page, area = self.regions[name]
+        return self.pages[page], area
+
+    def subsurface(self, name: str) -> Surface:
+        """
+        :param name: Name of the image.
+        :return: Surface sharing its pixels with the page.
+        """
+        page, area = self.regions[name]
+        return self.pages[page].subsurface(area)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.regions
+
+    def __len__(self) -> int:
+        return len(self.regions)
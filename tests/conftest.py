@@ -0,0 +1,12 @@
+import os
+
+import pygame as pg
+import pytest
+
+
+@pytest.fixture
+def display():
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pg.display.init()
+    yield pg.display.set_mode((64, 32))
+    pg.display.quit()
@@ -0,0 +1,55 @@
+import pygame as pg
+import pytest
+
+from crygeen.game_process.animator import Animator
+from crygeen.game_process.game_settings import gSettings
+from crygeen.game_process.spritesheet import SpriteSheet
+
+
+@pytest.fixture
+def sprite_sheet(display):
+    return SpriteSheet(gSettings.PLAYER_SPRITE_SHEET_PATH, gSettings.PLAYER_SPRITE_METADATA_PATH)
+
+
+class TestAnimator:
+    def test_update(self, sprite_sheet):
+        """
+        1 - test that every entity advances at its own speed
+        2 - test that an animation past its last frame starts over
+        3 - test that a flipped entity shows the mirrored frame
+        """
+        animator = Animator(sprite_sheet, capacity=2)
+        animation_id = sprite_sheet.animations['down']
+        slots = [animator.add(animation_id, speed=speed) for speed in (1, 2, 3)]
+        animator.set_flip(slots[2], True)
+
+        animator.update(1.5)
+        assert animator.get_frame(slots[0]) is sprite_sheet.get_frame(animation_id, 1)        # 1
+        assert animator.get_frame(slots[1]) is sprite_sheet.get_frame(animation_id, 3)
+        animator.set_flip(slots[2], False)
+        assert animator.get_frame(slots[2]) is sprite_sheet.get_frame(animation_id, 0)        # 2
+        animator.set_flip(slots[2], True)
+        assert animator.get_frame(slots[2]) is sprite_sheet.get_frame(animation_id, 0, mirrored=True)  # 3
+
+    def test_draw_list(self, sprite_sheet):
+        """
+        1 - test that entities outside the view are skipped
+        2 - test that the rects are centered on the entities, in screen coordinates
+        3 - test that the entities are sorted back to front
+        4 - test that removed entities are not drawn and their slot is reused
+        """
+        animator = Animator(sprite_sheet)
+        animation_id = sprite_sheet.animations['down_idle']
+        animator.add(animation_id, 1, (150, 180))
+        animator.add(animation_id, 1, (900, 100))
+        back = animator.add(animation_id, 1, (140, 120))
+
+        draw_list = animator.get_draw_list(pg.Rect(100, 100, 200, 150))
+        assert len(draw_list) == 2                                                           # 1
+        frame = sprite_sheet.get_frame(animation_id, 0)
+        assert draw_list[1][1] == frame.get_rect(center=(50, 80))                            # 2
+        assert draw_list[0][1].centery < draw_list[1][1].centery                             # 3
+
+        animator.remove(back)
+        assert len(animator.get_draw_list(pg.Rect(100, 100, 200, 150))) == 1                 # 4
+        assert animator.add(animation_id, 1) == back and len(animator) == 3
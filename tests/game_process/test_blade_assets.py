@@ -0,0 +1,40 @@
+from types import SimpleNamespace
+
+import pygame as pg
+import pytest
+
+from crygeen.game_process.game_settings import gSettings
+from crygeen.game_process.grass_setup.blade_assets import BladeAssets
+
+
+def render_reference(blade: pg.Surface, rotation: float, step: float) -> pg.Surface:
+    snapped: float = min(90, round((max(-90, min(90, rotation)) + 90) / step) * step - 90)
+    rot_img: pg.Surface = pg.transform.rotate(blade, snapped)
+    surf: pg.Surface = pg.Surface((40, 40))
+    surf.fill((40, 80, 120))
+    surf.blit(rot_img, (20 - rot_img.get_width() // 2, 20 - rot_img.get_height() // 2))
+    return surf
+
+
+class TestBladeAssets:
+    @pytest.mark.parametrize('step', [1, 7])
+    @pytest.mark.parametrize('rotation', [-120, -90, -89.6, -3.4, 0, 41, 87, 89, 90, 120])
+    def test_lookup(self, display, monkeypatch, step, rotation):
+        """
+        1 - test that a blade is rendered as the blade rotated by the nearest pre-rotated
+            angle, also at and past the ±90 edges and for a step that does not divide 180
+        2 - test that the batched render draws the same
+        """
+        monkeypatch.setattr(gSettings, 'GRASS_BLADE_ANGLE_STEP', step)
+        blade_assets = BladeAssets(gSettings.GRASS_PATH, SimpleNamespace(shade_amount=0))
+        for blade_id, blade in enumerate(blade_assets.blades):
+            reference: bytes = pg.image.tobytes(render_reference(blade, rotation, step), 'RGB')
+
+            surf = pg.Surface((40, 40))
+            surf.fill((40, 80, 120))
+            blade_assets.render_blade(surf, blade_id, (20, 20), rotation)
+            assert pg.image.tobytes(surf, 'RGB') == reference                       # 1
+
+            surf.fill((40, 80, 120))
+            blade_assets.render_blades(surf, [(blade_id, (20, 20), rotation)])
+            assert pg.image.tobytes(surf, 'RGB') == reference                       # 2
@@ -0,0 +1,19 @@
+import pygame as pg
+
+from crygeen.game_process.camera import Camera
+
+
+class TestCamera:
+    def test_follow(self):
+        """
+        1 - test that the view is centered on the target
+        2 - test that world rects are moved into screen space
+        3 - test that only rects in the view are visible
+        """
+        camera = Camera(pg.Surface((200, 100)))
+        camera.follow(pg.Rect(490, 240, 20, 20))
+        assert camera.view_rect == pg.Rect(400, 200, 200, 100)                  # 1
+        assert camera.apply(pg.Rect(410, 220, 5, 5)) == pg.Rect(10, 20, 5, 5)
+        assert camera.to_screen((450, 250)) == (50, 50)                         # 2
+        assert camera.is_visible(pg.Rect(395, 195, 10, 10))
+        assert not camera.is_visible(pg.Rect(0, 0, 50, 50))                     # 3
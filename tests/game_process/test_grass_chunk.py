@@ -0,0 +1,124 @@
+import pygame as pg
+
+from crygeen.game_process.game_settings import gSettings
+from crygeen.game_process.grass_setup.grass_manager import GrassManager
+from crygeen.game_process.grass_setup.wind import Wind
+
+
+class TestGrassChunk:
+    def test_chunks(self, display):
+        """test that tiles are grouped into chunks of GRASS_CHUNK_SIZE tiles per side"""
+        grass_manager = GrassManager(gSettings.GRASS_PATH)
+        size = gSettings.GRASS_CHUNK_SIZE
+        for pos in [(0, 0), (size - 1, size - 1), (size, 0), (0, size * 2)]:
+            grass_manager.place_tile(pos, 4, [0, 1])
+        assert sorted(grass_manager._chunks) == [(0, 0), (0, 2), (1, 0)]
+
+    def test_render(self, display):
+        """
+        1 - test that a calm chunk is composited once per wind rotation
+        2 - test that a disturbed chunk is rendered tile by tile
+        3 - test that the chunk image matches the tiles rendered on their own
+        """
+        grass_manager = GrassManager(gSettings.GRASS_PATH)
+        grass_manager.place_field([[6] * 3 for _ in range(3)], [0, 1, 2, 3, 4], seed=3)
+        chunk = grass_manager._chunks[(0, 0)]
+        surf = pg.Surface((80, 60))
+
+        for rotation in [0, 2, 2, 0]:
+            grass_manager.update_render(surf, 0, rot_function=lambda x, y: rotation)
+        assert grass_manager.chunk_cache.stats.entries == 2                        # 1
+
+        grass_manager.apply_force((10, 10), 5, 5)
+        assert chunk.disturbed
+        grass_manager.update_render(surf, 0)
+        assert grass_manager.chunk_cache.stats.misses == 2                         # 2
+
+        grass_manager.update_render(surf, 1)
+        chunk_surf = pg.Surface((80, 60))
+        grass_manager.update_render(chunk_surf, 0)
+        tile_surf = pg.Surface((80, 60))
+        for tile in grass_manager._grass_tiles.values():
+            tile.render(tile_surf, 0, (0, 0))
+        assert pg.image.tobytes(chunk_surf, 'RGB') == pg.image.tobytes(tile_surf, 'RGB')  # 3
+
+    def test_prewarm(self, display):
+        """
+        1 - test that prewarm reports progress up to 1
+        2 - test that rendering with the wind only hits the caches afterwards
+        """
+        grass_manager = GrassManager(gSettings.GRASS_PATH)
+        grass_manager.enable_ground_shadows()
+        grass_manager.place_field([[5] * 20 for _ in range(20)], [0, 1, 2], seed=1)
+        wind = Wind()
+
+        progress = list(grass_manager.prewarm(wind))
+        assert progress == sorted(progress) and progress[-1] == 1                 # 1
+
+        misses = {name: stats.misses for name, stats in grass_manager.cache_stats().items()}
+        surf = pg.Surface((200, 200))
+        for _ in range(50):
+            wind.update(0.1)
+            grass_manager.update_render(surf, 0.1, wind=wind)
+        assert {name: stats.misses for name, stats in grass_manager.cache_stats().items()} == misses  # 2
+
+    def test_ground(self, display):
+        """
+        1 - test that the field generation bakes the ground of every chunk
+        2 - test that placing a tile re-bakes the ground of its chunk and the neighbours
+        3 - test that the ground is darker under the blades
+        4 - test that the chunk renderer does not cache tile shadows
+        5 - test that neither does a disturbed chunk rendered tile by tile
+        """
+        grass_manager = GrassManager(gSettings.GRASS_PATH)
+        grass_manager.enable_ground_shadows(shadow_radius=2, shadow_strength=100, shadow_shift=(0, 0))
+        size = gSettings.GRASS_CHUNK_SIZE
+        grass_manager.place_field([[3] * (size + 1)], [0], seed=1)
+        assert all(chunk.ground_baked for chunk in grass_manager._chunks.values())   # 1
+
+        grass_manager.place_tile((0, 1), 3, [0])
+        assert not any(chunk.ground_baked for chunk in grass_manager._chunks.values())  # 2
+
+        surf = pg.Surface((size * gSettings.GRASS_TILE_SIZE, gSettings.GRASS_TILE_SIZE))
+        grass_manager.update_render(surf, 0)
+        chunk = grass_manager._chunks[(0, 0)]
+        ground = chunk._ground
+        blade = chunk.tiles[0].blades[0]
+        assert ground.get_at((int(blade[0][0]), int(blade[0][1]))) != gSettings.GROUND_COLOR  # 3
+        assert not len(grass_manager.shadow_cache)                                      # 4
+
+        grass_manager.apply_force(chunk.tiles[0].loc, 1, 1)
+        assert chunk.disturbed
+        grass_manager.update_render(surf, 0)
+        assert not len(grass_manager.shadow_cache)                                      # 5
+
+    def test_lod(self, display):
+        """
+        1 - test that distant chunks are rendered at a lower level of detail with fewer blades
+        2 - test that a disturbed chunk at a lower level of detail still uses its cached image
+        3 - test that a render over the time budget moves all chunks a level down
+        """
+        grass_manager = GrassManager(gSettings.GRASS_PATH)
+        size = gSettings.GRASS_CHUNK_SIZE
+        far = grass_manager._lod_distances[0] // (size * gSettings.GRASS_TILE_SIZE) + 1
+        grass_manager.place_tile((0, 0), 20, [0])
+        grass_manager.place_tile((far * size, 0), 20, [0])
+        near_chunk, far_chunk = grass_manager._chunks[(0, 0)], grass_manager._chunks[(far, 0)]
+        surf = pg.Surface(((far + 1) * size * gSettings.GRASS_TILE_SIZE, gSettings.GRASS_TILE_SIZE))
+
+        grass_manager.update_render(surf, 0, focus=near_chunk.center)
+        keys = [key for key, _ in grass_manager.chunk_cache.items()]
+        assert (near_chunk.loc, 1, 0, 0) in keys and (far_chunk.loc, 1, 0, 1) in keys      # 1
+        assert pg.mask.from_surface(far_chunk.get_cached_image(1)).count() < \
+               pg.mask.from_surface(far_chunk.get_cached_image(0)).count()
+
+        grass_manager.apply_force(far_chunk.tiles[0].loc, 10, 10)
+        assert far_chunk.disturbed
+        misses = grass_manager.chunk_cache.stats.misses
+        grass_manager.update_render(surf, 0, focus=near_chunk.center)
+        assert grass_manager.chunk_cache.stats.misses == misses                           # 2
+
+        grass_manager._lod_time_budget = 1e-9
+        for _ in range(30):
+            grass_manager.update_render(surf, 0, focus=near_chunk.center)
+        assert grass_manager.lod_bias == 1                                                # 3
@@ -0,0 +1,85 @@
+import pygame as pg
+
+from crygeen.game_process.game_settings import gSettings
+from crygeen.game_process.grass_setup.grass_disk_cache import GrassDiskCache
+from crygeen.game_process.grass_setup.grass_manager import GrassManager
+from crygeen.game_process.grass_setup.wind import Wind
+
+
+def create_grass_manager(seed):
+    grass_manager = GrassManager(gSettings.GRASS_PATH)
+    grass_manager.enable_ground_shadows()
+    grass_manager.place_field([[4] * 8 for _ in range(4)], [0, 1, 2], seed=seed)
+    return grass_manager
+
+
+class TestGrassDiskCache:
+    def test_save_load(self, display, tmp_path):
+        """
+        1 - test that the cache is a miss before anything was saved
+        2 - test that loaded images are the same as the rendered ones
+        """
+        grass_manager = create_grass_manager(1)
+        for _ in grass_manager.prewarm(Wind()):
+            pass
+        disk_cache = GrassDiskCache(tmp_path, grass_manager)
+        assert not disk_cache.load()                                                 # 1
+        assert disk_cache.save() == len(grass_manager.grass_cache) + len(grass_manager.shadow_cache)
+
+        loaded_manager = create_grass_manager(1)
+        assert GrassDiskCache(tmp_path, loaded_manager).load()
+        for cache, loaded_cache in [(grass_manager.grass_cache, loaded_manager.grass_cache),
+                                    (grass_manager.shadow_cache, loaded_manager.shadow_cache)]:
+            assert len(loaded_cache) == len(cache)
+            for key, image in cache.items():
+                assert pg.image.tobytes(loaded_cache[key], 'RGB') == pg.image.tobytes(image, 'RGB')
+                assert loaded_cache[key].get_alpha() == image.get_alpha()          # 2
+
+    def test_invalidation(self, display, tmp_path):
+        """
+        1 - test that another seed does not load the saved cache
+        2 - test that saving replaces the files of the old inputs
+        """
+        grass_manager = create_grass_manager(1)
+        grass_manager.update_render(pg.Surface((100, 50)), 0)
+        GrassDiskCache(tmp_path, grass_manager).save()
+
+        other_manager = create_grass_manager(2)
+        disk_cache = GrassDiskCache(tmp_path, other_manager)
+        assert not disk_cache.load()                                                 # 1
+        other_manager.update_render(pg.Surface((100, 50)), 0)
+        disk_cache.save()
+        assert set(tmp_path.iterdir()) == {disk_cache.atlas_path, disk_cache.index_path}  # 2
+
+    def test_lod_strides(self, display, tmp_path):
+        """
+        1 - test that other lod blade strides change the cache key
+        2 - test that they do not load the saved cache
+        """
+        grass_manager = create_grass_manager(1)
+        grass_manager.update_render(pg.Surface((100, 50)), 0)
+        disk_cache = GrassDiskCache(tmp_path, grass_manager)
+        disk_cache.save()
+
+        other_manager = create_grass_manager(1)
+        other_manager.lod_blade_strides = [1, 3, 5]
+        other_cache = GrassDiskCache(tmp_path, other_manager)
+        assert other_cache.key != disk_cache.key                                     # 1
+        assert not other_cache.load()                                                # 2
+
+    def test_prewarm_after_load(self, display, tmp_path):
+        """
+        1 - test that prewarming after a load renders no tile images
+        2 - test that the chunks are left to their first render
+        """
+        grass_manager = create_grass_manager(1)
+        for _ in grass_manager.prewarm(Wind()):
+            pass
+        GrassDiskCache(tmp_path, grass_manager).save()
+
+        loaded_manager = create_grass_manager(1)
+        assert GrassDiskCache(tmp_path, loaded_manager).load()
+        for _ in loaded_manager.prewarm(Wind(), chunks=False):
+            pass
+        assert loaded_manager.grass_cache.stats.misses == 0                          # 1
+        assert len(loaded_manager.chunk_cache) == 0                                  # 2
@@ -0,0 +1,29 @@
+from crygeen.game_process.game_settings import gSettings
+from crygeen.game_process.grass_setup.grass_api import Grass
+from crygeen.game_process.grass_setup.grass_manager import GrassManager
+
+
+def field_blades(density_map, seed):
+    grass_manager = GrassManager(gSettings.GRASS_PATH)
+    grass_manager.place_field(density_map, [0, 1, 2], seed, origin=(2, 1))
+    return {pos: tile.blades for pos, tile in grass_manager._grass_tiles.items()}
+
+
+class TestGrassField:
+    def test_place_field(self, display):
+        """
+        1 - test that empty cells are skipped and the map is placed at the origin
+        2 - test that CSV strings and ints give the same field for the same seed
+        3 - test that another seed gives another field
+        """
+        blades = field_blades([[3, 0], [-1, 5]], 1)
+        assert sorted(blades) == [(2, 1), (3, 2)]                     # 1
+        assert field_blades([['3', '0'], ['-1', '5']], 1) == blades   # 2
+        assert field_blades([[3, 0], [-1, 5]], 2) != blades           # 3
+
+    def test_random_density_map(self):
+        """test that the procedural field only depends on its seed"""
+        density_map = Grass.random_density_map((20, 10), 12, 5)
+        assert density_map == Grass.random_density_map((20, 10), 12, 5)
+        assert len(density_map) == 10 and len(density_map[0]) == 20
+        assert all(0 <= density < 12 for row in density_map for density in row)
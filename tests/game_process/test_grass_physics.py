@@ -0,0 +1,71 @@
+import pygame as pg
+import pytest
+
+from crygeen.game_process.game_settings import gSettings
+from crygeen.game_process.grass_setup.grass_manager import GrassForce, GrassManager
+
+
+def create_grass_manager():
+    grass_manager = GrassManager(gSettings.GRASS_PATH)
+    grass_manager.place_field([[8] * 6 for _ in range(4)], [0, 1, 2, 3, 4], seed=7)
+    return grass_manager
+
+
+@pytest.fixture
+def grass_manager(display):
+    return create_grass_manager()
+
+
+class TestGrassPhysics:
+    def test_apply_force(self, grass_manager):
+        """test that the vectorized force bends every blade like GrassTile.apply_force"""
+        grass_manager.apply_force((25, 18), 15, 25)
+        for tile in grass_manager._grass_tiles.values():
+            tile.apply_force((25, 18), 15, 25)
+            for blade, expected in zip(grass_manager.physics.get_custom_blades(tile), tile._custom_blade_data):
+                assert blade[:2] == expected[:2]
+                assert blade[2] == pytest.approx(expected[2], abs=1e-3)
+
+    def test_update(self, grass_manager):
+        """
+        1 - test that blades move back by stiffness * dt
+        2 - test that tiles use the cache again once all blades are back
+        """
+        grass_manager.apply_force((25, 18), 15, 25)
+        tile = grass_manager._grass_tiles[(2, 1)]
+        bent = [blade[2] for blade in grass_manager.physics.get_custom_blades(tile)]
+
+        grass_manager.physics.update(0.1)
+        for blade, angle, base in zip(grass_manager.physics.get_custom_blades(tile), bent, tile.blades):
+            assert abs(blade[2] - base[2]) == pytest.approx(max(0, abs(angle - base[2]) - 36), abs=1e-3)  # 1
+
+        grass_manager.physics.update(1)
+        assert all(grass_manager.physics.get_custom_blades(tile) is None
+                   for tile in grass_manager._grass_tiles.values())                                     # 2
+
+    def test_active_set(self, grass_manager, monkeypatch):
+        """
+        1 - test that forces add the touched tiles to the active set
+        2 - test that off-screen tiles settle without being rendered
+        """
+        monkeypatch.setattr(gSettings, 'GRASS_PHYSICS', 'python')
+        python_manager = create_grass_manager()
+
+        for manager in (grass_manager, python_manager):
+            manager.apply_force((25, 18), 15, 25)
+            assert 0 < manager.disturbed_count <= 24                                           # 1
+            manager.update_render(pg.Surface((10, 10)), 0.2, offset=(1000, 1000))
+            assert manager.disturbed_count
+            manager.update_render(pg.Surface((10, 10)), 1, offset=(1000, 1000))
+            assert manager.disturbed_count == 0                                                # 2
+            assert all(not tile.disturbed for tile in manager._grass_tiles.values())
+
+    def test_apply_forces(self, grass_manager):
+        """test that a batch of forces bends the blades like applying the forces one by one"""
+        forces = [GrassForce((25, 18), 15, 25), GrassForce((40, 30), 5, 10), GrassForce((10, 5), 30, 5)]
+        grass_manager.apply_forces(forces)
+        for tile in grass_manager._grass_tiles.values():
+            for force in forces:
+                tile.apply_force(*force)
+            for blade, expected in zip(grass_manager.physics.get_custom_blades(tile), tile._custom_blade_data):
+                assert blade[2] == pytest.approx(expected[2], abs=1e-3)
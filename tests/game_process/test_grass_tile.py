@@ -0,0 +1,32 @@
+from crygeen.game_process.game_settings import gSettings
+from crygeen.game_process.grass_setup.grass_manager import GrassManager
+
+
+class TestGrassTile:
+    def test_shared_layout(self, display):
+        """
+        1 - test that tiles of a format share the blade tuple of an earlier tile once
+            the format has GRASS_MAX_UNIQUE variants
+        2 - test that a force only changes the custom blade data of the pushed tile
+        3 - test that springing back leaves the shared layout untouched
+        """
+        grass_manager = GrassManager(gSettings.GRASS_PATH)
+        grass_manager.random.seed(5)
+        for x in range(gSettings.GRASS_MAX_UNIQUE + 5):
+            grass_manager.place_tile((x, 0), 6, [0, 1, 2])
+        tiles = [grass_manager._grass_tiles[(x, 0)] for x in range(gSettings.GRASS_MAX_UNIQUE + 5)]
+        variants = tiles[:gSettings.GRASS_MAX_UNIQUE]
+        assert len({id(tile.blades) for tile in variants}) == gSettings.GRASS_MAX_UNIQUE
+        tile = tiles[-1]
+        shared = next(variant for variant in variants if variant.blades is tile.blades)         # 1
+
+        layout = tile.blades
+        blades = [tuple(blade) for blade in layout]
+        tile.apply_force(tile.loc, 10, 10)
+        assert tile._custom_blade_data is not None
+        assert shared._custom_blade_data is None
+        assert tile.blades is layout and shared.blades is layout and list(layout) == blades   # 2
+
+        while tile.spring_back(0.1):
+            pass
+        assert tile.blades is layout and shared.blades is layout and list(layout) == blades   # 3
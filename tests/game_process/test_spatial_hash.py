@@ -0,0 +1,68 @@
+import random
+
+import pygame as pg
+
+from crygeen.game_process.game_settings import gSettings
+from crygeen.game_process.spatial_hash import ObstacleGroup, SpatialHash
+
+
+class Obstacle(pg.sprite.Sprite):
+    def __init__(self, groups, rect, dynamic=False):
+        super().__init__(groups)
+        self.rect = pg.Rect(rect)
+        self.hitbox = self.rect
+        self.dynamic = dynamic
+
+
+class TestSpatialHash:
+    def test_query(self):
+        """test that a query finds the same sprites as checking every sprite, each of them once"""
+        rng = random.Random(4)
+        spatial_hash = SpatialHash(cell_size=32)
+        sprites = [Obstacle([], (rng.randint(-500, 500), rng.randint(-500, 500), rng.randint(0, 90), rng.randint(0, 90)))
+                   for _ in range(300)]
+        for sprite in sprites:
+            spatial_hash.insert(sprite)
+
+        for _ in range(100):
+            rect = pg.Rect(rng.randint(-500, 500), rng.randint(-500, 500), rng.randint(1, 120), rng.randint(1, 120))
+            found = spatial_hash.query(rect)
+            assert len(found) == len(set(found))
+            assert set(found) == {sprite for sprite in sprites if sprite.hitbox.colliderect(rect)}
+
+    def test_remove_move(self):
+        """
+        1 - test that a removed sprite is not found anymore and its cells are freed
+        2 - test that a moved sprite is found at its new position only
+        """
+        spatial_hash = SpatialHash(cell_size=32)
+        sprite = Obstacle([], (10, 10, 40, 40))
+        spatial_hash.insert(sprite)
+        spatial_hash.remove(sprite)
+        assert sprite not in spatial_hash and not spatial_hash._cells                      # 1
+
+        spatial_hash.insert(sprite)
+        sprite.hitbox.topleft = (300, 300)
+        spatial_hash.move(sprite)
+        assert spatial_hash.query(pg.Rect(0, 0, 64, 64)) == []                             # 2
+        assert spatial_hash.query(pg.Rect(310, 310, 5, 5)) == [sprite]
+
+    def test_obstacle_group(self):
+        """
+        1 - test that sprites are filed into the static or dynamic hash with the group
+        2 - test that killed sprites leave the hashes
+        """
+        obstacles = ObstacleGroup(cell_size=32)
+        wall = Obstacle([obstacles], (0, 0, 64, 64))
+        crate = Obstacle([obstacles], (100, 0, 20, 20), dynamic=True)
+        assert obstacles.query(pg.Rect(50, 0, 60, 10)) == [wall, crate]                    # 1
+        assert wall in obstacles.static and crate in obstacles.dynamic
+
+        crate.kill()
+        assert crate not in obstacles.dynamic and obstacles.query(pg.Rect(100, 0, 5, 5)) == []  # 2
+
+    def test_default_cell_size(self, monkeypatch):
+        """test that the default cell size is read from the settings when the hash is made"""
+        monkeypatch.setattr(gSettings, 'COLLISION_CELL_SIZE', 48)
+        assert SpatialHash().cell_size == 48
+        assert ObstacleGroup().static.cell_size == 48
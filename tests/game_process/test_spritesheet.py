@@ -0,0 +1,35 @@
+import pygame as pg
+
+from crygeen.game_process.game_settings import gSettings
+from crygeen.game_process.spritesheet import SpriteSheet
+
+
+class TestSpriteSheet:
+    def test_frames(self, display):
+        """
+        1 - test that every animation of the metadata is sliced with all of its frames
+        2 - test that frames match the sprites parsed from the sheet
+        3 - test that frames of reversed animations are flipped
+        4 - test that the mirrored frames are the frames flipped horizontally
+        """
+        sprite_sheet = SpriteSheet(gSettings.PLAYER_SPRITE_SHEET_PATH, gSettings.PLAYER_SPRITE_METADATA_PATH)
+        frames_data = sprite_sheet.data['frames']
+        for name, animation_id in sprite_sheet.animations.items():
+            assert sprite_sheet.animation_lens[animation_id] == frames_data[f'{name}0.png']['animation_len']  # 1
+            assert len(sprite_sheet.frames[animation_id]) == sprite_sheet.animation_lens[animation_id]
+
+            for frame in range(sprite_sheet.animation_lens[animation_id]):
+                expected = sprite_sheet.parse_sprite(f'{name}{frame}.png')
+                if frames_data[f'{name}0.png'].get('reverse', False):
+                    expected = pg.transform.flip(expected, True, False)                                 # 3
+                assert pg.image.tobytes(sprite_sheet.get_frame(animation_id, frame), 'RGB') == \
+                       pg.image.tobytes(expected, 'RGB')                                               # 2
+                assert pg.image.tobytes(sprite_sheet.get_frame(animation_id, frame, mirrored=True), 'RGB') == \
+                       pg.image.tobytes(pg.transform.flip(expected, True, False), 'RGB')              # 4
+
+    def test_reverse(self, display):
+        """test that a reversed animation differs from the frames of the sheet"""
+        sprite_sheet = SpriteSheet(gSettings.PLAYER_SPRITE_SHEET_PATH, gSettings.PLAYER_SPRITE_METADATA_PATH)
+        name = next(n.removesuffix('0.png') for n, d in sprite_sheet.data['frames'].items() if d.get('reverse'))
+        frame = sprite_sheet.get_frame(sprite_sheet.animations[name], 0)
+        assert pg.image.tobytes(frame, 'RGB') != pg.image.tobytes(sprite_sheet.parse_sprite(f'{name}0.png'), 'RGB')
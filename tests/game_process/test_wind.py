@@ -0,0 +1,33 @@
+import math
+
+import numpy as np
+
+from crygeen.game_process.grass_setup.wind import Wind
+
+
+class TestWind:
+    def test_sample(self):
+        """test that the base wave matches the old per-tile rotation function"""
+        wind = Wind()
+        wind.gust_strength = wind.noise_strength = 0
+        for _ in range(5):
+            wind.update(0.37)
+            columns = np.arange(0, 2000, 10)
+            expected = [int(math.sin(wind.t / 60 + x / 100) * 15) for x in columns]
+            assert wind.sample(columns).tolist() == expected
+
+    def test_layers(self):
+        """
+        1 - test that gusts and noise change the rotation
+        2 - test that the noise only depends on the seed
+        """
+        columns = np.arange(0, 2000, 10)
+        calm = Wind(seed=1)
+        calm.gust_strength = calm.noise_strength = 0
+        windy = Wind(seed=1)
+        windy.gust_strength = windy.noise_strength = 10
+        assert windy.sample(columns).tolist() != calm.sample(columns).tolist()  # 1
+
+        same = Wind(seed=1)
+        same.gust_strength = same.noise_strength = 10
+        assert same.sample(columns).tolist() == windy.sample(columns).tolist()  # 2
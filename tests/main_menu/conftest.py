@@ -0,0 +1,12 @@
+import pygame as pg
+import pytest
+
+
+@pytest.fixture
+def create_frames_folder(tmp_path):
+    """ten solid color frames, the red channel holds the frame index"""
+    for index in range(10):
+        frame = pg.Surface((32, 16))
+        frame.fill((index * 10, 0, 0))
+        pg.image.save(frame, str(tmp_path.joinpath(f'{index:04}.bmp')))
+    return tmp_path
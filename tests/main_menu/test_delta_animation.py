@@ -0,0 +1,45 @@
+import pygame as pg
+import pytest
+
+from crygeen.main_menu.delta_animation import DeltaAnimation
+
+
+@pytest.fixture
+def create_moving_square():
+    """a 4x4 white square moving right over a black 64x32 frame"""
+    frames = []
+    for index in range(6):
+        frame = pg.Surface((64, 32))
+        frame.fill((255, 255, 255), (index * 4, 2, 4, 4))
+        frames.append(frame)
+    return frames
+
+
+class TestDeltaAnimation:
+    def test_encode(self, display, create_moving_square):
+        """
+        1 - test that every <keyframe_interval> frame is a keyframe
+        2 - test that other frames only patch the blocks around the square
+        """
+        animation = DeltaAnimation(create_moving_square, (64, 32), 3, 8, 16)
+        assert [bool(frame.keyframe) for frame in animation.delta_frames] == [1, 0, 0, 1, 0, 0]  # 1
+        for frame in animation.delta_frames[1:3]:
+            assert sum(rect.width * rect.height for rect, _ in frame.patches) <= 2 * 8 * 8           # 2
+
+    def test_playback(self, display, create_moving_square):
+        """
+        1 - test that the canvas matches the source frame
+        2 - test that stepping forward reports only the patched areas
+        3 - test that a jump reports the whole canvas
+        """
+        animation = DeltaAnimation(create_moving_square, (64, 32), 3, 8, 16)
+        for index in [0, 1, 2, 3, 4, 5, 0, 4]:
+            canvas = animation.get_frame(index)
+            for x in range(0, 64, 2):
+                assert canvas.get_at((x, 3)) == create_moving_square[index].get_at((x, 3))  # 1
+
+        animation.get_frame(0)
+        animation.get_frame(1)
+        assert animation.dirty_rects and all(rect.width < 64 for rect in animation.dirty_rects)  # 2
+        animation.get_frame(4)
+        assert animation.dirty_rects == [pg.Rect(0, 0, 64, 32)]  # 3
@@ -0,0 +1,50 @@
+import pygame as pg
+
+from crygeen.main_menu.frame_stream import FrameStream
+from crygeen.utils.support import import_folder_paths
+
+
+class TestFrameStream:
+    def test_frames_in_order(self, display, create_frames_folder):
+        """test that frames come out in order, scaled, and wrap around past the last one"""
+        stream = FrameStream(import_folder_paths(create_frames_folder), (64, 32), 4)
+        for frame_idx in list(range(10)) + [0, 1]:
+            frame = stream.get_frame(frame_idx)
+            while frame.get_at((0, 0)).r != frame_idx * 10:  # worker has not caught up yet
+                frame = stream.get_frame(frame_idx)
+            assert frame.get_size() == (64, 32)
+        stream.close()
+
+    def test_buffer_size_is_bounded(self, display, create_frames_folder):
+        """test that the ring never holds more frames than the folder has"""
+        stream = FrameStream(import_folder_paths(create_frames_folder), (64, 32), 100)
+        assert stream.buffer_size == 10
+        stream.close()
+
+    def test_broken_frame(self, display, create_frames_folder):
+        """
+        1 - test that files which are not images are not streamed
+        2 - test that a frame which fails to decode repeats the frame before it
+        """
+        create_frames_folder.joinpath('.DS_Store').write_bytes(b'\x00\x00\x00\x01Bud1')
+        create_frames_folder.joinpath('0003.bmp').write_bytes(b'not an image')
+        frame_paths = import_folder_paths(create_frames_folder)
+        assert len(frame_paths) == 10                                                  # 1
+
+        stream = FrameStream(frame_paths, (64, 32), 10)
+        frames = []
+        for frame_idx in range(5):
+            frame = stream.get_frame(frame_idx)
+            while frame_idx and frame is frames[-1] and frame_idx != 3:  # worker has not caught up yet
+                frame = stream.get_frame(frame_idx)
+            frames.append(frame)
+        assert [frame.get_at((0, 0)).r for frame in frames] == [0, 10, 20, 20, 40]    # 2
+        stream.close()
+
+    def test_first_frame_timeout(self, display, tmp_path):
+        """test that get_frame gives up waiting on a frame that never arrives"""
+        pg.image.save(pg.Surface((8, 8)), str(tmp_path.joinpath('0000.bmp')))
+        stream = FrameStream(import_folder_paths(tmp_path), (8, 8), 1)
+        stream.close()  # the worker stops before decoding anything
+        stream.FIRST_FRAME_TIMEOUT = 0.1
+        assert stream.get_frame(0).get_size() == (8, 8)
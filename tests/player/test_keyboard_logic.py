@@ -1,5 +1,6 @@
 from crygeen import PlayerKeyboardInput
-from crygeen.game_process.player_setup.player_keyboard_input import KeyboardLogic, Direction
+from crygeen.game_process.player_setup.player_keyboard_input import KeyboardLogic
+from crygeen.game_process.player_setup.player_state import Action, Facing, PlayerState
 
 
 class PlayerMock:
@@ -21,7 +22,7 @@ class TestKeyboardLogic:
         self.kbl.idle()
         assert self.kbl.kbi.idle                    # 1
         assert self.kbl.kbi.direction.xy == (0, 0)  # 2
-        assert self.kbl.kbi.status == 'down_idle'   # 3
+        assert self.kbl.kbi.state == PlayerState.STATES[Facing.DOWN][Action.IDLE]  # 3
 
     def test_action(self):
         """
@@ -38,21 +39,24 @@ class TestKeyboardLogic:
         9 - test that the character can move
         :return:
         """
-        self.kbl.kbi.status = 'down_idle'
+        self.kbl.kbi.facing = Facing.DOWN
+        self.kbl.kbi.state = PlayerState.STATES[Facing.DOWN][Action.IDLE]
         self.kbl.action()
 
         # when attack is available ____________________________________________
-        assert self.kbl.kbi.status == 'down_attack'                    # 1
+        assert self.kbl.kbi.state == PlayerState.STATES[Facing.DOWN][Action.ATTACK]  # 1
         assert self.kbl.kbi.attack_start_time == 0                     # 2
         assert not self.kbl.kbi.attack_available                       # 3
         assert self.kbl.kbi.direction.xy == (0, 0)                     # 4
-        self.kbl.kbi.status = 'up_attack'
-        assert self.kbl.kbi.status == 'up_attack'                      # 5
+        self.kbl.kbi.state = PlayerState.STATES[Facing.UP][Action.ATTACK]
+        self.kbl.action()
+        assert self.kbl.kbi.state == PlayerState.STATES[Facing.UP][Action.ATTACK]    # 5
 
         self.kbl.kbi.attack_available = False
         # when attack is unavailable __________________________________________
-        self.kbl.kbi.status = 'down_idle'
-        assert self.kbl.kbi.status == 'down_idle'                      # 6
+        self.kbl.kbi.state = PlayerState.STATES[Facing.DOWN][Action.IDLE]
+        self.kbl.action()
+        assert self.kbl.kbi.state == PlayerState.STATES[Facing.DOWN][Action.IDLE]    # 6
         self.kbl.kbi.attack_start_time = 100
         assert self.kbl.kbi.attack_start_time == 100                   # 7
         assert not self.kbl.kbi.attack_available                       # 8
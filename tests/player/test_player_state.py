@@ -0,0 +1,44 @@
+import json
+
+import pytest
+from pygame import Vector2
+
+from crygeen.game_process.game_settings import gSettings
+from crygeen.game_process.player_setup.player_state import Action, Facing, MoveKey, PlayerState
+
+
+class TestPlayerState:
+    def test_tables(self):
+        """
+        1 - test that every state maps back to its facing and action
+        2 - test that the status names match the states
+        3 - test that every status is an animation of the sprite sheet
+        """
+        with open(gSettings.PLAYER_SPRITE_METADATA_PATH) as file:
+            frames = json.load(file)['frames']
+        for facing in Facing:
+            for action in Action:
+                state = PlayerState.STATES[facing][action]
+                assert (PlayerState.FACINGS[state], PlayerState.ACTIONS[state]) == (facing, action)  # 1
+                assert PlayerState.IDS[PlayerState.NAMES[state]] == state                           # 2
+                assert f'{PlayerState.NAMES[state]}0.png' in frames                                 # 3
+
+    @pytest.mark.parametrize('input_direction', [(1, 0), (0, 1), (-1, 0), (0, -1),
+                                                 (0.7071, 0.7071), (0.7071, -0.7071), (-0.7071, 0.7071),
+                                                 (-0.7071, -0.7071)])
+    def test_get_facing(self, create_dir_status, input_direction):
+        """test that get_facing gives the facing of the idle status of the direction"""
+        facing = PlayerState.get_facing(Vector2(input_direction))
+        assert PlayerState.NAMES[PlayerState.STATES[facing][Action.IDLE]] == \
+               create_dir_status[(round(input_direction[0], 1), round(input_direction[1], 1))]
+        assert PlayerState.get_facing(Vector2(input_direction) * 3) == facing
+
+    def test_key_vectors(self):
+        """
+        1 - test that no keys stand still
+        2 - test that up wins over down and left over right
+        """
+        assert PlayerState.KEY_VECTORS[0] == (0, 0)                                                  # 1
+        assert PlayerState.get_facing(Vector2(PlayerState.KEY_VECTORS[0])) is None
+        assert PlayerState.KEY_VECTORS[MoveKey.UP | MoveKey.DOWN | MoveKey.RIGHT] == (1, -1)        # 2
+        assert PlayerState.KEY_VECTORS[MoveKey.LEFT | MoveKey.RIGHT | MoveKey.DOWN] == (-1, 1)
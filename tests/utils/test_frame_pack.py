@@ -0,0 +1,65 @@
+import pygame as pg
+import pytest
+
+from crygeen.utils.exceptions import FramePackError
+from crygeen.utils.frame_pack import PACK_HEADER, PACK_INDEX, FramePack, build_frame_pack
+
+
+@pytest.fixture
+def create_frames_folder(tmp_path):
+    folder = tmp_path.joinpath('frames')
+    folder.mkdir()
+    for index in range(3):
+        frame = pg.Surface((8, 4))
+        frame.fill((index * 50, 100, 200))
+        pg.image.save(frame, str(folder.joinpath(f'{index:04}.bmp')))
+    return folder
+
+
+class TestFramePack:
+    @pytest.mark.parametrize('pixel_format', ['RGB', 'RGBX', 'BGRA'])
+    def test_round_trip(self, tmp_path, create_frames_folder, pixel_format):
+        """test that packed frames come back with the same size, order and colors"""
+        pack_path = tmp_path.joinpath('frames.pack')
+        assert build_frame_pack(create_frames_folder, pack_path, (16, 8), pixel_format) == 3
+
+        pack = FramePack(pack_path)
+        assert pack.size == (16, 8)
+        assert pack.pixel_format == pixel_format
+        assert pack.count_frames == 3
+        for index, frame in enumerate(pack.frames):
+            assert frame.get_size() == (16, 8)
+            assert tuple(frame.get_at((3, 3)))[:3] == (index * 50, 100, 200)
+
+    def test_default_format(self, tmp_path, create_frames_folder):
+        """test that packs default to the 32-bit display byte order and are blitted without blending"""
+        pack_path = tmp_path.joinpath('frames.pack')
+        build_frame_pack(create_frames_folder, pack_path, (16, 8))
+        pack = FramePack(pack_path)
+        assert pack.pixel_format == 'BGRA'
+        assert pack.frames[0].get_masks()[:3] == (0xff0000, 0xff00, 0xff)
+        assert not pack.frames[0].get_flags() & pg.SRCALPHA
+
+    def test_invalid_pack(self, tmp_path):
+        """test that a file without the pack header is rejected"""
+        pack_path = tmp_path.joinpath('broken.pack')
+        pack_path.write_bytes(b'not a frame pack at all')
+        with pytest.raises(FramePackError):
+            FramePack(pack_path)
+
+    def test_empty_pack(self, tmp_path):
+        """test that an empty file is rejected"""
+        pack_path = tmp_path.joinpath('empty.pack')
+        pack_path.write_bytes(b'')
+        with pytest.raises(FramePackError):
+            FramePack(pack_path)
+
+    @pytest.mark.parametrize('cut', ['index', 'frame'])
+    def test_truncated_pack(self, tmp_path, create_frames_folder, cut):
+        """test that a pack cut off inside the frame index or inside a frame is rejected"""
+        pack_path = tmp_path.joinpath('frames.pack')
+        build_frame_pack(create_frames_folder, pack_path, (16, 8))
+        data = pack_path.read_bytes()
+        pack_path.write_bytes(data[:PACK_HEADER.size + PACK_INDEX.size] if cut == 'index' else data[:-10])
+        with pytest.raises(FramePackError):
+            FramePack(pack_path)
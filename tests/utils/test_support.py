@@ -0,0 +1,54 @@
+import pygame as pg
+import pytest
+
+from crygeen.utils.support import decode_img, import_folder_img, import_folder_img_parallel, import_img
+
+
+@pytest.fixture
+def create_images_folder(tmp_path):
+    for index in range(5):
+        image = pg.Surface((20, 10))
+        image.fill((index * 40, 255 - index * 40, 7))
+        pg.image.save(image, str(tmp_path.joinpath(f'{index:02}.png' if index % 2 else f'{index:02}.jpg')))
+    return tmp_path
+
+
+class TestImportFolderImgParallel:
+    @pytest.mark.parametrize('processes', [False, True])
+    def test_same_as_sequential(self, display, create_images_folder, processes):
+        """test that the pool returns the same images in the same order as the sequential loader"""
+        sequential = import_folder_img(create_images_folder)
+        parallel = import_folder_img_parallel(create_images_folder, workers=2, processes=processes)
+
+        assert len(parallel) == len(sequential) == 5
+        for expected, image in zip(sequential, parallel):
+            assert image.get_size() == expected.get_size()
+            assert image.get_at((5, 5)) == expected.get_at((5, 5))
+
+    def test_scale(self, display, create_images_folder):
+        """test that every image is scaled to the requested size"""
+        images = import_folder_img_parallel(create_images_folder, (40, 30), workers=2)
+        assert {image.get_size() for image in images} == {(40, 30)}
+
+
+class TestImportFolderImgSize:
+    @pytest.mark.parametrize('size', [(40, 20), (15, 5), (100, 60)])
+    def test_size(self, display, tmp_path, size):
+        """test that images come back at the target size whether the JPEG can be reduced or not"""
+        image = pg.Surface((80, 40))
+        image.fill((200, 30, 30))
+        pg.image.save(image, str(tmp_path.joinpath('00.jpg')))
+
+        surface, = import_folder_img(tmp_path, size=size)
+        assert surface.get_size() == size
+        assert all(abs(a - b) < 10 for a, b in zip(surface.get_at((size[0] // 2, size[1] // 2)), (200, 30, 30)))
+
+    @pytest.mark.parametrize('name', ['00.png', '00.PNG'])
+    def test_png_alpha(self, display, tmp_path, name):
+        """test that PNGs keep their alpha whatever the case of the suffix"""
+        image = pg.Surface((20, 10), pg.SRCALPHA)
+        image.fill((200, 30, 30, 100))
+        pg.image.save(image, str(tmp_path.joinpath(name)))
+
+        assert decode_img(tmp_path.joinpath(name), (10, 5))[2] == 'RGBA'
+        assert import_img(tmp_path.joinpath(name)).get_at((5, 5)).a == 100
@@ -0,0 +1,94 @@
+import pygame as pg
+import pytest
+
+from crygeen.utils.surface_cache import LRUSurfaceCache, SurfaceCache
+
+
+@pytest.fixture
+def ticks(monkeypatch):
+    clock = {'now': 0}
+    monkeypatch.setattr(pg.time, 'get_ticks', lambda: clock['now'])
+    return clock
+
+
+class TestSurfaceCache:
+    def test_get(self, ticks):
+        """test that a surface is built once per size"""
+        cache = SurfaceCache((40, 20), 100)
+        surface = cache.get('fade', pg.Surface)
+        assert surface.get_size() == (40, 20)
+        assert cache.get('fade', pg.Surface) is surface
+
+    def test_debounce(self, ticks):
+        """
+        1 - test that a resize is not committed before the debounce time
+        2 - test that every new request restarts the debounce time
+        3 - test that the last requested size is committed afterwards
+        """
+        cache = SurfaceCache((40, 20), 100)
+        cache.request_resize((50, 30))
+        ticks['now'] = 60
+        assert not cache.update() and cache.size == (40, 20)  # 1
+        cache.request_resize((60, 40))
+        ticks['now'] = 120
+        assert not cache.update()                             # 2
+        ticks['now'] = 160
+        assert cache.update() and cache.size == (60, 40)      # 3
+
+    def test_eviction(self, ticks):
+        """
+        1 - test that entries of the old size are evicted on commit
+        2 - test that the rebuilt surface keeps the alpha of the old one
+        """
+        cache = SurfaceCache((40, 20), 0)
+        cache.get('fade', pg.Surface).set_alpha(77)
+        cache.request_resize((80, 40))
+        cache.update()
+        assert len(cache) == 0                                # 1
+        surface = cache.get('fade', pg.Surface)
+        assert surface.get_size() == (80, 40)
+        assert surface.get_alpha() == 77                      # 2
+
+    def test_evicted_alpha(self, ticks):
+        """
+        1 - test that only surfaces with alpha remember it
+        2 - test that the alpha of a key not requested since the last commit is forgotten
+        """
+        cache = SurfaceCache((40, 20), 0)
+        cache.get('fade', pg.Surface).set_alpha(77)
+        for index in range(10):
+            cache.get(('frame', index), pg.Surface)
+        cache.request_resize((80, 40))
+        cache.update()
+        assert len(cache._SurfaceCache__evicted_alpha) == 1   # 1
+
+        cache.request_resize((40, 20))
+        cache.update()
+        assert cache.get('fade', pg.Surface).get_alpha() is None  # 2
+
+
+class TestLRUSurfaceCache:
+    def test_stats(self):
+        """test that only get counts as a lookup"""
+        cache = LRUSurfaceCache(1024)
+        assert cache.get('a') is None
+        cache['a'] = pg.Surface((4, 4), depth=32)
+        assert cache.get('a') is cache['a'] and 'a' in cache
+        assert cache.stats == (1, 1, 0, 64, 1)
+        assert cache.stats.hit_rate == 0.5
+
+    def test_eviction(self):
+        """
+        1 - test that the least recently used surfaces are evicted once over budget
+        2 - test that the newest surface stays even if it alone is over budget
+        """
+        cache = LRUSurfaceCache(64 * 3)
+        for key in 'abc':
+            cache[key] = pg.Surface((4, 4), depth=32)
+        cache.get('a')
+        cache['d'] = pg.Surface((4, 4), depth=32)
+        assert 'b' not in cache and all(key in cache for key in 'acd')
+        assert cache.stats.evictions == 1 and cache.stats.resident_bytes == 64 * 3  # 1
+
+        cache['e'] = pg.Surface((16, 16), depth=32)
+        assert len(cache) == 1 and 'e' in cache                                     # 2
@@ -0,0 +1,47 @@
+import pygame as pg
+import pytest
+
+from crygeen.utils.texture_atlas import TextureAtlas, pack_rects
+
+
+class TestTextureAtlas:
+    @staticmethod
+    def create_images():
+        images = {}
+        for index, size in enumerate([(5, 9), (12, 3), (7, 7), (30, 2), (1, 1), (9, 14)]):
+            image = pg.Surface(size)
+            image.fill((index * 40 + 10, 200 - index * 30, 50))
+            image.set_at((0, 0), (0, 0, 0))
+            image.set_colorkey((0, 0, 0))
+            images[f'image{index}'] = image
+        return images
+
+    def test_pack_rects(self):
+        """
+        1 - test that packed rects do not overlap and stay on their page
+        2 - test that rects continue on a new page when a page is full
+        3 - test that a rect larger than a page is rejected
+        """
+        sizes = [(10, 10), (20, 5), (15, 15), (10, 10), (32, 8)]
+        positions = pack_rects(sizes, (32, 32), padding=1)
+        rects = [(page, pg.Rect(x, y, w + 1, h + 1)) for (page, x, y), (w, h) in zip(positions, sizes)]
+        for index, (page, rect) in enumerate(rects):
+            assert pg.Rect(0, 0, 33, 33).contains(rect)                                           # 1
+            assert not any(page == other_page and rect.colliderect(other_rect)
+                           for other_page, other_rect in rects[index + 1:])
+        assert max(page for page, _, _ in positions) == 1                                     # 2
+        with pytest.raises(ValueError):
+            pack_rects([(40, 1)], (32, 32))                                                   # 3
+
+    def test_pack(self, display):
+        """
+        1 - test that every image is copied into its area on a page
+        2 - test that the colorkey is kept
+        """
+        images = self.create_images()
+        atlas = TextureAtlas.pack(images, colorkey=(0, 0, 0), page_size=(30, 16))
+        assert len(atlas) == len(images) and len(atlas.pages) > 1
+        for name, image in images.items():
+            page, area = atlas.area(name)
+            assert pg.image.tobytes(page.subsurface(area), 'RGB') == pg.image.tobytes(image, 'RGB')  # 1
+            assert atlas.subsurface(name).get_colorkey() == (0, 0, 0, 255)                          # 2